@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential vs parallel artifact generation.
+
+Generates the 11 R3 artifacts (render, write, ZIP) for many synthetic intakes,
+once with one worker (artifacts one after another) and once with the worker
+pool, and reports wall time for each. Then renders the same templates without
+and with the render cache (no files written).
+
+Usage:
+    python bench_generation.py [--intakes N] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.generator import generate_project_artifacts, render_artifact
+from artifacts.render_cache import get_render_cache
+from models.intake import IntakeAnswers, IntakeRequest, IntakeResponse, RiskClassification
+from validation.classifier import get_required_artifacts
+
+
+ANSWERS = IntakeAnswers(
+    q1_users="External",
+    q2_influence="Automated",
+    q3_worst_failure="Safety_Legal_Compliance",
+    q4_reversibility="Hard",
+    q5_domain="No",
+    q6_scale="Organization_Public",
+    q7_regulated="Yes"
+)
+
+
+def build_intake(number: int):
+    """Synthetic R3 intake (request and classified response)."""
+    project_name = f"Benchmark Project {number}"
+    timestamp = datetime.utcnow()
+    request = IntakeRequest(project_name=project_name, timestamp=timestamp, answers=ANSWERS)
+    response = IntakeResponse(
+        intake_id=f"bench-{number:05d}",
+        project_name=project_name,
+        timestamp=timestamp,
+        answers=ANSWERS,
+        classification=RiskClassification(
+            risk_level="R3",
+            rigor="Maximum",
+            rationale="Benchmark intake",
+            borderline=False
+        ),
+        warnings=[],
+        expert_review_required=True,
+        expert_review_recommended=True,
+        next_steps=[],
+        artifacts_required=get_required_artifacts("R3")
+    )
+    return request, response
+
+
+def run(intakes, root: Path, workers: int) -> float:
+    """Generate every intake's artifacts into its own directory; returns wall time in seconds."""
+    get_render_cache().clear()
+    start = time.perf_counter()
+    for request, response in intakes:
+        generate_project_artifacts(request, response, output_dir=root / response.intake_id, workers=workers)
+    return time.perf_counter() - start
+
+
+def render(intakes, cached: bool) -> float:
+    """Render every intake's artifacts in memory; returns wall time in seconds."""
+    get_render_cache().clear()
+    start = time.perf_counter()
+    for request, response in intakes:
+        for artifact_name in response.artifacts_required:
+            render_artifact(artifact_name, request, response, cached=cached)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark artifact generation")
+    parser.add_argument("--intakes", type=int, default=1000, help="Intakes to generate artifacts for")
+    parser.add_argument("--workers", type=int, default=4, help="Worker pool size for the parallel run")
+    args = parser.parse_args()
+
+    intakes = [build_intake(number) for number in range(args.intakes)]
+
+    print("="*70)
+    print("ARTIFACT GENERATION BENCHMARK")
+    print(f"{args.intakes} R3 intakes x 11 artifacts, parallel run with {args.workers} workers, {os.cpu_count()} CPU(s)")
+    print("="*70)
+    print(f"{'Mode':>12} {'Wall time':>12} {'Per intake':>12} {'Speedup':>10}")
+
+    results = {}
+    for label, workers in (("sequential", 1), ("parallel", args.workers)):
+        with tempfile.TemporaryDirectory() as tmp:
+            results[label] = run(intakes, Path(tmp), workers)
+        speedup = results["sequential"] / results[label]
+        print(f"{label:>12} {results[label]:>11.2f}s {results[label] / args.intakes * 1000:>10.2f}ms "
+              f"{speedup:>9.2f}x")
+
+    print()
+    print(f"{'Rendering':>12} {'Wall time':>12} {'Per intake':>12} {'Speedup':>10}")
+    renders = {}
+    for label, cached in (("templates", False), ("cached", True)):
+        renders[label] = render(intakes, cached)
+        speedup = renders["templates"] / renders[label]
+        print(f"{label:>12} {renders[label]:>11.2f}s {renders[label] / args.intakes * 1000:>10.2f}ms "
+              f"{speedup:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one POST /api/intake per intake vs POST /api/intakes/batch.
+
+Submits the same synthetic intakes (answer combinations spread over all
+3,888) once through the single-intake endpoint and once in batches, against
+a temporary data root, and reports intakes per second for each. Requests go
+through FastAPI's in-process test client, so network overhead (which the
+batch endpoint also saves) is not included.
+
+Usage:
+    python bench_intake_batch.py [--intakes N] [--batch-size N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+# Benchmark against a throwaway data root (set before the app loads its config)
+os.environ["QMS_DATA_ROOT"] = tempfile.mkdtemp(prefix="qms-bench-")
+
+from fastapi.testclient import TestClient
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main as api
+from models.intake import all_answer_codes, decode_answers
+
+
+def build_intakes(count: int) -> list:
+    """Intake request bodies with answer combinations spread over every code."""
+    codes = list(all_answer_codes())
+    return [
+        {
+            "project_name": f"Benchmark Project {number}",
+            "answers": decode_answers(codes[number * 7 % len(codes)]).model_dump()
+        }
+        for number in range(count)
+    ]
+
+
+def run_single(client: TestClient, intakes: list) -> float:
+    """POST every intake on its own; returns wall time in seconds."""
+    start = time.perf_counter()
+    for body in intakes:
+        assert client.post("/api/intake", json=body).status_code == 201
+    return time.perf_counter() - start
+
+
+def run_batch(client: TestClient, intakes: list, batch_size: int) -> float:
+    """POST the intakes in batches; returns wall time in seconds."""
+    start = time.perf_counter()
+    for offset in range(0, len(intakes), batch_size):
+        batch = intakes[offset:offset + batch_size]
+        assert client.post("/api/intakes/batch", json=batch).json()["created"] == len(batch)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch intake submission")
+    parser.add_argument("--intakes", type=int, default=1000, help="Intakes to submit per mode")
+    parser.add_argument("--batch-size", type=int, default=api.MAX_INTAKE_BATCH, help="Intakes per batch request")
+    args = parser.parse_args()
+
+    client = TestClient(api.app)
+    intakes = build_intakes(args.intakes)
+
+    print("="*70)
+    print("INTAKE SUBMISSION BENCHMARK")
+    print(f"{args.intakes} intakes, batches of {args.batch_size}, {os.cpu_count()} CPU(s), in-process client")
+    print("="*70)
+    print(f"{'Mode':>12} {'Wall time':>12} {'Intakes/s':>12} {'Speedup':>10}")
+
+    results = {}
+    for label in ("single", "batch"):
+        # Per-intake "saved" lines would dominate the single run's timing on a terminal
+        with contextlib.redirect_stdout(io.StringIO()):
+            if label == "single":
+                results[label] = run_single(client, intakes)
+            else:
+                results[label] = run_batch(client, intakes, args.batch_size)
+        speedup = results["single"] / results[label]
+        print(f"{label:>12} {results[label]:>11.2f}s {args.intakes / results[label]:>12.0f} {speedup:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: placeholder detection on adversarial inputs.
+
+Compares the placeholder regex the validator used to run against the
+linear-time PlaceholderScanner on pathological artifacts (long lines full of
+unmatched brackets, near-miss literals) at growing sizes. The regex grows
+quadratically on unmatched brackets; the scanner should stay roughly linear
+(about 4x time for 4x size) on every input.
+
+Usage:
+    python bench_placeholders.py [--repeat N] [--max-size CHARS]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.placeholder_scanner import REFERENCE_PLACEHOLDER_PATTERN
+from artifacts.validator import ArtifactValidator
+
+
+# Regex runs are skipped above this size (quadratic inputs take minutes)
+REGEX_SIZE_LIMIT = 20_000
+
+INPUTS = {
+    "unmatched [": lambda n: "[" * n,
+    "unmatched {": lambda n: "{" * n,
+    "mixed [ { no close": lambda n: ("[a{b " * (n // 5 + 1))[:n],
+    "close on next line": lambda n: "[" * (n - 2) + "\n]",
+    "near-miss literals": lambda n: ("TB TO to be determine FIXM XX <placeholde " * (n // 43 + 1))[:n],
+    "normal prose": lambda n: ("Owner [Name] to confirm TBD items by Friday.\n" * (n // 45 + 1))[:n],
+}
+
+
+def best_of(repeat: int, func) -> float:
+    """Best wall-clock time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark placeholder detection on adversarial inputs")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--max-size", type=int, default=1_280_000, help="Largest input size in characters")
+    args = parser.parse_args()
+
+    validator = ArtifactValidator()
+    scanner = validator.placeholder_scanner
+    regex = re.compile(REFERENCE_PLACEHOLDER_PATTERN, re.IGNORECASE)
+
+    sizes = []
+    size = 5_000
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 4
+
+    print("="*70)
+    print("PLACEHOLDER DETECTION BENCHMARK (ADVERSARIAL INPUTS)")
+    print(f"Best of {args.repeat}; regex skipped above {REGEX_SIZE_LIMIT:,} chars")
+    print("="*70)
+    print(f"{'Input':<20} {'Chars':>10} {'Scanner':>10} {'Regex':>10} {'Matches':>8}")
+
+    for label, build in INPUTS.items():
+        for size in sizes:
+            content = build(size)
+
+            scanner_time = best_of(args.repeat, lambda: scanner.spans(content))
+            matches = len(scanner.spans(content))
+
+            if size <= REGEX_SIZE_LIMIT:
+                regex_time = best_of(1, lambda: regex.findall(content))
+                assert len(regex.findall(content)) == matches, f"Mismatch on {label}"
+                regex_column = f"{regex_time * 1000:>8.1f}ms"
+            else:
+                regex_column = f"{'-':>10}"
+
+            print(f"{label:<20} {len(content):>10,} {scanner_time * 1000:>8.1f}ms {regex_column} {matches:>8}")
+
+
+if __name__ == "__main__":
+    main()
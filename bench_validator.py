@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: artifact validation cost vs document size.
+
+Validates synthetic artifacts of roughly 1 KB, 100 KB and 5 MB against every
+artifact's R3 acceptance criteria and reports parse and validation time.
+Cost should grow linearly with size (about 100x from 1 KB to 100 KB, about
+50x from 100 KB to 5 MB).
+
+Usage:
+    python bench_validator.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.markdown_tree import parse_markdown
+from artifacts.validator import ArtifactValidator
+
+
+SIZES = {
+    "1 KB": 1_000,
+    "100 KB": 100_000,
+    "5 MB": 5_000_000,
+}
+
+BLOCK = """## Risk R-{n:03d}
+**Description:** Service degradation under load for component {n}
+**Likelihood:** Medium
+**Impact:** High
+**Mitigation:** Load testing and autoscaling [owner]
+
+- Detection: latency alert exceeds target
+- Owner: Platform team
+1. Verify mitigation in staging
+
+| ID | Metric | Target |
+|----|--------|--------|
+| M-{n} | p95 latency | 200ms |
+
+"""
+
+
+def build_artifact(size: int) -> str:
+    """Build a synthetic artifact of roughly the given size in characters."""
+    parts = ["# Risk Register\n\n## Project\n\nBenchmark project\n\n"]
+    length = len(parts[0])
+    n = 0
+    while length < size:
+        block = BLOCK.format(n=n % 1000)
+        parts.append(block)
+        length += len(block)
+        n += 1
+    return "".join(parts)
+
+
+def best_of(repeat: int, func) -> float:
+    """Best wall-clock time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark artifact validation")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    validator = ArtifactValidator()
+    artifact_names = list(validator.criteria["artifacts"].keys())
+
+    print("="*70)
+    print("ARTIFACT VALIDATION BENCHMARK")
+    print(f"{len(artifact_names)} artifacts x R3 criteria, best of {args.repeat}")
+    print("="*70)
+    print(f"{'Size':>8} {'Chars':>10} {'Parse':>10} {'Validate all':>14} {'Per KB':>10}")
+
+    for label, size in SIZES.items():
+        content = build_artifact(size)
+
+        parse_time = best_of(args.repeat, lambda: parse_markdown(content, validator.placeholder_scanner))
+        validate_time = best_of(args.repeat, lambda: [
+            validator.validate_artifact(name, content, "R3") for name in artifact_names
+        ])
+        per_kb = validate_time / (len(content) / 1000)
+
+        print(f"{label:>8} {len(content):>10,} {parse_time * 1000:>8.1f}ms "
+              f"{validate_time * 1000:>12.1f}ms {per_kb * 1000:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Artifact Archive Streaming
+
+Builds a project's artifact ZIP as a stream of chunks, from the artifact
+files on disk or from freshly rendered content, without a temporary file or
+a full in-memory copy of the archive:
+
+- ZipFile writes into an unseekable sink (sizes and CRCs go into data
+  descriptors), and whatever it has written so far is yielded after each
+  block of input
+- the output is deterministic for the same members and compression level
+  (fixed timestamps, permissions and order), so the ETag identifies the bytes
+  and byte ranges of separate requests line up
+- a range request needs the total length: it is counted by streaming once
+  without keeping the output, then remembered per ETag
+
+Compression level 0 stores members uncompressed (fastest); 1-9 deflate.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Deflate level used when none is requested (0 = stored)
+DEFAULT_COMPRESSION_LEVEL = 6
+
+# Bytes read from an artifact file per block
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Archive lengths remembered for range requests (keyed by ETag)
+MAX_KNOWN_LENGTHS = 1024
+
+# Earliest timestamp a ZIP entry can hold
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+RANGE_REGEX = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+DateTime = Tuple[int, int, int, int, int, int]
+
+
+class RangeNotSatisfiable(ValueError):
+    """Raised when a requested byte range lies outside the archive."""
+    pass
+
+
+class ArchiveMember:
+    """One file in the archive: name, timestamp, a fingerprint of its content and a way to read it."""
+
+    def __init__(
+        self,
+        filename: str,
+        date_time: DateTime,
+        fingerprint: str,
+        read: Callable[[], Iterator[bytes]]
+    ):
+        """
+        Initialize member.
+
+        Args:
+            filename: Name inside the archive (no path)
+            date_time: Entry timestamp (local time, as ZIP stores it)
+            fingerprint: Changes whenever the content does (goes into the ETag)
+            read: Returns the content as an iterator of byte blocks
+        """
+        self.filename = filename
+        self.date_time = max(tuple(date_time), ZIP_EPOCH)
+        self.fingerprint = fingerprint
+        self.read = read
+
+
+def file_member(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ArchiveMember:
+    """
+    Member read from a file in blocks (fingerprint: mtime and size, as for static files).
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = os.stat(path)
+
+    def read() -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(chunk_size)
+                if not block:
+                    return
+                yield block
+
+    return ArchiveMember(
+        filename=path.name,
+        date_time=time.localtime(stat.st_mtime)[:6],
+        fingerprint=f"{stat.st_mtime_ns}:{stat.st_size}",
+        read=read
+    )
+
+
+def text_member(filename: str, content: str, date_time: DateTime) -> ArchiveMember:
+    """Member from in-memory text (fingerprint: content hash)."""
+    data = content.encode('utf-8')
+    return ArchiveMember(
+        filename=filename,
+        date_time=date_time,
+        fingerprint=hashlib.sha256(data).hexdigest(),
+        read=lambda: iter((data,))
+    )
+
+
+def archive_etag(members: Sequence[ArchiveMember], level: int) -> str:
+    """Strong ETag of the archive built from these members at this compression level."""
+    digest = hashlib.sha256(f"zip:{level}".encode('utf-8'))
+    for member in members:
+        digest.update(f"\0{member.filename}\0{member.date_time}\0{member.fingerprint}".encode('utf-8'))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+class _ChunkSink:
+    """Write-only, unseekable file object collecting what ZipFile writes."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Everything written since the last drain."""
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_archive(
+    members: Sequence[ArchiveMember],
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+    etag: Optional[str] = None
+) -> Iterator[bytes]:
+    """
+    ZIP archive of the members as a stream of chunks, in member order.
+
+    Args:
+        members: Files to include
+        level: 0 stores members uncompressed, 1-9 deflate at that level
+        etag: archive_etag of the same members and level; when given, the
+            length is remembered once the stream completes
+
+    Yields:
+        Non-empty byte chunks
+    """
+    if level == 0:
+        compression, compresslevel = zipfile.ZIP_STORED, None
+    else:
+        compression, compresslevel = zipfile.ZIP_DEFLATED, level
+
+    sink = _ChunkSink()
+    length = 0
+    with zipfile.ZipFile(sink, 'w', compression, compresslevel=compresslevel) as zipf:
+        for member in members:
+            info = zipfile.ZipInfo(member.filename, date_time=member.date_time)
+            info.compress_type = compression
+            # ZipFile.open() takes the deflate level from the ZipInfo, not the archive
+            info._compresslevel = compresslevel
+            info.external_attr = 0o644 << 16
+            with zipf.open(info, 'w') as entry:
+                for block in member.read():
+                    entry.write(block)
+                    chunk = sink.drain()
+                    if chunk:
+                        length += len(chunk)
+                        yield chunk
+            chunk = sink.drain()
+            if chunk:
+                length += len(chunk)
+                yield chunk
+
+    chunk = sink.drain()
+    if chunk:
+        length += len(chunk)
+        yield chunk
+
+    if etag is not None:
+        _remember_length(etag, length)
+
+
+# Lengths of completed archives, by ETag
+_known_lengths: "OrderedDict[str, int]" = OrderedDict()
+_known_lengths_lock = threading.Lock()
+
+
+def _remember_length(etag: str, length: int) -> None:
+    with _known_lengths_lock:
+        _known_lengths[etag] = length
+        _known_lengths.move_to_end(etag)
+        while len(_known_lengths) > MAX_KNOWN_LENGTHS:
+            _known_lengths.popitem(last=False)
+
+
+def known_length(etag: str) -> Optional[int]:
+    """Length of an archive that has been streamed or counted before, or None."""
+    with _known_lengths_lock:
+        return _known_lengths.get(etag)
+
+
+def archive_length(members: Sequence[ArchiveMember], level: int, etag: str) -> int:
+    """Total archive length (counted by streaming once if not known yet)."""
+    length = known_length(etag)
+    if length is None:
+        length = sum(len(chunk) for chunk in stream_archive(members, level))
+        _remember_length(etag, length)
+    return length
+
+
+def parse_range(header: str, length: int) -> Optional[Tuple[int, int]]:
+    """
+    Byte range requested by a Range header, as inclusive (start, end).
+
+    Only a single range is served; multiple or malformed ranges return None
+    (the whole archive is sent, as RFC 7233 permits).
+
+    Raises:
+        RangeNotSatisfiable: If the range starts beyond the archive
+    """
+    match = RANGE_REGEX.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.group(1), match.group(2)
+    if first == "":
+        # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, length - suffix), length - 1
+
+    start = int(first)
+    end = min(int(last), length - 1) if last else length - 1
+    if last and int(last) < start:
+        return None
+    if start >= length:
+        raise RangeNotSatisfiable(header)
+    return start, end
+
+
+def slice_stream(chunks: Iterable[bytes], start: int, end: int) -> Iterator[bytes]:
+    """Bytes start..end (inclusive) of a chunk stream; stops consuming it after end."""
+    position = 0
+    for chunk in chunks:
+        chunk_end = position + len(chunk)
+        if chunk_end > start:
+            yield chunk[max(0, start - position):end + 1 - position]
+        position = chunk_end
+        if position > end:
+            return
@@ -0,0 +1,159 @@
+"""
+Dependency Graph - Phase 8A WS-2
+dependencies.json compiled once into adjacency, order and closure tables.
+
+DependencyManager used to answer "what does X unblock?" by scanning every
+required artifact's status for every candidate (O(N^2) per request), and a
+cycle in dependencies.json went unnoticed until it produced artifacts that
+could never become unblocked. The graph is compiled when the configuration
+is loaded:
+
+- prerequisites / dependents: forward and reverse adjacency, in config order
+- topological_order: prerequisites before dependents (config order breaks ties)
+- ancestors / descendants: transitive closures
+- subgraph(nodes): induced subgraph for one risk level's required artifacts,
+  compiled once per distinct node list
+
+A cycle raises DependencyCycleError naming the artifacts on the cycle, so a
+bad edit fails at startup (or is rejected by hot reload) instead of at request time.
+"""
+
+import heapq
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+class DependencyCycleError(ValueError):
+    """dependencies.json contains a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        """
+        Initialize cycle error.
+
+        Args:
+            cycle: Artifacts on the cycle, first artifact repeated at the end
+                (e.g. ["Risk Register", "CTQ Tree", "Risk Register"])
+        """
+        self.cycle = cycle
+        super().__init__(
+            "Dependency cycle in dependencies.json: " + " -> ".join(cycle)
+            + " (each artifact depends on the next)"
+        )
+
+
+class DependencyGraph:
+    """Compiled artifact dependency graph (immutable once built)."""
+
+    def __init__(self, dependencies: Mapping[str, Sequence[str]], nodes: Optional[Sequence[str]] = None):
+        """
+        Compile a dependency mapping.
+
+        Args:
+            dependencies: Artifact name -> prerequisite artifact names
+            nodes: Artifacts to include, in order (optional, defaults to every artifact
+                named in dependencies; edges to other artifacts are dropped)
+
+        Raises:
+            DependencyCycleError: If the graph has a cycle
+        """
+        if nodes is None:
+            ordered: Dict[str, None] = {}
+            for name, prerequisites in dependencies.items():
+                ordered.setdefault(name)
+                for prerequisite in prerequisites:
+                    ordered.setdefault(prerequisite)
+            nodes = list(ordered)
+        else:
+            nodes = list(dict.fromkeys(nodes))
+
+        self.nodes: Tuple[str, ...] = tuple(nodes)
+        self.position: Dict[str, int] = {name: index for index, name in enumerate(self.nodes)}
+
+        # Forward adjacency (deduplicated, config order) and reverse adjacency (node order)
+        prerequisites: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for name in self.nodes:
+            for prerequisite in dict.fromkeys(dependencies.get(name, ())):
+                if prerequisite in self.position:
+                    prerequisites[name].append(prerequisite)
+                    dependents[prerequisite].append(name)
+
+        self.prerequisites: Dict[str, Tuple[str, ...]] = {
+            name: tuple(edges) for name, edges in prerequisites.items()
+        }
+        self.dependents: Dict[str, Tuple[str, ...]] = {
+            name: tuple(sorted(edges, key=self.position.__getitem__)) for name, edges in dependents.items()
+        }
+
+        self.topological_order: Tuple[str, ...] = self._topological_sort()
+
+        # Transitive closures, built along the topological order
+        self.ancestors: Dict[str, FrozenSet[str]] = {}
+        for name in self.topological_order:
+            closure = set(self.prerequisites[name])
+            for prerequisite in self.prerequisites[name]:
+                closure |= self.ancestors[prerequisite]
+            self.ancestors[name] = frozenset(closure)
+
+        self.descendants: Dict[str, FrozenSet[str]] = {}
+        for name in reversed(self.topological_order):
+            closure = set(self.dependents[name])
+            for dependent in self.dependents[name]:
+                closure |= self.descendants[dependent]
+            self.descendants[name] = frozenset(closure)
+
+        self._dependencies = dependencies
+        self._subgraphs: Dict[Tuple[str, ...], "DependencyGraph"] = {}
+        self._subgraphs_lock = threading.Lock()
+
+    def subgraph(self, nodes: Iterable[str]) -> "DependencyGraph":
+        """
+        Induced subgraph over the given artifacts (e.g. one risk level's required artifacts).
+
+        Node order (and so dependents order) follows the given order. Compiled
+        once per distinct node list.
+        """
+        key = tuple(nodes)
+        subgraph = self._subgraphs.get(key)
+        if subgraph is None:
+            subgraph = DependencyGraph(self._dependencies, key)
+            with self._subgraphs_lock:
+                subgraph = self._subgraphs.setdefault(key, subgraph)
+        return subgraph
+
+    def _topological_sort(self) -> Tuple[str, ...]:
+        """Kahn's algorithm, taking ready artifacts in node order."""
+        remaining = {name: len(self.prerequisites[name]) for name in self.nodes}
+        ready = [self.position[name] for name in self.nodes if remaining[name] == 0]
+        heapq.heapify(ready)
+        order: List[str] = []
+
+        while ready:
+            name = self.nodes[heapq.heappop(ready)]
+            order.append(name)
+            for dependent in self.dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(ready, self.position[dependent])
+
+        if len(order) < len(self.nodes):
+            raise DependencyCycleError(self._find_cycle({name for name in self.nodes if remaining[name] > 0}))
+
+        return tuple(order)
+
+    def _find_cycle(self, unresolved: set) -> List[str]:
+        """A cycle among artifacts Kahn's algorithm could not order."""
+        # Every unresolved artifact has an unresolved prerequisite, so following
+        # those edges must revisit an artifact
+        start = min(unresolved, key=self.position.__getitem__)
+        path: List[str] = []
+        seen: Dict[str, int] = {}
+        name = start
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = next(
+                prerequisite for prerequisite in self.prerequisites[name]
+                if prerequisite in unresolved
+            )
+        return path[seen[name]:] + [name]
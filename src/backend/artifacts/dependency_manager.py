@@ -11,13 +11,25 @@ Design Principles (from WS-2 docs):
 """
 
 import json
-import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel
 
 # Import WS-1 validator
-from .validator import ArtifactValidator, ValidationResult
+from .validator import (
+    ArtifactValidator,
+    ValidationResult,
+    DEFAULT_CRITERIA_PATH,
+    config_signature,
+    config_version,
+    get_artifact_validator
+)
+from .dependency_graph import DependencyGraph
+from .id_index import CTQ_DEFINING_ARTIFACT, RISK_DEFINING_ARTIFACT, IdOccurrence
+from .manifest import ArtifactManifest
+from .snapshot import ProjectSnapshot, artifact_filename, extract_risk_ids, extract_ctq_ids
 
 
 class ReadinessAssessment(BaseModel):
@@ -38,6 +50,9 @@ class ReadinessAssessment(BaseModel):
     # Dark-Matter Patch #3: Override budget tracking
     override_budget: Optional[Dict] = None
 
+    # Version of the dependency/threshold/volatility/criteria configuration used
+    config_version: Optional[str] = None
+
 
 class DependencyStatus(BaseModel):
     """Status of a single artifact's dependencies."""
@@ -60,6 +75,49 @@ class NextActionRecommendation(BaseModel):
     unblocks: List[str] = []  # Which downstream artifacts this unblocks
 
 
+class CriticalPathStep(BaseModel):
+    """One artifact that still has to become ready, in completion order."""
+    artifact_name: str
+    completion: float  # Current WS-1 completion (0.0 if not generated)
+    target_completion: float  # Volatility-adjusted threshold for this risk level
+    gap: float  # max(0, target_completion - completion)
+    reason: str  # Why the artifact is not ready yet
+    after: List[str] = []  # Prerequisites that are also in the plan (complete those first)
+    on_critical_path: bool = False
+
+
+class CriticalPath(BaseModel):
+    """Minimal set of artifact completions that makes every required artifact ready."""
+    risk_level: str
+    overall_ready: bool
+    steps: List[CriticalPathStep]  # Every not-ready required artifact, prerequisites first
+    critical_path: List[str]  # Heaviest prerequisite chain through the steps (by gap)
+    critical_path_gap: float  # Sum of gaps along the critical path
+    total_gap: float  # Sum of gaps over all steps
+    config_version: Optional[str] = None
+
+
+# Default configuration files shipped alongside the dependency manager
+DEFAULT_DEPENDENCIES_PATH = Path(__file__).parent / "dependencies.json"
+DEFAULT_THRESHOLDS_PATH = Path(__file__).parent / "readiness_thresholds.json"
+DEFAULT_VOLATILITY_PATH = Path(__file__).parent / "artifact_volatility.json"
+
+# Projects whose critical path is kept in memory per manager
+CRITICAL_PATH_CACHE_SIZE = 256
+
+# Cross-reference checks: artifact -> kinds of IDs it must only reference if defined
+CROSS_REFERENCE_CHECKS = {
+    "Verification Plan": ("risk",),
+    "Traceability Index": ("risk", "ctq"),
+}
+
+# Artifacts read by check_cross_references
+CROSS_REFERENCE_ARTIFACTS = (RISK_DEFINING_ARTIFACT, CTQ_DEFINING_ARTIFACT, *CROSS_REFERENCE_CHECKS)
+
+# Where each kind of ID is defined
+ID_DEFINING_ARTIFACTS = {"risk": RISK_DEFINING_ARTIFACT, "ctq": CTQ_DEFINING_ARTIFACT}
+
+
 class DependencyManager:
     """
     Manages artifact dependencies and readiness assessment.
@@ -76,7 +134,8 @@ class DependencyManager:
         self,
         dependencies_path: Optional[Path] = None,
         thresholds_path: Optional[Path] = None,
-        volatility_path: Optional[Path] = None
+        volatility_path: Optional[Path] = None,
+        validator: Optional[ArtifactValidator] = None
     ):
         """
         Initialize dependency manager with configuration files.
@@ -85,33 +144,47 @@ class DependencyManager:
             dependencies_path: Path to dependencies.json
             thresholds_path: Path to readiness_thresholds.json
             volatility_path: Path to artifact_volatility.json
+            validator: WS-1 validator to use (optional, a new one is created if not provided)
         """
-        artifacts_dir = Path(__file__).parent
-
         if dependencies_path is None:
-            dependencies_path = artifacts_dir / "dependencies.json"
+            dependencies_path = DEFAULT_DEPENDENCIES_PATH
         if thresholds_path is None:
-            thresholds_path = artifacts_dir / "readiness_thresholds.json"
+            thresholds_path = DEFAULT_THRESHOLDS_PATH
         if volatility_path is None:
-            volatility_path = artifacts_dir / "artifact_volatility.json"
+            volatility_path = DEFAULT_VOLATILITY_PATH
 
         # Load configuration
-        with open(dependencies_path, 'r') as f:
-            dep_config = json.load(f)
-            self.dependencies = dep_config["dependencies"]
-            self.dependency_rationale = dep_config.get("rationale", {})
+        raw_configs = []
+        for path in (dependencies_path, thresholds_path, volatility_path):
+            with open(path, 'rb') as f:
+                raw_configs.append(f.read())
 
-        with open(thresholds_path, 'r') as f:
-            threshold_config = json.load(f)
-            self.thresholds = threshold_config["risk_levels"]
+        dep_config = json.loads(raw_configs[0])
+        self.dependencies = dep_config["dependencies"]
+        self.dependency_rationale = dep_config.get("rationale", {})
 
-        with open(volatility_path, 'r') as f:
-            volatility_config = json.load(f)
-            self.volatility_lookup = volatility_config["artifact_lookup"]
-            self.volatility_classes = volatility_config["volatility_classes"]
+        # Adjacency, topological order and closures (raises DependencyCycleError on a cycle)
+        self.graph = DependencyGraph(self.dependencies)
+
+        threshold_config = json.loads(raw_configs[1])
+        self.thresholds = threshold_config["risk_levels"]
+
+        volatility_config = json.loads(raw_configs[2])
+        self.volatility_lookup = volatility_config["artifact_lookup"]
+        self.volatility_classes = volatility_config["volatility_classes"]
 
         # Initialize WS-1 validator
-        self.validator = ArtifactValidator()
+        self.validator = validator if validator is not None else ArtifactValidator()
+
+        # One stamp covering every file that affects readiness results
+        self.config_version = config_version(
+            *raw_configs,
+            self.validator.config_version.encode("ascii")
+        )
+
+        # Critical paths keyed by project files' (mtime, size), see get_critical_path
+        self._critical_paths: "OrderedDict[Tuple, CriticalPath]" = OrderedDict()
+        self._critical_paths_lock = threading.Lock()
 
         # Confidence limits (Dark-Matter Patch #6)
         self.confidence_limits = [
@@ -120,6 +193,17 @@ class DependencyManager:
             "Expert review required for safety-critical systems"
         ]
 
+    def effective_completion(self, artifact_name: str, risk_level: str) -> float:
+        """
+        Completion an artifact needs to be ready at a risk level.
+
+        Risk level threshold from readiness_thresholds.json plus the artifact's
+        volatility modifier (Dark-Matter Patch #1), clamped to [0.5, 1.0].
+        """
+        volatility_class = self.volatility_lookup.get(artifact_name, "foundation")
+        modifier = self.volatility_classes[volatility_class]["modifier"]
+        return max(0.5, min(1.0, self.thresholds[risk_level]["completion"] + modifier))
+
     def is_ready(
         self,
         validation_result: ValidationResult,
@@ -141,14 +225,11 @@ class DependencyManager:
         """
         # Get base threshold for risk level
         threshold = self.thresholds[risk_level]
-        base_completion = threshold["completion"]
         max_errors = threshold["max_errors"]
         max_warnings = threshold["max_warnings"]
 
         # Apply volatility modifier (Dark-Matter Patch #1)
-        volatility_class = self.volatility_lookup.get(artifact_name, "foundation")
-        modifier = self.volatility_classes[volatility_class]["modifier"]
-        effective_completion = max(0.5, min(1.0, base_completion + modifier))
+        effective_completion = self.effective_completion(artifact_name, risk_level)
 
         # Check completion percentage (using WS-1 result directly per contract)
         if validation_result.completion_percent < effective_completion:
@@ -197,10 +278,40 @@ class DependencyManager:
         )
 
         # Step 2: Check readiness using WS-1 results
+        return self._build_readiness(
+            artifact_name,
+            validation_result,
+            len(content),
+            risk_level,
+            override_count
+        )
+
+    def snapshot(self, artifacts_dir: Path, risk_level: str, cache=None) -> ProjectSnapshot:
+        """
+        Create a per-request snapshot of a project's artifacts.
+
+        Pass the snapshot to check_dependencies, get_next_actions and
+        check_cross_references so each artifact is read and validated once.
+        With a validation cache, unchanged artifacts are not re-validated
+        across requests either, and artifacts still as generated (per the
+        artifact manifest) are not even read.
+        """
+        return ProjectSnapshot(
+            artifacts_dir, risk_level, self.validator, cache, ArtifactManifest.load(artifacts_dir)
+        )
+
+    def _build_readiness(
+        self,
+        artifact_name: str,
+        validation_result: ValidationResult,
+        total_content_length: int,
+        risk_level: str,
+        override_count: int = 0
+    ) -> ReadinessAssessment:
+        """Build a ReadinessAssessment from an existing WS-1 validation result."""
         ready = self.is_ready(validation_result, risk_level, artifact_name)
 
         # Calculate placeholder density
-        total_content_length = len(content)
         placeholder_density = (
             validation_result.placeholder_count / total_content_length
             if total_content_length > 0 else 0.0
@@ -212,9 +323,7 @@ class DependencyManager:
 
         if not ready:
             threshold = self.thresholds[risk_level]
-            volatility_class = self.volatility_lookup.get(artifact_name, "foundation")
-            modifier = self.volatility_classes[volatility_class]["modifier"]
-            effective_completion = max(0.5, min(1.0, threshold["completion"] + modifier))
+            effective_completion = self.effective_completion(artifact_name, risk_level)
 
             if validation_result.completion_percent < effective_completion:
                 blocking_issues.append(
@@ -259,14 +368,16 @@ class DependencyManager:
             readiness_basis="structural",
             reason=reason,
             blocking_issues=blocking_issues,
-            override_budget=override_budget
+            override_budget=override_budget,
+            config_version=self.config_version
         )
 
     def check_dependencies(
         self,
         artifact_name: str,
         artifacts_dir: Path,
-        risk_level: str
+        risk_level: str,
+        snapshot: Optional[ProjectSnapshot] = None
     ) -> DependencyStatus:
         """
         Check if all dependencies for an artifact are ready.
@@ -277,44 +388,41 @@ class DependencyManager:
             artifact_name: Name of artifact to check
             artifacts_dir: Directory containing artifact files
             risk_level: Risk level for this project
+            snapshot: Shared per-request snapshot (optional, a new one is created if not provided)
 
         Returns:
             DependencyStatus with diagnostic information
         """
+        snapshot = self._resolve_snapshot(snapshot, artifacts_dir, risk_level)
+
         # Get dependencies for this artifact
-        dependencies = self.dependencies.get(artifact_name, [])
+        dependencies = list(self.graph.prerequisites.get(artifact_name, ()))
 
         # Check each dependency
         blocking_dependencies = []
 
         for dep_name in dependencies:
-            # Read dependency artifact
-            dep_filename = self._artifact_name_to_filename(dep_name)
-            dep_path = artifacts_dir / dep_filename
+            dep_result = snapshot.validation(dep_name)
 
-            if not dep_path.exists():
+            if dep_result is None:
                 # Dependency doesn't exist yet
                 blocking_dependencies.append(dep_name)
                 continue
 
-            with open(dep_path, 'r') as f:
-                dep_content = f.read()
-
-            # Validate dependency
-            dep_result = self.validator.validate_artifact(dep_name, dep_content, risk_level)
-
             # Check if ready
             if not self.is_ready(dep_result, risk_level, dep_name):
                 blocking_dependencies.append(dep_name)
 
         # Check current artifact readiness
-        artifact_filename = self._artifact_name_to_filename(artifact_name)
-        artifact_path = artifacts_dir / artifact_filename
-
-        if artifact_path.exists():
-            with open(artifact_path, 'r') as f:
-                artifact_content = f.read()
-            readiness = self.assess_readiness(artifact_name, artifact_content, risk_level)
+        validation_result = snapshot.validation(artifact_name)
+
+        if validation_result is not None:
+            readiness = self._build_readiness(
+                artifact_name,
+                validation_result,
+                snapshot.content_length(artifact_name),
+                risk_level
+            )
         else:
             # Artifact doesn't exist - create empty readiness assessment
             readiness = ReadinessAssessment(
@@ -325,7 +433,8 @@ class DependencyManager:
                 confidence_limits=self.confidence_limits,
                 placeholder_density=0.0,
                 readiness_basis="structural",
-                reason="Artifact not generated yet"
+                reason="Artifact not generated yet",
+                config_version=self.config_version
             )
 
         # Determine suggestion (teaching-oriented language)
@@ -350,7 +459,9 @@ class DependencyManager:
         self,
         artifacts_dir: Path,
         risk_level: str,
-        required_artifacts: List[str]
+        required_artifacts: List[str],
+        snapshot: Optional[ProjectSnapshot] = None,
+        statuses: Optional[Dict[str, DependencyStatus]] = None
     ) -> List[NextActionRecommendation]:
         """
         Recommend what user should work on next.
@@ -361,17 +472,26 @@ class DependencyManager:
             artifacts_dir: Directory containing artifact files
             risk_level: Risk level for this project
             required_artifacts: List of artifacts required for this risk level
+            snapshot: Shared per-request snapshot (optional, a new one is created if not provided)
+            statuses: Dependency status of every required artifact, if already known
+                (optional, e.g. from the readiness engine; snapshot is not used then)
 
         Returns:
             Ordered list of recommended actions
         """
         recommendations = []
 
-        # Build dependency graph awareness
-        artifact_status = {}
-        for artifact_name in required_artifacts:
-            status = self.check_dependencies(artifact_name, artifacts_dir, risk_level)
-            artifact_status[artifact_name] = status
+        # Dependency graph restricted to the artifacts required at this risk level
+        graph = self.graph.subgraph(required_artifacts)
+
+        if statuses is not None:
+            artifact_status = statuses
+        else:
+            snapshot = self._resolve_snapshot(snapshot, artifacts_dir, risk_level)
+            artifact_status = {}
+            for artifact_name in required_artifacts:
+                status = self.check_dependencies(artifact_name, artifacts_dir, risk_level, snapshot)
+                artifact_status[artifact_name] = status
 
         # Find artifacts that are:
         # 1. Incomplete
@@ -389,12 +509,11 @@ class DependencyManager:
             if not status.all_dependencies_ready:
                 continue
 
-            # Count how many downstream artifacts this would unblock
-            unblocks = []
-            for other_name in required_artifacts:
-                other_status = artifact_status[other_name]
-                if artifact_name in other_status.blocking_dependencies:
-                    unblocks.append(other_name)
+            # Downstream artifacts this would unblock (direct dependents only)
+            unblocks = [
+                dependent for dependent in graph.dependents[artifact_name]
+                if artifact_name in artifact_status[dependent].blocking_dependencies
+            ]
 
             # Determine priority based on:
             # - Number of downstream artifacts blocked
@@ -431,10 +550,117 @@ class DependencyManager:
 
         return recommendations
 
+    def get_critical_path(
+        self,
+        artifacts_dir: Path,
+        risk_level: str,
+        required_artifacts: List[str],
+        snapshot: Optional[ProjectSnapshot] = None,
+        cache=None
+    ) -> CriticalPath:
+        """
+        Shortest ordered set of artifact completions that makes the project ready.
+
+        Every required artifact that is not ready must be completed (readiness
+        is per artifact), so the plan is exactly those artifacts in dependency
+        order. Each step is weighted by its completion gap against the
+        volatility-adjusted threshold; the critical path is the heaviest chain of
+        prerequisite -> dependent steps, i.e. the work that cannot be done in parallel.
+
+        Results are cached per project and invalidated when any required
+        artifact file changes (mtime/size), so polling is cheap.
+
+        Args:
+            artifacts_dir: Directory containing artifact files
+            risk_level: Risk level for this project
+            required_artifacts: List of artifacts required for this risk level
+            snapshot: Shared per-request snapshot (optional, used on a cache miss)
+            cache: Validation cache for the snapshot built on a cache miss when no snapshot is given
+
+        Returns:
+            CriticalPath
+        """
+        key = (
+            str(artifacts_dir),
+            risk_level,
+            tuple(required_artifacts),
+            config_signature(Path(artifacts_dir) / artifact_filename(name) for name in required_artifacts)
+        )
+        with self._critical_paths_lock:
+            cached = self._critical_paths.get(key)
+            if cached is not None:
+                self._critical_paths.move_to_end(key)
+                return cached
+
+        snapshot = self._resolve_snapshot(snapshot, artifacts_dir, risk_level, cache)
+        graph = self.graph.subgraph(required_artifacts)
+
+        # Not-ready artifacts, prerequisites first
+        steps: Dict[str, CriticalPathStep] = {}
+        for artifact_name in graph.topological_order:
+            target = self.effective_completion(artifact_name, risk_level)
+            validation_result = snapshot.validation(artifact_name)
+
+            if validation_result is None:
+                completion = 0.0
+                reason = "Artifact not generated yet"
+            elif self.is_ready(validation_result, risk_level, artifact_name):
+                continue
+            else:
+                completion = validation_result.completion_percent
+                readiness = self._build_readiness(
+                    artifact_name, validation_result, snapshot.content_length(artifact_name), risk_level
+                )
+                reason = readiness.reason
+
+            steps[artifact_name] = CriticalPathStep(
+                artifact_name=artifact_name,
+                completion=completion,
+                target_completion=target,
+                gap=max(0.0, target - completion),
+                reason=reason,
+                after=[name for name in graph.prerequisites[artifact_name] if name in steps]
+            )
+
+        # Heaviest chain: longest path over the plan DAG, weighted by gap
+        chain_gap: Dict[str, float] = {}
+        chain_previous: Dict[str, Optional[str]] = {}
+        for artifact_name, step in steps.items():
+            previous = max(step.after, key=lambda name: chain_gap[name], default=None)
+            chain_gap[artifact_name] = step.gap + (chain_gap[previous] if previous else 0.0)
+            chain_previous[artifact_name] = previous
+
+        critical_path: List[str] = []
+        if steps:
+            name = max(steps, key=lambda name: chain_gap[name])
+            while name is not None:
+                critical_path.append(name)
+                steps[name].on_critical_path = True
+                name = chain_previous[name]
+            critical_path.reverse()
+
+        result = CriticalPath(
+            risk_level=risk_level,
+            overall_ready=not steps,
+            steps=list(steps.values()),
+            critical_path=critical_path,
+            critical_path_gap=sum(steps[name].gap for name in critical_path),
+            total_gap=sum(step.gap for step in steps.values()),
+            config_version=self.config_version
+        )
+
+        with self._critical_paths_lock:
+            self._critical_paths[key] = result
+            while len(self._critical_paths) > CRITICAL_PATH_CACHE_SIZE:
+                self._critical_paths.popitem(last=False)
+
+        return result
+
     def check_cross_references(
         self,
         artifacts_dir: Path,
-        risk_level: str
+        risk_level: str,
+        snapshot: Optional[ProjectSnapshot] = None
     ) -> Dict[str, List[str]]:
         """
         Check for cross-artifact reference consistency.
@@ -447,82 +673,83 @@ class DependencyManager:
         Args:
             artifacts_dir: Directory containing artifact files
             risk_level: Risk level for this project
+            snapshot: Shared per-request snapshot (optional, a new one is created if not provided)
 
         Returns:
             Dictionary mapping artifact names to lists of cross-reference issues
         """
-        cross_ref_issues = {}
-
-        # Extract Risk IDs from Risk Register
-        risk_register_path = artifacts_dir / "QMS-Risk-Register.md"
-        risk_ids = set()
-        if risk_register_path.exists():
-            with open(risk_register_path, 'r') as f:
-                risk_content = f.read()
-            risk_ids = self._extract_risk_ids(risk_content)
-
-        # Extract CTQ IDs from CTQ Tree
-        ctq_tree_path = artifacts_dir / "QMS-CTQ-Tree.md"
-        ctq_ids = set()
-        if ctq_tree_path.exists():
-            with open(ctq_tree_path, 'r') as f:
-                ctq_content = f.read()
-            ctq_ids = self._extract_ctq_ids(ctq_content)
-
-        # Check Verification Plan references
-        verification_plan_path = artifacts_dir / "QMS-Verification-Plan.md"
-        if verification_plan_path.exists():
-            with open(verification_plan_path, 'r') as f:
-                verification_content = f.read()
-
-            # Check for risk references
-            referenced_risks = self._extract_risk_references(verification_content)
-            orphaned_risks = [r for r in referenced_risks if r not in risk_ids]
-
-            if orphaned_risks:
-                cross_ref_issues["Verification Plan"] = [
-                    f"References {r} not found in Risk Register" for r in orphaned_risks
-                ]
-
-        # Check Traceability Index references
-        traceability_path = artifacts_dir / "QMS-Traceability-Index.md"
-        if traceability_path.exists():
-            with open(traceability_path, 'r') as f:
-                trace_content = f.read()
-
-            # Check for risk and CTQ references
-            referenced_risks = self._extract_risk_references(trace_content)
-            orphaned_risks = [r for r in referenced_risks if r not in risk_ids]
-
-            referenced_ctqs = self._extract_ctq_references(trace_content)
-            orphaned_ctqs = [c for c in referenced_ctqs if c not in ctq_ids]
-
-            issues = []
-            if orphaned_risks:
-                issues.extend([f"References {r} not found in Risk Register" for r in orphaned_risks])
-            if orphaned_ctqs:
-                issues.extend([f"References {c} not found in CTQ Tree" for c in orphaned_ctqs])
-
-            if issues:
-                cross_ref_issues["Traceability Index"] = issues
-
-        return cross_ref_issues
+        issues = {}
+        for artifact_name, orphans in self.orphaned_references(artifacts_dir, risk_level, snapshot).items():
+            issues[artifact_name] = [
+                f"References {orphan.id} not found in {ID_DEFINING_ARTIFACTS[orphan.kind]}"
+                for orphan in orphans
+            ]
+        return issues
+
+    def orphaned_references(
+        self,
+        artifacts_dir: Path,
+        risk_level: str,
+        snapshot: Optional[ProjectSnapshot] = None
+    ) -> Dict[str, List[IdOccurrence]]:
+        """
+        Where each unresolved cross-artifact reference is first mentioned.
+
+        Risk references must match a Risk Register record and CTQ references
+        an ID in the CTQ Tree; the check is a set difference over the
+        project's ID index.
+
+        Args:
+            artifacts_dir: Directory containing artifact files
+            risk_level: Risk level for this project
+            snapshot: Shared per-request snapshot (optional, a new one is created if not provided)
+
+        Returns:
+            Artifact name -> first occurrence of each orphaned ID (risks first,
+            then CTQs, each in document order); artifacts without orphans are omitted
+        """
+        snapshot = self._resolve_snapshot(snapshot, artifacts_dir, risk_level)
+        index = snapshot.id_index(CROSS_REFERENCE_ARTIFACTS)
+
+        orphaned: Dict[str, List[IdOccurrence]] = {}
+        for artifact_name, kinds in CROSS_REFERENCE_CHECKS.items():
+            orphan_ids = []
+            if "risk" in kinds:
+                orphan_ids.extend(index.orphaned_risks(artifact_name))
+            if "ctq" in kinds:
+                orphan_ids.extend(index.orphaned_ctqs(artifact_name))
+            if orphan_ids:
+                orphaned[artifact_name] = [index.first_reference(artifact_name, orphan_id) for orphan_id in orphan_ids]
+
+        return orphaned
+
+    def _resolve_snapshot(
+        self,
+        snapshot: Optional[ProjectSnapshot],
+        artifacts_dir: Path,
+        risk_level: str,
+        cache=None
+    ) -> ProjectSnapshot:
+        """Use the caller's snapshot, or create one (with the given validation cache) for a standalone call."""
+        if snapshot is None:
+            return self.snapshot(artifacts_dir, risk_level, cache)
+        if snapshot.risk_level != risk_level:
+            raise ValueError(
+                f"Snapshot was built for {snapshot.risk_level}, not {risk_level}"
+            )
+        return snapshot
 
     def _artifact_name_to_filename(self, artifact_name: str) -> str:
         """Convert artifact name to filename."""
-        return f"QMS-{artifact_name.replace(' ', '-')}.md"
+        return artifact_filename(artifact_name)
 
     def _extract_risk_ids(self, content: str) -> set:
         """Extract risk IDs from content (e.g., R-001, RISK-001)."""
-        pattern = r'(?:Risk[- ])?([A-Z]-?\d{3})'
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        return set(m.upper() for m in matches)
+        return extract_risk_ids(content)
 
     def _extract_ctq_ids(self, content: str) -> set:
         """Extract CTQ IDs from content (e.g., CTQ-001, CTQ-1)."""
-        pattern = r'CTQ-?\d+'
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        return set(m.upper() for m in matches)
+        return extract_ctq_ids(content)
 
     def _extract_risk_references(self, content: str) -> set:
         """Extract risk ID references from content."""
@@ -531,3 +758,48 @@ class DependencyManager:
     def _extract_ctq_references(self, content: str) -> set:
         """Extract CTQ ID references from content."""
         return self._extract_ctq_ids(content)
+
+
+# Global dependency manager instance (copy-on-write: replaced, never mutated)
+_manager: Optional[DependencyManager] = None
+_manager_signature: Optional[Tuple] = None
+_manager_lock = threading.Lock()
+
+
+def get_dependency_manager() -> DependencyManager:
+    """
+    Get the shared DependencyManager, reloading it if any configuration file changed.
+
+    Watches dependencies.json, readiness_thresholds.json,
+    artifact_volatility.json and acceptance_criteria.json. A reload builds a
+    complete new manager (sharing the current validator from
+    get_artifact_validator) and then swaps the global reference; requests
+    already holding the previous manager finish with a consistent view. If the
+    edited files cannot be loaded the previous manager stays in service.
+    """
+    global _manager, _manager_signature
+
+    signature = config_signature([
+        DEFAULT_DEPENDENCIES_PATH,
+        DEFAULT_THRESHOLDS_PATH,
+        DEFAULT_VOLATILITY_PATH,
+        DEFAULT_CRITERIA_PATH
+    ])
+    if _manager is not None and signature == _manager_signature:
+        return _manager
+
+    with _manager_lock:
+        if _manager is None or signature != _manager_signature:
+            try:
+                manager = DependencyManager(validator=get_artifact_validator())
+            except Exception as e:
+                if _manager is None:
+                    raise
+                print(f"[DEPENDENCY] Warning: Keeping config {_manager.config_version}, reload failed: {e}")
+            else:
+                if _manager is not None:
+                    print(f"[DEPENDENCY] Reloaded configuration: {_manager.config_version} -> {manager.config_version}")
+                _manager = manager
+            _manager_signature = signature
+
+    return _manager
@@ -4,12 +4,30 @@ Artifact Generator - Phase 4
 Generates QMS artifacts based on risk classification and intake answers.
 Creates context-aware, first-pass content (not just empty templates).
 Phase 7 WS-1: Uses centralized configuration.
+
+Templates are rendered and written by a shared worker pool (one task per
+artifact, QMS_ARTIFACT_WORKERS threads); the ZIP archive is built from the
+rendered strings, so no file is read back.
+
+Generation is idempotent: artifact-manifest.json records what was written,
+and a regeneration re-renders only artifacts whose intake or template version
+changed (or whose file no longer matches the manifest), and rebuilds the ZIP
+only if one of its members changed.
+
+Template output is memoized per answer vector and template version
+(artifacts/render_cache.py); rendering for another project with the same
+answers only substitutes the project name and date.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import hashlib
+import os
 import sys
+import threading
+import zipfile
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,6 +35,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.intake import IntakeRequest, IntakeResponse, RiskClassification
 from config import get_config
 from security import sanitize_project_name, sanitize_artifact_name
+from artifacts.manifest import ArtifactManifest, ManifestArchive, ManifestEntry
+from artifacts.render_cache import get_render_cache
 
 
 class ArtifactGenerator:
@@ -30,52 +50,147 @@ class ArtifactGenerator:
     4. Return artifact metadata
     """
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, workers: Optional[int] = None):
+        """
+        Initialize generator.
+
+        Args:
+            output_dir: Directory the artifacts and ZIP archive are written to
+            workers: Artifacts rendered and written concurrently
+                (default: QMS_ARTIFACT_WORKERS; 1 generates them one after another)
+        """
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers if workers is not None else get_config().artifact_workers
 
     def generate_artifacts(
         self,
         intake_request: IntakeRequest,
-        intake_response: IntakeResponse
+        intake_response: IntakeResponse,
+        force: bool = False
     ) -> Dict[str, any]:
         """
         Generate all required QMS artifacts for the given intake.
 
+        Artifacts already generated from the same intake and template version
+        (and unchanged on disk since) are kept, unless force is set.
+
         Returns:
             {
                 "artifacts_generated": ["Quality Plan", "CTQ Tree", ...],
                 "file_paths": ["QMS-Quality-Plan.md", ...],
                 "output_directory": "/path/to/artifacts",
-                "zip_file": "/path/to/artifacts.zip"
+                "zip_file": "/path/to/artifacts.zip",
+                "artifacts_regenerated": ["CTQ Tree", ...],
+                "artifacts_unchanged": ["Quality Plan", ...],
+                "zip_rebuilt": true
             }
         """
         risk_level = intake_response.classification.risk_level
         required_artifacts = self._get_required_artifacts(risk_level)
-
-        generated_files = []
-        artifact_names = []
-
-        # Generate each required artifact
-        for artifact_name in required_artifacts:
+        intake_digest = intake_hash(intake_request, intake_response)
+        manifest = None if force else ArtifactManifest.load(self.output_dir)
+
+        # Artifacts still exactly as generated from this intake and template version
+        unchanged: Dict[str, ManifestEntry] = {}
+        if manifest is not None:
+            for artifact_name in required_artifacts:
+                entry = manifest.verified_entry(artifact_name, self.output_dir)
+                if (
+                    entry is not None
+                    and entry.intake_hash == intake_digest
+                    and entry.template_version == template_version(artifact_name)
+                ):
+                    unchanged[artifact_name] = entry
+        stale = [name for name in required_artifacts if name not in unchanged]
+
+        def generate(artifact_name: str) -> Tuple[str, ManifestEntry]:
             content = self._generate_artifact_content(
                 artifact_name,
                 intake_request,
                 intake_response
             )
-
             file_path = self._write_artifact_file(artifact_name, content)
-            generated_files.append(file_path)
-            artifact_names.append(artifact_name)
+            stat = os.stat(file_path)
+            return content, ManifestEntry(
+                artifact_name=artifact_name,
+                filename=file_path.name,
+                sha256=hashlib.sha256(content.encode('utf-8')).hexdigest(),
+                size=stat.st_size,
+                length=len(content),
+                mtime_ns=stat.st_mtime_ns,
+                template_version=template_version(artifact_name),
+                intake_hash=intake_digest,
+                generated_at=datetime.now().isoformat()
+            )
+
+        # Render and write each stale artifact (results arrive in required order)
+        if self.workers > 1 and len(stale) > 1:
+            generated = get_generation_executor(self.workers).map(generate, stale)
+        else:
+            generated = (generate(artifact_name) for artifact_name in stale)
+
+        zip_path = self.output_dir / self._zip_filename(intake_request.project_name)
+        entries: Dict[str, ManifestEntry] = dict(unchanged)
+        rendered: Dict[str, str] = {}
+
+        def members() -> Iterable[Tuple[str, str]]:
+            results = iter(generated)
+            for artifact_name in required_artifacts:
+                if artifact_name in unchanged:
+                    content = (self.output_dir / unchanged[artifact_name].filename).read_text()
+                else:
+                    content, entries[artifact_name] = next(results)
+                    rendered[artifact_name] = content
+                yield entries[artifact_name].filename, content
+
+        previous = [manifest.artifacts[name] for name in required_artifacts if name in manifest.artifacts] if manifest else []
+        if manifest is None or not manifest.archive_current(self.output_dir, zip_path.name, previous):
+            # Archive has to be rebuilt: build it while later artifacts are still being written
+            self._create_zip_archive(members(), intake_request.project_name)
+            zip_rebuilt = True
+        else:
+            # Archive is current for the previous outputs: rebuild only if a member changed
+            for artifact_name, (content, entry) in zip(stale, generated):
+                entries[artifact_name], rendered[artifact_name] = entry, content
+            zip_rebuilt = not manifest.archive_current(
+                self.output_dir, zip_path.name, [entries[name] for name in required_artifacts]
+            )
+            if zip_rebuilt:
+                self._create_zip_archive(
+                    ((entries[name].filename, rendered[name] if name in rendered
+                      else (self.output_dir / entries[name].filename).read_text())
+                     for name in required_artifacts),
+                    intake_request.project_name
+                )
+
+        ordered = [entries[name] for name in required_artifacts]
+        archive = manifest.archive if manifest is not None and not zip_rebuilt else None
+        if archive is None:
+            stat = os.stat(zip_path)
+            archive = ManifestArchive(
+                filename=zip_path.name,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                members={entry.filename: entry.sha256 for entry in ordered}
+            )
 
-        # Create ZIP archive
-        zip_path = self._create_zip_archive(generated_files, intake_request.project_name)
+        ArtifactManifest(
+            intake_id=intake_response.intake_id,
+            intake_hash=intake_digest,
+            generated_at=datetime.now().isoformat(),
+            artifacts={entry.artifact_name: entry for entry in ordered},
+            archive=archive
+        ).save(self.output_dir)
 
         return {
-            "artifacts_generated": artifact_names,
-            "file_paths": [str(f) for f in generated_files],
+            "artifacts_generated": list(required_artifacts),
+            "file_paths": [str(self.output_dir / entry.filename) for entry in ordered],
             "output_directory": str(self.output_dir),
-            "zip_file": str(zip_path)
+            "zip_file": str(zip_path),
+            "artifacts_regenerated": stale,
+            "artifacts_unchanged": [name for name in required_artifacts if name in unchanged],
+            "zip_rebuilt": zip_rebuilt
         }
 
     def _get_required_artifacts(self, risk_level: str) -> List[str]:
@@ -126,40 +241,7 @@ class ArtifactGenerator:
         Generate content for a specific artifact.
         Uses templates and populates with project-specific content.
         """
-        # Import artifact templates
-        from artifacts.templates import (
-            quality_plan,
-            ctq_tree,
-            assumptions_register,
-            risk_register,
-            traceability_index,
-            verification_plan,
-            validation_plan,
-            measurement_plan,
-            control_plan,
-            change_log,
-            capa_log
-        )
-
-        template_map = {
-            "Quality Plan": quality_plan.generate,
-            "CTQ Tree": ctq_tree.generate,
-            "Assumptions Register": assumptions_register.generate,
-            "Risk Register": risk_register.generate,
-            "Traceability Index": traceability_index.generate,
-            "Verification Plan": verification_plan.generate,
-            "Validation Plan": validation_plan.generate,
-            "Measurement Plan": measurement_plan.generate,
-            "Control Plan": control_plan.generate,
-            "Change Log": change_log.generate,
-            "CAPA Log": capa_log.generate
-        }
-
-        generator_func = template_map.get(artifact_name)
-        if not generator_func:
-            raise ValueError(f"Unknown artifact: {artifact_name}")
-
-        return generator_func(intake_request, intake_response)
+        return render_artifact(artifact_name, intake_request, intake_response)
 
     def _write_artifact_file(self, artifact_name: str, content: str) -> Path:
         """
@@ -180,36 +262,173 @@ class ArtifactGenerator:
 
         return file_path
 
+    def _zip_filename(self, project_name: str) -> str:
+        """
+        ZIP archive filename for a project.
+
+        Phase 7 WS-2: Uses sanitize_project_name() for security.
+        """
+        # Phase 7 WS-2: Sanitize project name using security utilities
+        safe_name = sanitize_project_name(project_name)
+        return f"{safe_name}-QMS-Artifacts.zip"
+
     def _create_zip_archive(
         self,
-        file_paths: List[Path],
+        entries: Iterable[Tuple[str, str]],
         project_name: str
     ) -> Path:
         """
         Create ZIP archive containing all generated artifacts.
 
-        Phase 7 WS-2: Uses sanitize_project_name() for security.
+        Args:
+            entries: (filename, content) per artifact, written as-is (no path)
+            project_name: Project name (archive filename)
         """
-        import zipfile
-
-        # Phase 7 WS-2: Sanitize project name using security utilities
-        safe_name = sanitize_project_name(project_name)
-
-        zip_filename = f"{safe_name}-QMS-Artifacts.zip"
-        zip_path = self.output_dir / zip_filename
+        zip_path = self.output_dir / self._zip_filename(project_name)
 
+        date_time = datetime.now().timetuple()[:6]
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in file_paths:
-                # Add file to ZIP with just the filename (no path)
-                zipf.write(file_path, file_path.name)
+            for filename, content in entries:
+                info = zipfile.ZipInfo(filename, date_time=date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                zipf.writestr(info, content)
 
         return zip_path
 
 
+# Shared worker pool (created on first use, resized if the worker count changes)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def get_generation_executor(workers: int) -> ThreadPoolExecutor:
+    """
+    Get the worker pool artifacts are rendered and written on.
+
+    One pool is shared by every generation request, so concurrent requests
+    queue for the same QMS_ARTIFACT_WORKERS threads instead of each starting
+    its own.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            previous = _executor
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifact-gen")
+            _executor_workers = workers
+            if previous is not None:
+                previous.shutdown(wait=False)
+        return _executor
+
+
+# Template generate() function per artifact name (filled on first use)
+_templates: Dict[str, Callable[[IntakeRequest, IntakeResponse], str]] = {}
+
+
+def _template_functions() -> Dict[str, Callable[[IntakeRequest, IntakeResponse], str]]:
+    """Template generate() function per artifact name."""
+    if _templates:
+        return _templates
+
+    # Import artifact templates
+    from artifacts.templates import (
+        quality_plan,
+        ctq_tree,
+        assumptions_register,
+        risk_register,
+        traceability_index,
+        verification_plan,
+        validation_plan,
+        measurement_plan,
+        control_plan,
+        change_log,
+        capa_log
+    )
+
+    _templates.update({
+        "Quality Plan": quality_plan.generate,
+        "CTQ Tree": ctq_tree.generate,
+        "Assumptions Register": assumptions_register.generate,
+        "Risk Register": risk_register.generate,
+        "Traceability Index": traceability_index.generate,
+        "Verification Plan": verification_plan.generate,
+        "Validation Plan": validation_plan.generate,
+        "Measurement Plan": measurement_plan.generate,
+        "Control Plan": control_plan.generate,
+        "Change Log": change_log.generate,
+        "CAPA Log": capa_log.generate
+    })
+    return _templates
+
+
+def render_artifact(
+    artifact_name: str,
+    intake_request: IntakeRequest,
+    intake_response: IntakeResponse,
+    cached: bool = True
+) -> str:
+    """
+    Render one artifact's template with project-specific content (nothing is written).
+
+    Args:
+        cached: Reuse the template output rendered for the same answers and
+            classification (only the project name and date are substituted)
+
+    Raises:
+        ValueError: If there is no template for the artifact
+    """
+    generator_func = _template_functions().get(artifact_name)
+    if not generator_func:
+        raise ValueError(f"Unknown artifact: {artifact_name}")
+
+    if not cached:
+        return generator_func(intake_request, intake_response)
+    return get_render_cache().render(
+        artifact_name,
+        template_version(artifact_name),
+        generator_func,
+        intake_request,
+        intake_response
+    )
+
+
+# Template version per artifact name (source of the loaded template module)
+_template_versions: Dict[str, str] = {}
+
+
+def template_version(artifact_name: str) -> str:
+    """
+    Version of an artifact's template: sha256 of its module source.
+
+    Any edit to a template re-renders that artifact on the next generation.
+
+    Raises:
+        ValueError: If there is no template for the artifact
+    """
+    if artifact_name not in _template_versions:
+        generator_func = _template_functions().get(artifact_name)
+        if not generator_func:
+            raise ValueError(f"Unknown artifact: {artifact_name}")
+        source = Path(sys.modules[generator_func.__module__].__file__).read_bytes()
+        _template_versions[artifact_name] = hashlib.sha256(source).hexdigest()[:16]
+    return _template_versions[artifact_name]
+
+
+def intake_hash(intake_request: IntakeRequest, intake_response: IntakeResponse) -> str:
+    """Hash of everything templates can read from an intake."""
+    digest = hashlib.sha256(intake_request.model_dump_json().encode('utf-8'))
+    digest.update(b"\0")
+    digest.update(intake_response.model_dump_json().encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
 def generate_project_artifacts(
     intake_request: IntakeRequest,
     intake_response: IntakeResponse,
-    output_dir: str | Path = None
+    output_dir: str | Path = None,
+    workers: Optional[int] = None,
+    force: bool = False
 ) -> Dict[str, any]:
     """
     Convenience function to generate artifacts for a project.
@@ -218,6 +437,8 @@ def generate_project_artifacts(
         intake_request: Original intake request
         intake_response: Classification response with warnings
         output_dir: Where to save artifacts (default: config.artifacts_dir/{intake_id})
+        workers: Artifacts generated concurrently (default: QMS_ARTIFACT_WORKERS)
+        force: Re-render every artifact even if the manifest shows it unchanged
 
     Returns:
         Dictionary with generated files and metadata
@@ -229,5 +450,5 @@ def generate_project_artifacts(
     else:
         output_dir = Path(output_dir)
 
-    generator = ArtifactGenerator(output_dir)
-    return generator.generate_artifacts(intake_request, intake_response)
+    generator = ArtifactGenerator(output_dir, workers)
+    return generator.generate_artifacts(intake_request, intake_response, force)
@@ -0,0 +1,209 @@
+"""
+Cross-Reference ID Index - Phase 8A WS-2
+Where every Risk and CTQ ID is defined and referenced across a project.
+
+Cross-reference checks used to run the risk and CTQ ID regexes over each
+artifact separately and could only say which IDs were orphaned, not where.
+Each artifact is now scanned once into ID occurrences (ID, kind, artifact,
+line, section); a project index combines the per-artifact occurrences so
+
+- cross-reference checking is a set difference (referenced - defined)
+- "where is R-003 referenced?" is a dictionary lookup
+- a changed artifact only re-scans that artifact (occurrences are memoized
+  per artifact by ProjectSnapshot)
+
+Definitions: a risk is defined by its Risk Register record (first line the
+record starts on); a CTQ by its first mention in the CTQ Tree. Every other
+mention is a reference. Extraction matches the historical regexes exactly, so
+the same IDs are found as before.
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Literal, Optional, Set
+
+from pydantic import BaseModel, Field
+
+from .risk_records import RiskRecord
+
+
+# Risk IDs (e.g., R-001, RISK-001 -> R-001) and CTQ IDs (e.g., CTQ-001, CTQ-1)
+RISK_ID_REGEX = re.compile(r'(?:Risk[- ])?([A-Z]-?\d{3})', re.IGNORECASE)
+CTQ_ID_REGEX = re.compile(r'CTQ-?\d+', re.IGNORECASE)
+
+# A whole ID as accepted by the reverse-lookup endpoint
+RISK_ID_FORMAT = re.compile(r'^[A-Z]-?\d{3}$', re.IGNORECASE)
+CTQ_ID_FORMAT = re.compile(r'^CTQ-?\d+$', re.IGNORECASE)
+
+SECTION_HEADING_REGEX = re.compile(r'^#{1,6}[ \t]+(.*?)[ \t#]*$', re.MULTILINE)
+
+# Artifacts that define IDs
+RISK_DEFINING_ARTIFACT = "Risk Register"
+CTQ_DEFINING_ARTIFACT = "CTQ Tree"
+
+IdKind = Literal["risk", "ctq"]
+
+
+class IdOccurrence(BaseModel):
+    """One mention of a Risk or CTQ ID in an artifact."""
+    id: str = Field(description="ID, uppercased (e.g., R-003, CTQ-001)")
+    kind: IdKind
+    artifact_name: str
+    line: int = Field(description="1-based line")
+    section: Optional[str] = Field(default=None, description="Nearest heading above the mention")
+    definition: bool = Field(default=False, description="True where the ID is defined, False for references")
+
+
+def id_kind(value: str) -> Optional[IdKind]:
+    """Kind of a whole ID ("risk" or "ctq"), or None if it is neither."""
+    if CTQ_ID_FORMAT.match(value):
+        return "ctq"
+    if RISK_ID_FORMAT.match(value):
+        return "risk"
+    return None
+
+
+def scan_artifact(
+    artifact_name: str,
+    content: str,
+    risk_records: Optional[List[RiskRecord]] = None
+) -> List[IdOccurrence]:
+    """
+    Every Risk and CTQ ID mention in one artifact, in document order.
+
+    Args:
+        artifact_name: Artifact the content belongs to
+        content: Artifact markdown
+        risk_records: Risk Register records (marks risk definitions when
+            scanning the Risk Register)
+
+    Returns:
+        Occurrences ordered by position (risk before CTQ at the same position)
+    """
+    newlines = [match.start() for match in re.finditer('\n', content)]
+    headings = [(match.start(), match.group(1).strip()) for match in SECTION_HEADING_REGEX.finditer(content)]
+    heading_starts = [start for start, _ in headings]
+
+    def locate(position: int):
+        line = bisect.bisect_right(newlines, position - 1) + 1
+        heading = bisect.bisect_right(heading_starts, position) - 1
+        return line, (headings[heading][1] or None) if heading >= 0 else None
+
+    definition_lines: Dict[str, int] = {}
+    if artifact_name == RISK_DEFINING_ARTIFACT and risk_records:
+        definition_lines = {record.risk_id: record.line for record in risk_records}
+
+    found = []
+    for match in RISK_ID_REGEX.finditer(content):
+        risk_id = match.group(1).upper()
+        line, section = locate(match.start())
+        found.append((match.start(), 0, IdOccurrence(
+            id=risk_id, kind="risk", artifact_name=artifact_name, line=line, section=section,
+            definition=definition_lines.get(risk_id) == line
+        )))
+
+    seen_ctqs: Set[str] = set()
+    for match in CTQ_ID_REGEX.finditer(content):
+        ctq_id = match.group(0).upper()
+        line, section = locate(match.start())
+        definition = artifact_name == CTQ_DEFINING_ARTIFACT and ctq_id not in seen_ctqs
+        seen_ctqs.add(ctq_id)
+        found.append((match.start(), 1, IdOccurrence(
+            id=ctq_id, kind="ctq", artifact_name=artifact_name, line=line, section=section,
+            definition=definition
+        )))
+
+    found.sort(key=lambda item: (item[0], item[1]))
+    occurrences = [occurrence for _, _, occurrence in found]
+
+    # A record line can mention its ID twice (e.g. "R-001 ... see R-001"): one definition
+    defined: Set[str] = set()
+    for occurrence in occurrences:
+        if occurrence.definition and occurrence.kind == "risk":
+            if occurrence.id in defined:
+                occurrence.definition = False
+            defined.add(occurrence.id)
+
+    return occurrences
+
+
+class ProjectIdIndex:
+    """Risk and CTQ ID occurrences across a project's artifacts (immutable once built)."""
+
+    def __init__(
+        self,
+        occurrences: Dict[str, List[IdOccurrence]],
+        risk_records: Iterable[RiskRecord]
+    ):
+        """
+        Combine per-artifact occurrences.
+
+        Args:
+            occurrences: Artifact name -> scan_artifact output (existing artifacts only)
+            risk_records: Risk Register records (the defined risks)
+        """
+        self.occurrences = occurrences
+
+        self.defined_risks: Set[str] = {record.risk_id for record in risk_records}
+        self.risk_prefixes: Set[str] = {risk_id[:1] for risk_id in self.defined_risks}
+        self.defined_ctqs: Set[str] = {
+            occurrence.id for occurrence in occurrences.get(CTQ_DEFINING_ARTIFACT, ())
+            if occurrence.kind == "ctq"
+        }
+
+        self.by_id: Dict[str, List[IdOccurrence]] = {}
+        for artifact_occurrences in occurrences.values():
+            for occurrence in artifact_occurrences:
+                self.by_id.setdefault(occurrence.id, []).append(occurrence)
+
+    def referenced_ids(self, artifact_name: str, kind: IdKind) -> List[str]:
+        """IDs of one kind mentioned in an artifact, in order of first mention."""
+        ids = (
+            occurrence.id for occurrence in self.occurrences.get(artifact_name, ())
+            if occurrence.kind == kind
+        )
+        return list(dict.fromkeys(ids))
+
+    def is_risk_reference(self, risk_id: str) -> bool:
+        """
+        True if a risk-shaped ID should resolve to a Risk Register record.
+
+        Risk ID extraction matches any letter prefix (A-001 assumptions, V-001
+        verification items, ...), so only prefixes the register itself uses
+        count. With no records every ID counts.
+        """
+        return not self.risk_prefixes or risk_id[:1] in self.risk_prefixes
+
+    def orphaned_risks(self, artifact_name: str) -> List[str]:
+        """Risk references in an artifact with no Risk Register record, in order of first mention."""
+        return [
+            risk_id for risk_id in self.referenced_ids(artifact_name, "risk")
+            if risk_id not in self.defined_risks and self.is_risk_reference(risk_id)
+        ]
+
+    def orphaned_ctqs(self, artifact_name: str) -> List[str]:
+        """CTQ references in an artifact not found in the CTQ Tree, in order of first mention."""
+        return [
+            ctq_id for ctq_id in self.referenced_ids(artifact_name, "ctq")
+            if ctq_id not in self.defined_ctqs
+        ]
+
+    def is_defined(self, value: str) -> bool:
+        """True if a risk has a Risk Register record or a CTQ appears in the CTQ Tree."""
+        value = value.upper()
+        return value in self.defined_ctqs if id_kind(value) == "ctq" else value in self.defined_risks
+
+    def definitions(self, value: str) -> List[IdOccurrence]:
+        """Where an ID is defined."""
+        return [occurrence for occurrence in self.by_id.get(value.upper(), ()) if occurrence.definition]
+
+    def references(self, value: str) -> List[IdOccurrence]:
+        """Where an ID is referenced (every mention that is not its definition)."""
+        return [occurrence for occurrence in self.by_id.get(value.upper(), ()) if not occurrence.definition]
+
+    def first_reference(self, artifact_name: str, value: str) -> Optional[IdOccurrence]:
+        """First mention of an ID in an artifact, or None."""
+        for occurrence in self.by_id.get(value.upper(), ()):
+            if occurrence.artifact_name == artifact_name:
+                return occurrence
+        return None
@@ -0,0 +1,117 @@
+"""
+Artifact Manifest
+
+Record of what artifact generation wrote to a project's artifacts directory,
+saved next to the artifacts as artifact-manifest.json:
+
+- per artifact: content sha256, size, file mtime, the template version and
+  intake hash it was rendered from, and when it was generated
+- the ZIP archive and the members it was built from
+
+Generation uses it to re-render only artifacts whose intake or template
+changed and to rebuild the ZIP only when a member changed. Readers use it to
+learn an unchanged artifact's content hash from a single stat (no read, no
+hashing), e.g. to look up a cached validation result.
+
+A file edited after generation no longer matches its entry (mtime/size) and
+is treated as unknown.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+MANIFEST_FILENAME = "artifact-manifest.json"
+
+# Bumped when the manifest layout changes (older manifests are ignored)
+MANIFEST_VERSION = 1
+
+
+class ManifestEntry(BaseModel):
+    """One generated artifact file."""
+    artifact_name: str
+    filename: str
+    sha256: str = Field(description="sha256 of the file content")
+    size: int = Field(description="File size in bytes")
+    length: int = Field(description="Content length in characters")
+    mtime_ns: int = Field(description="File mtime right after it was written")
+    template_version: str = Field(description="Version of the template it was rendered from")
+    intake_hash: str = Field(description="Hash of the intake it was rendered from")
+    generated_at: str = Field(description="When it was rendered (ISO 8601)")
+
+
+class ManifestArchive(BaseModel):
+    """The ZIP archive written by generation."""
+    filename: str
+    size: int
+    mtime_ns: int
+    members: Dict[str, str] = Field(description="Member filename -> sha256, in archive order")
+
+
+class ArtifactManifest(BaseModel):
+    """What generation wrote to an artifacts directory."""
+    version: int = MANIFEST_VERSION
+    intake_id: str
+    intake_hash: str
+    generated_at: str = Field(description="Last time generation ran (ISO 8601)")
+    artifacts: Dict[str, ManifestEntry] = Field(default_factory=dict, description="Artifact name -> entry")
+    archive: Optional[ManifestArchive] = None
+
+    @classmethod
+    def load(cls, artifacts_dir: Path) -> Optional["ArtifactManifest"]:
+        """Manifest of an artifacts directory, or None if missing, unreadable or of another version."""
+        try:
+            manifest = cls.model_validate_json((Path(artifacts_dir) / MANIFEST_FILENAME).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[MANIFEST] Warning: Ignoring unreadable manifest in {artifacts_dir}: {e}")
+            return None
+        return manifest if manifest.version == MANIFEST_VERSION else None
+
+    def save(self, artifacts_dir: Path) -> None:
+        """Write the manifest atomically."""
+        fd, tmp_path = tempfile.mkstemp(dir=artifacts_dir, prefix=".manifest-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.model_dump_json(indent=2))
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, Path(artifacts_dir) / MANIFEST_FILENAME)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def verified_entry(self, artifact_name: str, artifacts_dir: Path) -> Optional[ManifestEntry]:
+        """
+        The artifact's entry if its file is still exactly what generation wrote.
+
+        One stat: the file's mtime and size must match the entry.
+        """
+        entry = self.artifacts.get(artifact_name)
+        if entry is None or not _unchanged(Path(artifacts_dir) / entry.filename, entry.size, entry.mtime_ns):
+            return None
+        return entry
+
+    def archive_current(self, artifacts_dir: Path, filename: str, members: List[ManifestEntry]) -> bool:
+        """True if the ZIP archive is unchanged on disk and was built from exactly these members."""
+        archive = self.archive
+        return (
+            archive is not None
+            and archive.filename == filename
+            and archive.members == {entry.filename: entry.sha256 for entry in members}
+            and list(archive.members) == [entry.filename for entry in members]
+            and _unchanged(Path(artifacts_dir) / archive.filename, archive.size, archive.mtime_ns)
+        )
+
+
+def _unchanged(path: Path, size: int, mtime_ns: int) -> bool:
+    """True if a file exists with this size and mtime."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return stat.st_size == size and stat.st_mtime_ns == mtime_ns
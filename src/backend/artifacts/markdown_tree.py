@@ -0,0 +1,328 @@
+"""
+Markdown Section Tree - Phase 8A WS-1
+Single-pass parse of an artifact into the structure the validator checks.
+
+The validator used to answer each question (does section X exist, how many
+list items, how many table rows, ...) with its own regex over the whole
+document, and re-split the document for every required section. The tree is
+built in one pass over the lines and every structural rule queries it, so
+validation cost is linear in document size regardless of how many sections
+or rules the acceptance criteria define.
+
+Line semantics (kept identical to the regexes this replaces):
+- Any line starting with '#' is a heading and ends the previous section's
+  body, whatever its level and whether or not a space follows the hashes.
+- Only "## Title" style lines (two or more '#', then a space) count as
+  sections and can satisfy a required section; "# Title" is the document
+  title, "##Title" and "##<tab>Title" are headings without a title.
+- A section's body stops at the next heading of any level, so a section whose
+  only content is subsections is empty.
+- List items ("- x", "* x", "1. x") may be indented, and blank lines may sit
+  between the marker and the text ("-" on one line, "word" on the next
+  counts once, attributed to the marker's line).
+- Table rows are lines starting with '|' that contain at least three '|'.
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple, Union
+
+from .placeholder_scanner import PlaceholderScanner
+
+
+class Section:
+    """A heading and the lines up to the next heading."""
+
+    def __init__(self, level: int, title: Optional[str], line: int, parent: Optional["Section"]):
+        """
+        Initialize section.
+
+        Args:
+            level: Number of leading '#' (0 for the preamble before the first heading)
+            title: Heading text for "## Title" style headings, else None
+            line: Line index of the heading (-1 for the preamble)
+            parent: Enclosing section (None for the preamble/root)
+        """
+        self.level = level
+        self.title = title
+        self.line = line
+        self.parent = parent
+        self.children: List["Section"] = []
+
+        # Body span: line indices [body_start, body_end)
+        self.body_start = line + 1
+        self.body_end = line + 1
+        # Character span of the body within the document
+        self.body_span: Tuple[int, int] = (0, 0)
+
+        self.has_content = False  # Any non-whitespace text in the body
+        self.list_items = 0       # "- x" / "* x" items whose marker is in the body
+        self.numbered_items = 0   # "1. x" items whose marker is in the body
+        self.table_rows = 0       # Table rows (including header/separator rows)
+        self.placeholder_count = 0
+
+    @property
+    def is_titled(self) -> bool:
+        """True for "## Title" style headings (the only ones that count as sections)."""
+        return self.title is not None and self.level >= 2
+
+    def __repr__(self) -> str:
+        return f"Section(level={self.level}, title={self.title!r}, line={self.line})"
+
+
+class MarkdownTree:
+    """Parsed artifact: sections in document order plus document-level counts."""
+
+    def __init__(self, text: str, placeholders: Optional[Union[PlaceholderScanner, Pattern]] = None):
+        """
+        Parse an artifact.
+
+        Args:
+            text: Full markdown content
+            placeholders: PlaceholderScanner, or a compiled placeholder pattern
+                (optional, placeholders are not collected if omitted)
+        """
+        self.text = text
+        self.lines = text.split('\n')
+
+        # Offset of the first character of each line
+        self.line_offsets: List[int] = []
+        offset = 0
+        for line in self.lines:
+            self.line_offsets.append(offset)
+            offset += len(line) + 1
+
+        self.root = Section(0, None, -1, None)
+        self.sections: List[Section] = []  # Every heading, in document order
+
+        self.section_count = 0       # "## Title" style headings
+        self.list_items = 0
+        self.numbered_items = 0
+        self.table_rows = 0          # Lines starting with '|' containing 3+ '|'
+        self.has_table = False       # Any line starting with '|' containing 2+ '|'
+        self.has_title = False       # Document starts with "# Word"
+        self.has_subtitle = False    # Some line is "## Word"
+        self.content_length = 0      # Stripped length with "# ..." heading lines removed
+
+        self.placeholder_spans: List[Tuple[int, int]] = []
+
+        self._parse()
+        if placeholders is not None:
+            self._collect_placeholders(placeholders)
+
+    @property
+    def placeholder_count(self) -> int:
+        """Number of placeholder matches in the document."""
+        return len(self.placeholder_spans)
+
+    def find_section(self, name: str) -> Optional[Section]:
+        """First "## Title" style section whose title matches name (case-insensitive)."""
+        matches = _title_matcher(name)
+        for section in self.sections:
+            if section.is_titled and matches(section.title):
+                return section
+        return None
+
+    def section_has_content(self, name: str) -> bool:
+        """True if the section exists and its body has non-whitespace text."""
+        section = self.find_section(name)
+        return section is not None and section.has_content
+
+    def section_at_line(self, line: int) -> Section:
+        """Section whose body (or heading) contains the given line."""
+        index = bisect_right(self._heading_lines, line) - 1
+        return self.sections[index] if index >= 0 else self.root
+
+    def _parse(self) -> None:
+        """Single pass over the lines building sections and document-level counts."""
+        lines = self.lines
+        line_count = len(lines)
+
+        # first_text[i]: index of the first non-whitespace char on line i, -1 if blank
+        first_text = [-1] * line_count
+        for i, line in enumerate(lines):
+            if line and not line.isspace():
+                first_text[i] = len(line) - len(line.lstrip())
+
+        # next_text[i]: first line >= i that is not blank (line_count if none)
+        next_text = [line_count] * (line_count + 1)
+        for i in range(line_count - 1, -1, -1):
+            next_text[i] = i if first_text[i] >= 0 else next_text[i + 1]
+
+        self._first_text = first_text
+        self._next_text = next_text
+
+        # Headings, section bodies and table rows
+        stack = [self.root]
+        current = self.root
+        current.body_start = 0
+        kept_lengths = []  # Line lengths after removing "# ..." heading lines
+
+        for i, line in enumerate(lines):
+            if line.startswith('#'):
+                hashes = len(line) - len(line.lstrip('#'))
+                spaced = line[hashes:hashes + 1] == ' '
+                title = line[hashes:].lstrip(' ').rstrip() if spaced else None
+
+                current.body_end = i
+                while stack[-1] is not self.root and stack[-1].level >= hashes:
+                    stack.pop()
+                current = Section(hashes, title, i, stack[-1])
+                stack[-1].children.append(current)
+                stack.append(current)
+                self.sections.append(current)
+
+                if spaced and hashes >= 2:
+                    self.section_count += 1
+                if hashes == 2 and not self.has_subtitle:
+                    self.has_subtitle = self._word_follows(i, 2) is not None
+
+                kept_lengths.append(0 if spaced else len(line))
+                continue
+
+            kept_lengths.append(len(line))
+            if first_text[i] >= 0:
+                current.has_content = True
+            if line.startswith('|'):
+                pipes = line.count('|')
+                if pipes >= 2:
+                    self.has_table = True
+                if pipes >= 3:
+                    self.table_rows += 1
+                    current.table_rows += 1
+
+        current.body_end = line_count
+        self._heading_lines = [section.line for section in self.sections]
+
+        for section in [self.root] + self.sections:
+            start = self.line_offsets[section.body_start] if section.body_start < line_count else len(self.text)
+            end = self.line_offsets[section.body_end] - 1 if section.body_end < line_count else len(self.text)
+            section.body_span = (start, max(start, end))
+
+        self.has_title = lines[0].startswith('#') and self._word_follows(0, 1) is not None
+        self.content_length = self._stripped_length(kept_lengths)
+
+        # List items: "-"/"*" markers, then "1." style markers
+        for line_index in self._item_lines(self._bullet_end):
+            self.list_items += 1
+            self.section_at_line(line_index).list_items += 1
+        for line_index in self._item_lines(self._number_end):
+            self.numbered_items += 1
+            self.section_at_line(line_index).numbered_items += 1
+
+    def _collect_placeholders(self, placeholders: Union[PlaceholderScanner, Pattern]) -> None:
+        """Record placeholder spans and attribute them to sections."""
+        if isinstance(placeholders, PlaceholderScanner):
+            self.placeholder_spans = placeholders.spans(self.text)
+        else:
+            self.placeholder_spans = [match.span() for match in placeholders.finditer(self.text)]
+        for start, _ in self.placeholder_spans:
+            line = bisect_right(self.line_offsets, start) - 1
+            self.section_at_line(line).placeholder_count += 1
+
+    def _item_lines(self, marker_end) -> List[int]:
+        """
+        Lines holding list item markers, in document order.
+
+        Mirrors findall(r'^[\\s]*<marker>\\s+\\w', MULTILINE): each attempt starts
+        at a line, skips whitespace (across blank lines) to the next text,
+        and a successful item resumes scanning on the line after the word.
+        """
+        lines = self.lines
+        first_text = self._first_text
+        next_text = self._next_text
+        line_count = len(lines)
+        found = []
+
+        i = 0
+        while i < line_count:
+            k = next_text[i]
+            if k >= line_count:
+                break
+            end = marker_end(lines[k], first_text[k])
+            word_line = self._word_follows(k, end) if end is not None else None
+            if word_line is None:
+                i = k + 1
+            else:
+                found.append(k)
+                i = word_line + 1
+        return found
+
+    @staticmethod
+    def _bullet_end(line: str, col: int) -> Optional[int]:
+        """Index just past a '-' or '*' marker at col, else None."""
+        return col + 1 if line[col] in '-*' else None
+
+    @staticmethod
+    def _number_end(line: str, col: int) -> Optional[int]:
+        """Index just past a "<digits>." marker at col, else None."""
+        end = col
+        while end < len(line) and line[end].isdecimal():
+            end += 1
+        if end > col and line[end:end + 1] == '.':
+            return end + 1
+        return None
+
+    def _word_follows(self, line_index: int, col: int) -> Optional[int]:
+        """
+        Mirror of r'\\s+\\w' starting at (line_index, col).
+
+        Returns the line index of the word character, or None if there is no
+        whitespace at col or the next text is not a word character. The
+        newline at the end of a line counts as whitespace.
+        """
+        line = self.lines[line_index]
+        if col < len(line):
+            if not line[col].isspace():
+                return None
+            rest = line[col:]
+            stripped = rest.lstrip()
+            if stripped:
+                return line_index if _is_word_char(stripped[0]) else None
+        elif line_index + 1 >= len(self.lines):
+            return None
+
+        k = self._next_text[line_index + 1]
+        if k >= len(self.lines):
+            return None
+        return k if _is_word_char(self.lines[k][self._first_text[k]]) else None
+
+    def _stripped_length(self, kept_lengths: List[int]) -> int:
+        """Length of the heading-free text after str.strip(), without building it."""
+        lines = self.lines
+        first = None
+        last = None
+        for i, length in enumerate(kept_lengths):
+            # Removed heading lines have a kept length of 0
+            if length and self._first_text[i] >= 0:
+                if first is None:
+                    first = i
+                last = i
+        if first is None:
+            return 0
+
+        total = sum(kept_lengths[first:last + 1]) + (last - first)
+        leading = self._first_text[first]
+        last_line = lines[last]
+        trailing = len(last_line) - len(last_line.rstrip())
+        return total - leading - trailing
+
+
+def _is_word_char(char: str) -> bool:
+    """Same definition as the regex \\w class."""
+    return char.isalnum() or char == '_'
+
+
+@lru_cache(maxsize=512)
+def _title_matcher(name: str):
+    """Case-insensitive exact title matcher with the same folding rules as re.IGNORECASE."""
+    return re.compile(re.escape(name), re.IGNORECASE).fullmatch
+
+
+def parse_markdown(
+    text: str,
+    placeholders: Optional[Union[PlaceholderScanner, Pattern]] = None
+) -> MarkdownTree:
+    """Parse an artifact into a MarkdownTree."""
+    return MarkdownTree(text, placeholders)
@@ -0,0 +1,138 @@
+"""
+Placeholder Scanner - Phase 8A WS-1
+Single-pass placeholder tokenizer with linear worst-case cost.
+
+The validator used to find placeholders with one alternation regex
+(r'\\[.*?\\]|TBD|...|\\{.*?\\}', IGNORECASE). Each '[' or '{' with no closing
+bracket on the same line makes the lazy quantifier run to the end of the
+line before the match fails, so a long line full of unmatched brackets costs
+O(n^2). The scanner returns exactly the same spans as that regex, but
+remembers where a closing bracket search already failed, so every character
+is examined a bounded number of times.
+
+Semantics (kept identical to the regex):
+- Matches are found left to right and never overlap; scanning resumes after
+  the end of each match.
+- A bracketed placeholder runs from the opening bracket to the first closing
+  bracket on the same line ('.' never crosses a newline). Brackets may be
+  empty ("[]") or nested-looking ("[[a]" matches "[[a]").
+- Literal placeholders (TBD, TODO, ...) are matched case-insensitively
+  anywhere, including inside words ("TODOs", "XXXL").
+"""
+
+import re
+from typing import Dict, List, Sequence, Tuple
+
+
+# Literal placeholders, matched case-insensitively
+DEFAULT_PLACEHOLDER_LITERALS = (
+    "TBD",
+    "To be determined",
+    "TODO",
+    "FIXME",
+    "XXX",
+    "<placeholder>",
+)
+
+# Bracket pairs; anything between them on one line is a placeholder
+# (covers [Name], [Description] and any other [bracketed text] or {braced text})
+DEFAULT_PLACEHOLDER_DELIMITERS = (
+    ("[", "]"),
+    ("{", "}"),
+)
+
+# The alternation regex the scanner replaced (compile with re.IGNORECASE). It
+# finds the same spans but is O(n^2) in the worst case; only parity tests and
+# bench_placeholders.py use it, never validation.
+REFERENCE_PLACEHOLDER_PATTERN = '|'.join([
+    r'\[Name\]',
+    r'\[Description\]',
+    r'\[.*?\]',  # Any [bracketed text]
+    r'TBD',
+    r'To be determined',
+    r'TODO',
+    r'FIXME',
+    r'XXX',
+    r'<placeholder>',
+    r'\{.*?\}',  # Any {braced text} that looks like a placeholder
+])
+
+
+class PlaceholderScanner:
+    """Finds placeholder spans in O(n), matching REFERENCE_PLACEHOLDER_PATTERN."""
+
+    def __init__(
+        self,
+        literals: Sequence[str] = DEFAULT_PLACEHOLDER_LITERALS,
+        delimiters: Sequence[Tuple[str, str]] = DEFAULT_PLACEHOLDER_DELIMITERS
+    ):
+        """
+        Initialize scanner.
+
+        Args:
+            literals: Literal placeholder strings (case-insensitive)
+            delimiters: (open, close) single-character bracket pairs
+        """
+        for opening, closing in delimiters:
+            if len(opening) != 1 or len(closing) != 1 or "\n" in (opening, closing):
+                raise ValueError(f"Delimiters must be single non-newline characters: {opening!r}, {closing!r}")
+
+        self.literals = tuple(literals)
+        self.delimiters = tuple(delimiters)
+        self._closing: Dict[str, str] = dict(self.delimiters)
+
+        # Finds the next position where any placeholder could start. Every
+        # alternative has a fixed length, so the search never backtracks.
+        alternatives = [re.escape(opening) for opening, _ in self.delimiters]
+        alternatives += [re.escape(literal) for literal in self.literals]
+        self._start_regex = re.compile("|".join(alternatives), re.IGNORECASE)
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """(start, end) of every placeholder in the text, in document order."""
+        spans = []
+        search = self._start_regex.search
+        closing = self._closing
+        # closing char -> end of the line on which no closing char follows
+        # the last failed search position
+        no_close_before: Dict[str, int] = {}
+
+        pos = 0
+        while True:
+            match = search(text, pos)
+            if match is None:
+                return spans
+
+            start, end = match.span()
+            close_char = closing.get(text[start]) if end - start == 1 else None
+            if close_char is None:
+                # Literal placeholder
+                spans.append((start, end))
+                pos = end
+                continue
+
+            if start < no_close_before.get(close_char, -1):
+                pos = start + 1
+                continue
+
+            line_end = text.find("\n", end)
+            if line_end == -1:
+                line_end = len(text)
+            close = text.find(close_char, end, line_end)
+            if close == -1:
+                no_close_before[close_char] = line_end
+                pos = start + 1
+            else:
+                spans.append((start, close + 1))
+                pos = close + 1
+
+    def count(self, text: str) -> int:
+        """Number of placeholders in the text."""
+        return len(self.spans(text))
+
+    def pattern(self) -> str:
+        """Equivalent regex (for reference and parity tests; do not use on untrusted input)."""
+        alternatives = [
+            f"{re.escape(opening)}.*?{re.escape(closing)}" for opening, closing in self.delimiters
+        ]
+        alternatives += [re.escape(literal) for literal in self.literals]
+        return "|".join(alternatives)
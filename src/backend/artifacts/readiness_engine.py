@@ -0,0 +1,363 @@
+"""
+Readiness Engine - Phase 8A WS-2
+Incremental per-project dependency readiness, driven by artifact changes.
+
+Dependency health used to read, validate and assess every artifact on every
+request, although dashboards keep polling projects whose files rarely
+change. The engine keeps each project's readiness state between requests:
+
+- change detection: every tracked QMS-*.md file's (mtime_ns, size); a new
+  signature with an unchanged content hash (e.g. touch) changes nothing
+- dirty propagation: a changed artifact is re-validated on its own, and only
+  its status and its transitive dependents' statuses (compiled graph
+  descendants) are re-evaluated; cross-references are re-checked only when
+  an artifact they read has changed
+- steady state: within rescan_interval of the last check a poll is a
+  dictionary lookup; artifacts marked dirty (edit API, regeneration) are
+  picked up by the next poll regardless of the interval
+
+A project's state is rebuilt from scratch when the dependency manager's
+configuration version, the risk level or the required artifact list changes.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .dependency_manager import CROSS_REFERENCE_ARTIFACTS, DependencyManager, DependencyStatus
+from .id_index import IdOccurrence, ProjectIdIndex
+from .snapshot import ProjectSnapshot, artifact_filename
+
+
+# Seconds a checked project is served without looking at its files again
+DEFAULT_RESCAN_INTERVAL = 1.0
+
+# Projects whose readiness state is kept in memory
+DEFAULT_MAX_PROJECTS = 256
+
+# (st_mtime_ns, st_size), or None if the file does not exist
+FileSignature = Optional[Tuple[int, int]]
+
+
+class ProjectReadiness:
+    """Dependency readiness of one project (replaced on change, never mutated)."""
+
+    def __init__(
+        self,
+        statuses: Dict[str, DependencyStatus],
+        cross_reference_issues: Dict[str, List[str]],
+        orphaned_references: Dict[str, List[IdOccurrence]],
+        config_version: str,
+        version: int,
+        reevaluated: List[str]
+    ):
+        """
+        Initialize project readiness.
+
+        Args:
+            statuses: Dependency status per required artifact, in required order
+            cross_reference_issues: Output of check_cross_references
+            orphaned_references: Output of orphaned_references (where each issue is)
+            config_version: Dependency manager configuration version used
+            version: Increases by one every time the project's readiness changes
+            reevaluated: Required artifacts whose status was recomputed for this version
+        """
+        self.statuses = statuses
+        self.cross_reference_issues = cross_reference_issues
+        self.orphaned_references = orphaned_references
+        self.config_version = config_version
+        self.version = version
+        self.reevaluated = reevaluated
+
+        self.blocking_count = sum(
+            1 for status in statuses.values() if not status.all_dependencies_ready
+        )
+        self.overall_ready = all(status.readiness.ready for status in statuses.values())
+
+
+class _ProjectState:
+    """Readiness state of one project, refreshed under its own lock."""
+
+    def __init__(
+        self,
+        key: Tuple,
+        manager: DependencyManager,
+        snapshot: ProjectSnapshot,
+        required: Tuple[str, ...],
+        tracked: Tuple[str, ...]
+    ):
+        self.key = key
+        self.manager = manager
+        self.snapshot = snapshot
+        self.required = required
+        self.tracked = tracked
+
+        self.signatures: Dict[str, FileSignature] = {}
+        self.hashes: Dict[str, Optional[str]] = {}
+        self.dirty: Set[str] = set()
+        self.checked_at = 0.0
+        self.readiness: Optional[ProjectReadiness] = None
+        self.lock = threading.Lock()
+
+
+class ReadinessEngine:
+    """Keeps dependency readiness per project and updates it incrementally."""
+
+    def __init__(
+        self,
+        cache=None,
+        rescan_interval: float = DEFAULT_RESCAN_INTERVAL,
+        max_projects: int = DEFAULT_MAX_PROJECTS
+    ):
+        """
+        Initialize readiness engine.
+
+        Args:
+            cache: Validation result cache passed to each project's snapshot (optional)
+            rescan_interval: Seconds between file checks of an unchanged project
+                (0 checks the files on every poll)
+            max_projects: Projects kept in memory (least recently polled are dropped)
+        """
+        self.cache = cache
+        self.rescan_interval = rescan_interval
+        self.max_projects = max_projects
+
+        self._projects: "OrderedDict[str, _ProjectState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters
+        self._lookups = 0
+        self._rescans = 0
+        self._builds = 0
+        self._artifacts_changed = 0
+        self._statuses_reevaluated = 0
+        self._evictions = 0
+
+    def readiness(
+        self,
+        manager: DependencyManager,
+        artifacts_dir: Path,
+        risk_level: str,
+        required_artifacts: List[str]
+    ) -> ProjectReadiness:
+        """
+        Current dependency readiness of a project.
+
+        Args:
+            manager: Dependency manager (a different config_version rebuilds the state)
+            artifacts_dir: Directory containing artifact files
+            risk_level: Risk level for this project
+            required_artifacts: List of artifacts required for this risk level
+
+        Returns:
+            ProjectReadiness
+        """
+        return self._current(manager, artifacts_dir, risk_level, required_artifacts).readiness
+
+    def id_index(
+        self,
+        manager: DependencyManager,
+        artifacts_dir: Path,
+        risk_level: str,
+        required_artifacts: List[str]
+    ) -> ProjectIdIndex:
+        """
+        Risk/CTQ ID index over every artifact of a project, as of its current readiness.
+
+        Only artifacts changed since the index was last used are re-scanned.
+        """
+        state = self._current(manager, artifacts_dir, risk_level, required_artifacts)
+        with state.lock:
+            return state.snapshot.id_index(state.tracked)
+
+    def _current(
+        self,
+        manager: DependencyManager,
+        artifacts_dir: Path,
+        risk_level: str,
+        required_artifacts: List[str]
+    ) -> _ProjectState:
+        """The project's state, refreshed if its files may have changed."""
+        project = str(artifacts_dir)
+        required = tuple(required_artifacts)
+        key = (manager.config_version, risk_level, required)
+
+        with self._lock:
+            state = self._projects.get(project)
+            if state is not None and state.key == key:
+                self._projects.move_to_end(project)
+                if (
+                    state.readiness is not None
+                    and not state.dirty
+                    and time.monotonic() - state.checked_at < self.rescan_interval
+                ):
+                    self._lookups += 1
+                    return state
+            else:
+                state = self._new_state(key, manager, artifacts_dir, risk_level, required)
+                self._projects[project] = state
+                self._projects.move_to_end(project)
+                while len(self._projects) > self.max_projects:
+                    self._projects.popitem(last=False)
+                    self._evictions += 1
+
+        with state.lock:
+            self._refresh(state)
+        return state
+
+    def mark_dirty(self, artifacts_dir: Path, artifact_name: Optional[str] = None) -> None:
+        """
+        Re-check an artifact (or every artifact of the project) on the next poll.
+
+        Call after writing artifact files so the change is seen without
+        waiting for the rescan interval.
+        """
+        with self._lock:
+            state = self._projects.get(str(artifacts_dir))
+            if state is None:
+                return
+            if artifact_name is None:
+                state.dirty.update(state.tracked)
+            else:
+                state.dirty.add(artifact_name)
+
+    def clear(self) -> None:
+        """Drop all project state."""
+        with self._lock:
+            self._projects.clear()
+
+    def stats(self) -> Dict:
+        """Engine counters for diagnostics."""
+        with self._lock:
+            return {
+                "projects": len(self._projects),
+                "max_projects": self.max_projects,
+                "rescan_interval": self.rescan_interval,
+                "lookups": self._lookups,
+                "rescans": self._rescans,
+                "builds": self._builds,
+                "artifacts_changed": self._artifacts_changed,
+                "statuses_reevaluated": self._statuses_reevaluated,
+                "evictions": self._evictions
+            }
+
+    def _new_state(
+        self,
+        key: Tuple,
+        manager: DependencyManager,
+        artifacts_dir: Path,
+        risk_level: str,
+        required: Tuple[str, ...]
+    ) -> _ProjectState:
+        """Empty state tracking every artifact the project's readiness and ID index read."""
+        tracked = dict.fromkeys(required)
+        for artifact_name in (*manager.graph.nodes, *CROSS_REFERENCE_ARTIFACTS):
+            tracked.setdefault(artifact_name)
+
+        snapshot = manager.snapshot(artifacts_dir, risk_level, self.cache)
+        self._builds += 1
+        return _ProjectState(key, manager, snapshot, required, tuple(tracked))
+
+    def _refresh(self, state: _ProjectState) -> None:
+        """Load changed artifacts into the project's snapshot and re-evaluate what they affect."""
+        now = time.monotonic()
+        with self._lock:
+            forced, state.dirty = state.dirty, set()
+
+        first = state.readiness is None
+        if first or now - state.checked_at >= self.rescan_interval:
+            candidates = list(state.tracked) + [name for name in forced if name not in state.tracked]
+            with self._lock:
+                self._rescans += 1
+        else:
+            candidates = list(forced)
+
+        changed: List[str] = []
+        for artifact_name in candidates:
+            path = state.snapshot.artifacts_dir / artifact_filename(artifact_name)
+            signature = _file_signature(path)
+            if not first and artifact_name not in forced and signature == state.signatures.get(artifact_name):
+                continue
+
+            # Signature before content: a write racing the read shows up on the next check
+            state.signatures[artifact_name] = signature
+            content = _read_text(path)
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest() if content is not None else None
+            if not first and digest == state.hashes.get(artifact_name):
+                continue
+
+            state.hashes[artifact_name] = digest
+            state.snapshot.update(artifact_name, content)
+            changed.append(artifact_name)
+
+        state.checked_at = now
+        if not first and not changed:
+            return
+
+        manager = state.manager
+        snapshot = state.snapshot
+        artifacts_dir = snapshot.artifacts_dir
+        risk_level = snapshot.risk_level
+
+        # A status depends on its artifact and the artifact's prerequisites,
+        # so a change can only affect the changed artifact and its descendants
+        if first:
+            affected = set(state.required)
+        else:
+            affected = set(changed)
+            for artifact_name in changed:
+                affected |= manager.graph.descendants.get(artifact_name, frozenset())
+
+        previous = state.readiness.statuses if not first else {}
+        statuses: Dict[str, DependencyStatus] = {}
+        reevaluated: List[str] = []
+        for artifact_name in state.required:
+            if artifact_name in affected:
+                statuses[artifact_name] = manager.check_dependencies(
+                    artifact_name, artifacts_dir, risk_level, snapshot
+                )
+                reevaluated.append(artifact_name)
+            else:
+                statuses[artifact_name] = previous[artifact_name]
+
+        if first or any(name in CROSS_REFERENCE_ARTIFACTS for name in changed):
+            cross_reference_issues = manager.check_cross_references(artifacts_dir, risk_level, snapshot)
+            orphaned_references = manager.orphaned_references(artifacts_dir, risk_level, snapshot)
+        else:
+            cross_reference_issues = state.readiness.cross_reference_issues
+            orphaned_references = state.readiness.orphaned_references
+
+        state.readiness = ProjectReadiness(
+            statuses=statuses,
+            cross_reference_issues=cross_reference_issues,
+            orphaned_references=orphaned_references,
+            config_version=manager.config_version,
+            version=1 if first else state.readiness.version + 1,
+            reevaluated=reevaluated
+        )
+
+        with self._lock:
+            self._artifacts_changed += len(changed)
+            self._statuses_reevaluated += len(reevaluated)
+
+
+def _file_signature(path: Path) -> FileSignature:
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """File content, or None if it does not exist."""
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
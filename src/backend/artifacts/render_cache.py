@@ -0,0 +1,198 @@
+"""
+Template Render Cache
+
+Memoizes artifact template output. A template's text depends only on the
+intake answers, the classification (risk level, rigor, rationale), the list
+of required artifacts, the project name and the date; the seven answers
+allow at most 3x3x4x3x3x4x3 = 3,888 combinations.
+
+Each template is rendered once per (artifact, template version, packed
+answers code, classification, required artifacts) with sentinel values for the
+project name and date. The output is kept split at those two slots, so a
+later render for any project only joins the pieces with the name and today's
+date.
+
+Templates must use the project name verbatim and the date as DATE_FORMAT of
+datetime.now() (all templates in artifacts/templates/ do).
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.intake import IntakeRequest, IntakeResponse, encode_answers
+
+
+# Default number of rendered templates kept in memory
+DEFAULT_MAX_ENTRIES = 4096
+
+# Date format used by the templates
+DATE_FORMAT = "%Y-%m-%d"
+
+# Stand-ins rendered in place of the project name and date
+NAME_SENTINEL = "\x00QMS-PROJECT-NAME\x00"
+DATE_SENTINEL = "\x00QMS-DATE\x00"
+SENTINEL_REGEX = re.compile(f"({re.escape(NAME_SENTINEL)}|{re.escape(DATE_SENTINEL)})")
+
+# (artifact_name, template_version, answers code, risk_level, rigor, rationale, artifacts_required)
+RenderKey = Tuple[str, str, int, str, str, str, Tuple[str, ...]]
+
+# Template output split at the slots: text, slot, text, slot, ..., text
+Skeleton = Tuple[str, ...]
+
+TemplateFunction = Callable[[IntakeRequest, IntakeResponse], str]
+
+
+class RenderCache:
+    """LRU cache of rendered templates keyed by answer vector and template version."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize render cache.
+
+        Args:
+            max_entries: Maximum number of rendered templates kept in memory
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[RenderKey, Skeleton]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def render(
+        self,
+        artifact_name: str,
+        template_version: str,
+        generator_func: TemplateFunction,
+        intake_request: IntakeRequest,
+        intake_response: IntakeResponse
+    ) -> str:
+        """
+        Render a template, reusing its output for the same answers and classification.
+
+        Drop-in for generator_func(intake_request, intake_response).
+
+        Args:
+            artifact_name: Artifact the template renders
+            template_version: Changes whenever the template does
+            generator_func: The template's generate() function
+        """
+        classification = intake_response.classification
+        today = _today()
+        if today in classification.rationale:
+            # The date could not be told apart from the rationale text
+            with self._lock:
+                self.bypassed += 1
+            return generator_func(intake_request, intake_response)
+
+        key = (
+            artifact_name,
+            template_version,
+            encode_answers(intake_request.answers),
+            classification.risk_level,
+            classification.rigor,
+            classification.rationale,
+            tuple(intake_response.artifacts_required)
+        )
+
+        with self._lock:
+            skeleton = self._entries.get(key)
+            if skeleton is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if skeleton is None:
+            skeleton = self._render_skeleton(generator_func, intake_request, intake_response)
+            if skeleton is None:
+                return generator_func(intake_request, intake_response)
+            self._store(key, skeleton)
+
+        project_name = intake_request.project_name
+        pieces: List[str] = list(skeleton)
+        for index in range(1, len(pieces), 2):
+            pieces[index] = project_name if pieces[index] == NAME_SENTINEL else today
+        return "".join(pieces)
+
+    def _render_skeleton(
+        self,
+        generator_func: TemplateFunction,
+        intake_request: IntakeRequest,
+        intake_response: IntakeResponse
+    ) -> Optional[Skeleton]:
+        """Template output split at the project name and date, or None if the day changed mid-render."""
+        today = datetime.now().strftime(DATE_FORMAT)
+        content = generator_func(
+            intake_request.model_copy(update={"project_name": NAME_SENTINEL}),
+            intake_response.model_copy(update={"project_name": NAME_SENTINEL})
+        )
+        if datetime.now().strftime(DATE_FORMAT) != today:
+            return None
+
+        return tuple(SENTINEL_REGEX.split(content.replace(today, DATE_SENTINEL)))
+
+    def clear(self) -> None:
+        """Drop all rendered templates (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int | float]:
+        """Hit/miss/eviction counters for the metrics endpoint."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bypassed": self.bypassed,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+    def _store(self, key: RenderKey, skeleton: Skeleton) -> None:
+        """Insert an entry and evict least-recently-used entries over capacity."""
+        with self._lock:
+            self._entries[key] = skeleton
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+# Today's date as the templates write it, and when it stops being today
+_today_value = ""
+_today_expires = 0.0
+
+
+def _today() -> str:
+    """datetime.now().strftime(DATE_FORMAT), recomputed only after local midnight."""
+    global _today_value, _today_expires
+    if time.time() >= _today_expires:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _today_value = now.strftime(DATE_FORMAT)
+        _today_expires = midnight.timestamp()
+    return _today_value
+
+
+# Global cache instance
+_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """Get or create render cache singleton."""
+    global _cache
+    if _cache is None:
+        _cache = RenderCache()
+    return _cache
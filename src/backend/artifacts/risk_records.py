@@ -0,0 +1,320 @@
+"""
+Risk Register Records - Phase 8A WS-1
+Single-pass parse of a Risk Register into typed per-risk records.
+
+Risk validation used to count IDs with one regex and then search the whole
+document once per required field, which could not tell which risk was
+missing which field. The parser walks the lines once and groups every field
+under the risk it belongs to, so validation, cross-reference checks and the
+risks endpoint all work from the same records.
+
+Recognized forms (all may be mixed in one document):
+
+    ### R-001: Outage                  <- heading (body runs to the next heading
+    **Likelihood:** High                   of the same or higher level)
+    **Mitigation:**
+    1. Failover                        <- multi-line value when the label line is empty
+
+    - R-002: Data loss                 <- list item (body runs while indented)
+      - Owner: DBA team
+
+    | ID | Risk | Likelihood | Owner |  <- table with an ID column, one risk per row
+    |----|------|------------|-------|
+    | R-003 | Vendor lock-in | Low | CTO |
+
+A risk mentioned more than once (e.g. a detailed section and a summary table)
+is one record; later mentions only fill fields that are still empty.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .markdown_tree import MarkdownTree, parse_markdown
+
+
+# Record fields, in display order ("id" is always present)
+RISK_FIELDS = ("id", "description", "likelihood", "impact", "score", "mitigation", "owner", "status")
+
+# Labels (lowercase, parentheticals removed) accepted for each field
+FIELD_ALIASES = {
+    "description": "description",
+    "risk description": "description",
+    "likelihood": "likelihood",
+    "probability": "likelihood",
+    "impact": "impact",
+    "severity": "impact",
+    "consequence": "impact",
+    "score": "score",
+    "risk score": "score",
+    "mitigation": "mitigation",
+    "mitigations": "mitigation",
+    "mitigation strategy": "mitigation",
+    "mitigation plan": "mitigation",
+    "owner": "owner",
+    "risk owner": "owner",
+    "status": "status",
+    # Table columns only
+    "risk": "title",
+    "title": "title",
+    "name": "title",
+}
+
+# Risk ID at the start of a line (optionally after a heading, list marker or bold)
+RECORD_START_REGEX = re.compile(
+    r'^(?P<prefix>#{1,6}[ \t]+|[ \t]*(?:[-*+]|\d+\.)[ \t]+)?(?:\*\*)?(?:Risk[- ])?(?P<id>[A-Z]-?\d{3})',
+    re.IGNORECASE
+)
+
+# Risk ID as a whole table cell
+ID_CELL_REGEX = re.compile(r'^(?:\*\*)?(?:Risk[- ])?([A-Z]-?\d{3})(?:\*\*)?$', re.IGNORECASE)
+
+# "**Label:** value", "**Label**: value", "- Label: value"
+FIELD_LINE_REGEX = re.compile(
+    r'^[ \t]*(?:[-*+][ \t]+)?(?:\*\*(?P<bold>[^*\n]+?)\*\*[ \t]*:?|(?P<plain>[A-Za-z][A-Za-z ]*?)[ \t]*:)(?P<value>.*)$'
+)
+
+HEADING_REGEX = re.compile(r'^(#{1,6})[ \t]+(.*)$')
+TABLE_SEPARATOR_REGEX = re.compile(r'^\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$')
+LEADING_NUMBER_REGEX = re.compile(r'^[\s*]*(-?\d+(?:\.\d+)?)')
+
+
+class RiskRecord(BaseModel):
+    """One risk from a Risk Register."""
+    risk_id: str = Field(description="Risk ID, uppercased (e.g., R-001)")
+    title: Optional[str] = Field(default=None, description="Short name from the heading or table row")
+    description: Optional[str] = None
+    likelihood: Optional[str] = None
+    impact: Optional[str] = None
+    score: Optional[str] = None
+    score_value: Optional[float] = Field(default=None, description="Numeric score, if score starts with a number")
+    mitigation: Optional[str] = None
+    owner: Optional[str] = None
+    status: Optional[str] = None
+    line: int = Field(description="1-based line where the risk is first defined")
+
+    def fields_present(self) -> List[str]:
+        """Record fields (RISK_FIELDS) that have a value."""
+        return [field for field in RISK_FIELDS if field == "id" or getattr(self, field)]
+
+    def missing_fields(self, required_fields: Iterable[str]) -> List[str]:
+        """Required fields this risk does not fill (unknown field names count as missing)."""
+        present = set(self.fields_present())
+        return [field for field in required_fields if field not in present]
+
+
+def normalize_label(label: str) -> Optional[str]:
+    """Map a field label to a record attribute, or None if it is not a risk field."""
+    label = label.strip().rstrip(':').strip()
+    label = re.sub(r'\s*\(.*\)\s*$', '', label)
+    label = ' '.join(label.lower().split())
+    return FIELD_ALIASES.get(label)
+
+
+class _RecordBuilder:
+    """Accumulates one mention of a risk while its lines are being scanned."""
+
+    def __init__(self, risk_id: str, line: int, title: Optional[str]):
+        self.risk_id = risk_id
+        self.line = line
+        self.values: Dict[str, str] = {}
+        if title:
+            self.values["title"] = title
+        self._pending: Optional[str] = None  # Field whose value continues on the next lines
+        self._pending_lines: List[str] = []
+
+    def set(self, field: str, value: str) -> None:
+        """Set a field from a label line; an empty value continues on following lines."""
+        self.flush()
+        value = value.strip()
+        if value:
+            self.values.setdefault(field, value)
+        else:
+            self._pending = field
+
+    def continue_value(self, line: str) -> None:
+        """Add a body line to the pending multi-line value (a blank line ends it)."""
+        if self._pending is None:
+            return
+        if not line.strip() or line.strip() == '---':
+            if self._pending_lines:
+                self.flush()
+            return
+        self._pending_lines.append(line.rstrip())
+
+    def flush(self) -> None:
+        """Close the pending multi-line value."""
+        if self._pending is not None and self._pending_lines:
+            self.values.setdefault(self._pending, '\n'.join(self._pending_lines).strip())
+        self._pending = None
+        self._pending_lines = []
+
+
+def parse_risk_records(tree: MarkdownTree) -> List[RiskRecord]:
+    """
+    Split a Risk Register into per-risk records in one pass over its lines.
+
+    Returns:
+        Records in order of first mention, one per distinct risk ID
+    """
+    lines = tree.lines
+    merged: Dict[str, RiskRecord] = {}
+    order: List[str] = []
+
+    def finish(builder: Optional[_RecordBuilder]) -> None:
+        if builder is None:
+            return
+        builder.flush()
+        values = builder.values
+        record = merged.get(builder.risk_id)
+        if record is None:
+            record = RiskRecord(risk_id=builder.risk_id, line=builder.line + 1)
+            merged[builder.risk_id] = record
+            order.append(builder.risk_id)
+        for field, value in values.items():
+            if getattr(record, field) is None:
+                setattr(record, field, value)
+        if record.score is not None and record.score_value is None:
+            number = LEADING_NUMBER_REGEX.match(record.score)
+            if number:
+                record.score_value = float(number.group(1))
+
+    current: Optional[_RecordBuilder] = None
+    current_level = 0     # Heading level of the current record (0 for list/plain records)
+    current_indent = -1   # Marker indent of a list record (-1 if not a list record)
+    table_columns: Optional[List[Optional[str]]] = None  # Field per column of the current risk table
+
+    i = 0
+    line_count = len(lines)
+    while i < line_count:
+        line = lines[i]
+
+        # Tables: a header row with an ID column, then one risk per row
+        if line.startswith('|'):
+            if table_columns is None and i + 1 < line_count and TABLE_SEPARATOR_REGEX.match(lines[i + 1]):
+                columns = [_column_field(cell) for cell in _split_row(line)]
+                if "id" in columns:
+                    finish(current)
+                    current = None
+                    table_columns = columns
+                    i += 2
+                    continue
+            elif table_columns is not None:
+                finish(_table_record(_split_row(line), table_columns, i))
+                i += 1
+                continue
+        else:
+            table_columns = None
+
+        heading = HEADING_REGEX.match(line)
+        start = RECORD_START_REGEX.match(line)
+
+        if start is not None and not line.startswith('|'):
+            finish(current)
+            prefix = start.group("prefix") or ""
+            title = _clean_title(line[start.end():])
+            current = _RecordBuilder(start.group("id").upper(), i, title)
+            current_level = len(prefix) - len(prefix.lstrip('#')) if prefix.startswith('#') else 0
+            stripped = prefix.lstrip()
+            current_indent = len(prefix) - len(stripped) if stripped[:1] in ('-', '*', '+') or stripped[:1].isdigit() else -1
+            i += 1
+            continue
+
+        if current is not None:
+            if heading is not None:
+                level = len(heading.group(1))
+                if current_level == 0 or level <= current_level:
+                    finish(current)
+                    current = None
+                else:
+                    field = normalize_label(heading.group(2))
+                    if field is not None:
+                        current.set(field, "")
+                    else:
+                        current.flush()
+                i += 1
+                continue
+
+            if current_indent >= 0 and line.strip() and len(line) - len(line.lstrip()) <= current_indent:
+                # Back at (or left of) the list marker: the list item has ended
+                finish(current)
+                current = None
+                i += 1
+                continue
+
+            field_line = FIELD_LINE_REGEX.match(line)
+            field = None
+            if field_line is not None:
+                field = normalize_label(field_line.group("bold") or field_line.group("plain"))
+            if field is not None and field != "title":
+                current.set(field, field_line.group("value"))
+            else:
+                current.continue_value(line)
+
+        i += 1
+
+    finish(current)
+    return [merged[risk_id] for risk_id in order]
+
+
+def parse_risk_register(text: str) -> List[RiskRecord]:
+    """Parse Risk Register markdown into per-risk records."""
+    return parse_risk_records(parse_markdown(text))
+
+
+def _split_row(line: str) -> List[str]:
+    """Cells of a markdown table row."""
+    cells = line.strip().strip('|').split('|')
+    return [cell.strip() for cell in cells]
+
+
+def _column_field(header: str) -> Optional[str]:
+    """Record field for a table header cell ("ID" columns map to "id")."""
+    label = ' '.join(header.strip().strip('*').lower().split())
+    if label in ("id", "risk id", "#"):
+        return "id"
+    return normalize_label(label)
+
+
+def _table_record(cells: List[str], columns: List[Optional[str]], line: int) -> Optional[_RecordBuilder]:
+    """Record builder for a table row, or None if the row has no risk ID."""
+    values: Dict[str, str] = {}
+    risk_id = None
+    for field, cell in zip(columns, cells):
+        if field == "id":
+            match = ID_CELL_REGEX.match(cell)
+            if match:
+                risk_id = match.group(1).upper()
+        elif field is not None and cell:
+            values.setdefault(field, cell)
+
+    if risk_id is None:
+        return None
+
+    builder = _RecordBuilder(risk_id, line, None)
+    builder.values.update(values)
+    return builder
+
+
+def _clean_title(rest: str) -> Optional[str]:
+    """Title text after a risk ID ("R-001: Outage" -> "Outage")."""
+    title = rest.strip().strip('*').strip()
+    title = title.lstrip(':-–—').strip().strip('*').strip()
+    return title or None
+
+
+def records_by_id(records: List[RiskRecord]) -> Dict[str, RiskRecord]:
+    """Index records by risk ID."""
+    return {record.risk_id: record for record in records}
+
+
+def missing_fields_by_risk(records: List[RiskRecord], required_fields: Iterable[str]) -> List[Tuple[str, List[str]]]:
+    """(risk_id, missing fields) for every risk missing at least one required field."""
+    required_fields = list(required_fields)
+    result = []
+    for record in records:
+        missing = record.missing_fields(required_fields)
+        if missing:
+            result.append((record.risk_id, missing))
+    return result
@@ -0,0 +1,160 @@
+"""
+Compiled Rule Plans - Phase 8A WS-1
+Acceptance criteria compiled into an ordered list of checks per (artifact, risk level).
+
+ArtifactValidator compiles acceptance_criteria.json once at load time. Each
+plan holds the checks that apply, in execution order, with thresholds and
+regexes already bound, so validating an artifact is just running the plan
+against its section tree. Unknown rule keys are rejected at compile time
+instead of being silently ignored at request time.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Keys allowed at each level of acceptance_criteria.json
+ARTIFACT_KEYS = {"description", "risk_levels"}
+RISK_LEVEL_KEYS = {"rules", "required_sections"}
+
+# Rule keys in execution order (matches the order issues have always been reported in)
+RULE_KEYS = (
+    "warning_only",
+    "placeholders_allowed",
+    "placeholders_not_allowed",
+    "min_sections_present",
+    "min_risks",
+    "required_fields",
+    "min_content_length",
+    "min_items",
+    "min_metrics",
+    "min_assumptions",
+    "min_entries",
+    "has_header",
+    "has_structure",
+)
+
+# Rule keys only implemented for the Risk Register
+RISK_REGISTER_RULE_KEYS = {"min_risks", "required_fields"}
+
+
+class UnknownRuleError(ValueError):
+    """Acceptance criteria contain a key the validator does not implement."""
+    pass
+
+
+class RuleStep:
+    """One compiled check: a rule name, its bound parameters, and the callable that runs it."""
+
+    def __init__(self, rule: str, params: Dict[str, Any], check: Callable):
+        """
+        Initialize rule step.
+
+        Args:
+            rule: Rule name (criteria key, or "placeholders"/"required_sections"/"risk_register")
+            params: Thresholds and options bound into the check (for inspection)
+            check: Callable taking a MarkdownTree and returning a list of ValidationIssue
+        """
+        self.rule = rule
+        self.params = params
+        self.check = check
+
+    def describe(self) -> Dict[str, Any]:
+        """JSON-serializable description of this step."""
+        return {"rule": self.rule, "params": self.params}
+
+
+class RulePlan:
+    """Ordered checks for one (artifact_name, risk_level)."""
+
+    def __init__(
+        self,
+        artifact_name: str,
+        risk_level: str,
+        steps: List[RuleStep],
+        required_sections: List[str],
+        warning_only: bool,
+        criteria_version: Optional[str] = None
+    ):
+        """
+        Initialize rule plan.
+
+        Args:
+            artifact_name: Artifact this plan validates
+            risk_level: Risk level this plan validates against
+            steps: Checks in execution order
+            required_sections: Required section names (used for the completion penalty)
+            warning_only: True if every issue is reported as a warning (R0/R1 teaching mode)
+            criteria_version: Version of the acceptance criteria compiled into this plan
+        """
+        self.artifact_name = artifact_name
+        self.risk_level = risk_level
+        self.steps = steps
+        self.required_sections = required_sections
+        self.warning_only = warning_only
+        self.criteria_version = criteria_version
+
+    def run(self, tree) -> Tuple[List, List[str]]:
+        """
+        Execute every step against a parsed artifact.
+
+        Returns:
+            (issues, missing_sections)
+        """
+        issues = []
+        missing_sections: List[str] = []
+
+        for step in self.steps:
+            step_issues = step.check(tree)
+            if step.rule == "required_sections":
+                missing_sections = [issue.section for issue in step_issues]
+            issues.extend(step_issues)
+
+        return issues, missing_sections
+
+    def describe(self) -> Dict[str, Any]:
+        """JSON-serializable description of the plan (for debugging)."""
+        return {
+            "artifact_name": self.artifact_name,
+            "risk_level": self.risk_level,
+            "criteria_version": self.criteria_version,
+            "warning_only": self.warning_only,
+            "required_sections": self.required_sections,
+            "steps": [step.describe() for step in self.steps]
+        }
+
+
+def check_criteria_keys(artifact_name: str, artifact_criteria: Dict) -> None:
+    """
+    Reject keys the validator does not understand.
+
+    Raises:
+        UnknownRuleError: If any artifact, risk-level or rule key is unknown, or a
+            Risk Register-only rule is configured for another artifact
+    """
+    unknown = set(artifact_criteria) - ARTIFACT_KEYS
+    if unknown:
+        raise UnknownRuleError(
+            f"Unknown key(s) {sorted(unknown)} in acceptance criteria for {artifact_name}"
+        )
+
+    for risk_level, risk_criteria in artifact_criteria.get("risk_levels", {}).items():
+        unknown = set(risk_criteria) - RISK_LEVEL_KEYS
+        if unknown:
+            raise UnknownRuleError(
+                f"Unknown key(s) {sorted(unknown)} in acceptance criteria for {artifact_name} {risk_level}"
+            )
+
+        rules = risk_criteria.get("rules", {})
+        unknown = set(rules) - set(RULE_KEYS)
+        if unknown:
+            raise UnknownRuleError(
+                f"Unknown rule(s) {sorted(unknown)} in acceptance criteria for {artifact_name} {risk_level}"
+            )
+
+        if artifact_name != "Risk Register":
+            unsupported = set(rules) & RISK_REGISTER_RULE_KEYS
+            if unsupported:
+                raise UnknownRuleError(
+                    f"Rule(s) {sorted(unsupported)} only apply to Risk Register, "
+                    f"found in acceptance criteria for {artifact_name} {risk_level}"
+                )
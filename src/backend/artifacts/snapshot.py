@@ -0,0 +1,198 @@
+"""
+Project Snapshot - Phase 8A WS-2
+Read-once, validate-once view of a project's artifacts for a single request.
+
+Dependency health and next actions look at the same artifacts many times
+(each artifact as itself, as a prerequisite of up to three others, and again
+for cross-references). A snapshot memoizes file contents, WS-1 validation
+results and extracted IDs so each QMS-*.md is read, validated and scanned at
+most once per request.
+
+A per-request snapshot is never invalidated - build a new one per request.
+The readiness engine keeps one snapshot per project across requests and
+swaps in changed artifacts with update().
+
+With the directory's artifact manifest, an artifact still exactly as
+generated (checked with one stat) is looked up in the validation cache by
+its recorded hash and is not read at all unless its content is needed.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .id_index import CTQ_ID_REGEX, RISK_ID_REGEX, IdOccurrence, ProjectIdIndex, scan_artifact
+from .manifest import ArtifactManifest, ManifestEntry
+from .markdown_tree import parse_markdown
+from .risk_records import RiskRecord, parse_risk_records
+from .validator import ArtifactValidator, ValidationResult
+
+
+def artifact_filename(artifact_name: str) -> str:
+    """Convert artifact name to filename (e.g., 'Risk Register' -> 'QMS-Risk-Register.md')."""
+    return f"QMS-{artifact_name.replace(' ', '-')}.md"
+
+
+def extract_risk_ids(content: str) -> Set[str]:
+    """Extract risk IDs from content (e.g., R-001, RISK-001)."""
+    return set(m.upper() for m in RISK_ID_REGEX.findall(content))
+
+
+def extract_ctq_ids(content: str) -> Set[str]:
+    """Extract CTQ IDs from content (e.g., CTQ-001, CTQ-1)."""
+    return set(m.upper() for m in CTQ_ID_REGEX.findall(content))
+
+
+class ProjectSnapshot:
+    """
+    Memoized view of one project's artifacts at one risk level.
+
+    Every accessor is lazy: an artifact is only read when first asked for,
+    and never read, validated or scanned twice.
+    """
+
+    def __init__(
+        self,
+        artifacts_dir: Path,
+        risk_level: str,
+        validator: ArtifactValidator,
+        cache=None,
+        manifest: Optional[ArtifactManifest] = None
+    ):
+        """
+        Initialize snapshot.
+
+        Args:
+            artifacts_dir: Directory containing QMS-*.md files
+            risk_level: Risk level artifacts are validated against (R0-R3)
+            validator: WS-1 validator used for every artifact in this snapshot
+            cache: Cross-request validation result cache (optional, anything with
+                validate(validator, artifact_name, content, risk_level) and
+                lookup(validator, artifact_name, content_sha256, risk_level, size))
+            manifest: Artifact manifest of artifacts_dir (optional)
+        """
+        self.artifacts_dir = Path(artifacts_dir)
+        self.risk_level = risk_level
+        self.validator = validator
+        self.cache = cache
+        self.manifest = manifest
+
+        self._verified: Dict[str, Optional[ManifestEntry]] = {}
+        self._contents: Dict[str, Optional[str]] = {}
+        self._results: Dict[str, Optional[ValidationResult]] = {}
+        self._risk_ids: Dict[str, Set[str]] = {}
+        self._ctq_ids: Dict[str, Set[str]] = {}
+        self._risk_records: Optional[List[RiskRecord]] = None
+        self._id_occurrences: Dict[str, List[IdOccurrence]] = {}
+        self._id_indexes: Dict[Tuple[str, ...], ProjectIdIndex] = {}
+
+    def content(self, artifact_name: str) -> Optional[str]:
+        """Artifact markdown content, or None if the file does not exist."""
+        if artifact_name not in self._contents:
+            path = self.artifacts_dir / artifact_filename(artifact_name)
+            try:
+                with open(path, 'r') as f:
+                    self._contents[artifact_name] = f.read()
+            except FileNotFoundError:
+                self._contents[artifact_name] = None
+        return self._contents[artifact_name]
+
+    def update(self, artifact_name: str, content: Optional[str]) -> None:
+        """Replace an artifact's content (None if deleted) and forget what was derived from it."""
+        self._contents[artifact_name] = content
+        self._verified.pop(artifact_name, None)
+        self._results.pop(artifact_name, None)
+        self._risk_ids.pop(artifact_name, None)
+        self._ctq_ids.pop(artifact_name, None)
+        self._id_occurrences.pop(artifact_name, None)
+        self._id_indexes.clear()
+        if artifact_name == "Risk Register":
+            self._risk_records = None
+
+    def exists(self, artifact_name: str) -> bool:
+        """True if the artifact file exists."""
+        if self._manifest_entry(artifact_name) is not None:
+            return True
+        return self.content(artifact_name) is not None
+
+    def content_length(self, artifact_name: str) -> int:
+        """Artifact content length in characters (0 if it does not exist)."""
+        entry = self._manifest_entry(artifact_name)
+        if entry is not None:
+            return entry.length
+        content = self.content(artifact_name)
+        return len(content) if content is not None else 0
+
+    def validation(self, artifact_name: str) -> Optional[ValidationResult]:
+        """WS-1 validation result for the artifact, or None if it does not exist."""
+        if artifact_name not in self._results and self.cache is not None:
+            entry = self._manifest_entry(artifact_name)
+            if entry is not None:
+                result = self.cache.lookup(
+                    self.validator, artifact_name, entry.sha256, self.risk_level, entry.size
+                )
+                if result is not None:
+                    self._results[artifact_name] = result
+
+        if artifact_name not in self._results:
+            content = self.content(artifact_name)
+            if content is None:
+                self._results[artifact_name] = None
+            elif self.cache is not None:
+                self._results[artifact_name] = self.cache.validate(
+                    self.validator, artifact_name, content, self.risk_level
+                )
+            else:
+                self._results[artifact_name] = self.validator.validate_artifact(
+                    artifact_name, content, self.risk_level
+                )
+        return self._results[artifact_name]
+
+    def _manifest_entry(self, artifact_name: str) -> Optional[ManifestEntry]:
+        """Manifest entry of an artifact not read yet whose file is unchanged since generation."""
+        if self.manifest is None or artifact_name in self._contents:
+            return None
+        if artifact_name not in self._verified:
+            self._verified[artifact_name] = self.manifest.verified_entry(artifact_name, self.artifacts_dir)
+        return self._verified[artifact_name]
+
+    def risk_ids(self, artifact_name: str) -> Set[str]:
+        """Risk IDs mentioned in the artifact (empty if it does not exist)."""
+        if artifact_name not in self._risk_ids:
+            content = self.content(artifact_name)
+            self._risk_ids[artifact_name] = extract_risk_ids(content) if content is not None else set()
+        return self._risk_ids[artifact_name]
+
+    def ctq_ids(self, artifact_name: str) -> Set[str]:
+        """CTQ IDs mentioned in the artifact (empty if it does not exist)."""
+        if artifact_name not in self._ctq_ids:
+            content = self.content(artifact_name)
+            self._ctq_ids[artifact_name] = extract_ctq_ids(content) if content is not None else set()
+        return self._ctq_ids[artifact_name]
+
+    def risk_records(self) -> List[RiskRecord]:
+        """Per-risk records parsed from the Risk Register (empty if it does not exist)."""
+        if self._risk_records is None:
+            content = self.content("Risk Register")
+            self._risk_records = parse_risk_records(parse_markdown(content)) if content is not None else []
+        return self._risk_records
+
+    def id_occurrences(self, artifact_name: str) -> List[IdOccurrence]:
+        """Risk and CTQ ID mentions in the artifact with locations (empty if it does not exist)."""
+        if artifact_name not in self._id_occurrences:
+            content = self.content(artifact_name)
+            if content is None:
+                self._id_occurrences[artifact_name] = []
+            else:
+                records = self.risk_records() if artifact_name == "Risk Register" else None
+                self._id_occurrences[artifact_name] = scan_artifact(artifact_name, content, records)
+        return self._id_occurrences[artifact_name]
+
+    def id_index(self, artifact_names: Iterable[str]) -> ProjectIdIndex:
+        """ID index over the given artifacts (each artifact scanned once per content)."""
+        key = tuple(artifact_names)
+        if key not in self._id_indexes:
+            self._id_indexes[key] = ProjectIdIndex(
+                {name: self.id_occurrences(name) for name in key if self.exists(name)},
+                self.risk_records()
+            )
+        return self._id_indexes[key]
@@ -10,12 +10,90 @@ Design Principles:
 - NO cross-artifact validation (deferred to WS-2)
 """
 
+import hashlib
 import json
+import os
 import re
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
 from pydantic import BaseModel
 
+from .manifest import ArtifactManifest
+from .markdown_tree import MarkdownTree, parse_markdown
+from .placeholder_scanner import PlaceholderScanner
+from .risk_records import missing_fields_by_risk, parse_risk_records
+from .rule_plan import RulePlan, RuleStep, check_criteria_keys
+
+
+# Default acceptance criteria shipped alongside the validator
+DEFAULT_CRITERIA_PATH = Path(__file__).parent / "acceptance_criteria.json"
+
+# Risks listed by name in the missing-fields warning (the rest are counted)
+MAX_RISKS_LISTED = 10
+
+# Measurement Plan metric definitions (each pattern is counted separately)
+METRIC_REGEXES = [
+    re.compile(r'\*\*.*?Metric.*?\*\*:', re.IGNORECASE | re.MULTILINE),  # **Some Metric**:
+    re.compile(r'Metric \d+:', re.IGNORECASE | re.MULTILINE),  # Metric 1:
+    re.compile(r'^\s*-\s+.*?:.*?(target|baseline|threshold)', re.IGNORECASE | re.MULTILINE),  # List items with targets
+]
+
+# Assumptions Register entries (numbered or bulleted assumptions)
+ASSUMPTION_REGEX = re.compile(
+    r'(?:^|\n)(?:[\s]*(?:[-*]|\d+\.)\s+)(?:Assumption|ASS-\d+|A-\d+)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def config_signature(paths: Iterable[Path]) -> Tuple:
+    """
+    Cheap change detector for configuration files: (path, mtime_ns, size) per file.
+
+    Missing files are recorded as (path, None, None) so that creating or
+    deleting a file also counts as a change.
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def config_version(*contents: bytes) -> str:
+    """Short, stable version stamp for the raw bytes of one or more configuration files."""
+    digest = hashlib.sha256()
+    for content in contents:
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()[:12]
+
+
+# Version of the validation code (computed once per process)
+_rules_version: Optional[str] = None
+
+
+def rules_version() -> str:
+    """
+    Version of the validation code: sha256 of the source of this module and
+    every module it validates with (rule plans, Markdown tree, placeholder
+    scanner, risk records).
+
+    Unlike config_version, this changes when the validator's code changes
+    with the criteria file untouched.
+    """
+    global _rules_version
+    if _rules_version is None:
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        for obj in (RulePlan, parse_markdown, PlaceholderScanner, parse_risk_records):
+            digest.update(Path(sys.modules[obj.__module__].__file__).read_bytes())
+        _rules_version = digest.hexdigest()[:12]
+    return _rules_version
+
 
 class ValidationIssue(BaseModel):
     """A single validation issue found in an artifact."""
@@ -34,6 +112,7 @@ class ValidationResult(BaseModel):
     issues: List[ValidationIssue]
     missing_sections: List[str]
     placeholder_count: int
+    criteria_version: Optional[str] = None  # acceptance_criteria.json version this was validated against
 
 
 class ArtifactValidator:
@@ -47,6 +126,9 @@ class ArtifactValidator:
     - Section presence
     - Risk-specific validation (Risk Register, CTQ Tree, Measurement Plan, etc.)
     - NO cross-artifact validation (deferred to WS-2)
+
+    Instances are treated as read-only once built so a single validator can
+    be shared across requests (see get_artifact_validator).
     """
 
     def __init__(self, criteria_path: Optional[Path] = None):
@@ -57,29 +139,28 @@ class ArtifactValidator:
             criteria_path: Path to acceptance_criteria.json (defaults to same directory)
         """
         if criteria_path is None:
-            criteria_path = Path(__file__).parent / "acceptance_criteria.json"
-
-        with open(criteria_path, 'r') as f:
-            self.criteria = json.load(f)
-
-        # Placeholder patterns to detect
-        self.placeholder_patterns = [
-            r'\[Name\]',
-            r'\[Description\]',
-            r'\[.*?\]',  # Any [bracketed text]
-            r'TBD',
-            r'To be determined',
-            r'TODO',
-            r'FIXME',
-            r'XXX',
-            r'<placeholder>',
-            r'\{.*?\}',  # Any {braced text} that looks like a placeholder
-        ]
-
-        self.placeholder_regex = re.compile(
-            '|'.join(self.placeholder_patterns),
-            re.IGNORECASE
-        )
+            criteria_path = DEFAULT_CRITERIA_PATH
+
+        with open(criteria_path, 'rb') as f:
+            raw = f.read()
+
+        self.criteria_path = Path(criteria_path)
+        self.criteria = json.loads(raw)
+        self.config_version = config_version(raw)
+        self.rules_version = rules_version()
+
+        # Placeholders are found by a linear-time scanner (see placeholder_scanner.py)
+        self.placeholder_scanner = PlaceholderScanner()
+
+        # Compile the criteria into one rule plan per (artifact, risk level);
+        # unknown rule keys fail here rather than being ignored per request
+        self.plans: Dict[Tuple[str, str], RulePlan] = {}
+        for artifact_name, artifact_criteria in self.criteria["artifacts"].items():
+            check_criteria_keys(artifact_name, artifact_criteria)
+            for risk_level, risk_criteria in artifact_criteria.get("risk_levels", {}).items():
+                self.plans[(artifact_name, risk_level)] = self._compile_plan(
+                    artifact_name, risk_level, risk_criteria
+                )
 
     def validate_artifact(
         self,
@@ -98,9 +179,11 @@ class ArtifactValidator:
         Returns:
             ValidationResult with validation details
         """
-        # Check if artifact has acceptance criteria defined
-        if artifact_name not in self.criteria["artifacts"]:
-            # No criteria defined - consider valid for now (R0/R1)
+        plan = self.plans.get((artifact_name, risk_level))
+
+        if plan is None:
+            # No criteria defined for this artifact, or risk level not covered
+            # (likely R0/R1) - consider valid
             return ValidationResult(
                 artifact_name=artifact_name,
                 risk_level=risk_level,
@@ -108,176 +191,207 @@ class ArtifactValidator:
                 completion_percent=1.0,
                 issues=[],
                 missing_sections=[],
-                placeholder_count=0
+                placeholder_count=0,
+                criteria_version=self.config_version
             )
 
-        artifact_criteria = self.criteria["artifacts"][artifact_name]
+        # Parse once; every step of the plan queries the section tree
+        tree = parse_markdown(content, self.placeholder_scanner)
+        issues, missing_sections = plan.run(tree)
 
-        # Check if risk level has criteria
-        if risk_level not in artifact_criteria.get("risk_levels", {}):
-            # Risk level not covered (likely R0/R1) - consider valid
-            return ValidationResult(
-                artifact_name=artifact_name,
-                risk_level=risk_level,
-                valid=True,
-                completion_percent=1.0,
-                issues=[],
-                missing_sections=[],
-                placeholder_count=0
-            )
+        # WS-1.7: Always count placeholders (for informational purposes)
+        placeholder_count = tree.placeholder_count
 
-        risk_criteria = artifact_criteria["risk_levels"][risk_level]
-        issues: List[ValidationIssue] = []
+        # Calculate completion percentage
+        completion_percent = self._calculate_completion(
+            issues=issues,
+            placeholder_count=placeholder_count,
+            missing_sections=missing_sections,
+            num_required_sections=len(plan.required_sections)
+        )
 
-        # WS-1.7: Check if warning-only mode (R0/R1 teaching-oriented validation)
-        warning_only = risk_criteria.get("rules", {}).get("warning_only", False)
+        # Determine if valid (no errors)
+        valid = all(issue.severity != "error" for issue in issues)
+
+        return ValidationResult(
+            artifact_name=artifact_name,
+            risk_level=risk_level,
+            valid=valid,
+            completion_percent=completion_percent,
+            issues=issues,
+            missing_sections=missing_sections,
+            placeholder_count=placeholder_count,
+            criteria_version=self.config_version
+        )
+
+    def get_rule_plan(self, artifact_name: str, risk_level: str) -> Optional[RulePlan]:
+        """Compiled rule plan for an artifact at a risk level (None if no criteria apply)."""
+        return self.plans.get((artifact_name, risk_level))
 
-        # 1. Check for placeholders
+    def _compile_plan(
+        self,
+        artifact_name: str,
+        risk_level: str,
+        risk_criteria: Dict
+    ) -> RulePlan:
+        """
+        Compile one (artifact, risk level) entry of the criteria into a RulePlan.
+
+        Steps are added in the order rules have always been checked in, with
+        thresholds and regexes bound up front.
+        """
         rules = risk_criteria.get("rules", {})
+        required_sections = list(risk_criteria.get("required_sections", []))
 
-        # WS-1.7: Always count placeholders (for informational purposes)
-        placeholder_count = len(self.placeholder_regex.findall(content))
+        # WS-1.7: Check if warning-only mode (R0/R1 teaching-oriented validation)
+        warning_only = rules.get("warning_only", False)
+        severity = "warning" if warning_only else "error"
 
-        # WS-1.7: Check placeholders (handle both placeholders_not_allowed and placeholders_allowed)
-        placeholders_not_allowed = rules.get("placeholders_not_allowed", False)
-        placeholders_allowed = rules.get("placeholders_allowed", False)
+        steps: List[RuleStep] = []
 
-        # If placeholders explicitly NOT allowed, raise an issue
-        if placeholders_not_allowed and not placeholders_allowed:
-            if placeholder_count > 0:
-                severity = "warning" if warning_only else "error"
-                issues.append(ValidationIssue(
-                    severity=severity,
-                    section=None,
-                    message=f"Found {placeholder_count} placeholder(s) that must be filled in",
-                    suggestion="Replace all [bracketed], TBD, and TODO placeholders with actual content"
-                ))
+        # 1. Placeholders (handle both placeholders_not_allowed and placeholders_allowed)
+        if rules.get("placeholders_not_allowed", False) and not rules.get("placeholders_allowed", False):
+            steps.append(RuleStep(
+                "placeholders", {},
+                partial(self._validate_placeholders, severity=severity)
+            ))
+
+        # 2. Required sections
+        if required_sections:
+            steps.append(RuleStep(
+                "required_sections", {"sections": required_sections},
+                partial(self._validate_required_sections, sections=required_sections, severity=severity)
+            ))
 
-        # 2. Check for required sections
-        missing_sections = []
-        if "required_sections" in risk_criteria:
-            for section in risk_criteria["required_sections"]:
-                if not self._section_exists(content, section):
-                    missing_sections.append(section)
-                    severity = "warning" if warning_only else "error"
-                    issues.append(ValidationIssue(
-                        severity=severity,
-                        section=section,
-                        message=f"Required section '{section}' is missing or empty",
-                        suggestion=f"Add a '{section}' section with appropriate content"
-                    ))
-
-        # 3. Check minimum sections present (if specified)
-        min_sections = risk_criteria.get("rules", {}).get("min_sections_present")
+        # 3. Minimum sections present
+        min_sections = rules.get("min_sections_present")
         if min_sections:
-            section_count = self._count_sections(content)
-            if section_count < min_sections:
-                severity = "warning" if warning_only else "error"
-                issues.append(ValidationIssue(
-                    severity=severity,
-                    section=None,
-                    message=f"Expected at least {min_sections} sections, found {section_count}",
-                    suggestion="Add more detailed sections to meet minimum requirements"
-                ))
+            steps.append(RuleStep(
+                "min_sections_present", {"min": min_sections},
+                partial(self._validate_min_sections, min_sections=min_sections, severity=severity)
+            ))
 
         # 4. Artifact-specific validation (WS-1.9.1)
         if artifact_name == "Risk Register":
-            risk_issues = self._validate_risk_register(content, risk_criteria, warning_only)
-            issues.extend(risk_issues)
+            min_risks = rules.get("min_risks", 0)
+            required_fields = rules.get("required_fields", [])
+            steps.append(RuleStep(
+                "risk_register", {"min_risks": min_risks, "required_fields": required_fields},
+                partial(
+                    self._validate_risk_register,
+                    min_risks=min_risks,
+                    required_fields=required_fields,
+                    severity=severity
+                )
+            ))
 
-        # WS-1.9.1: New artifact-specific validations
-        # Check for rules that apply to this artifact
+        # WS-1.9.1: Threshold rules, present only for the artifacts they apply to
         if "min_content_length" in rules:
-            min_length_issues = self._validate_min_content_length(content, rules, warning_only)
-            issues.extend(min_length_issues)
+            steps.append(RuleStep(
+                "min_content_length", {"min": rules["min_content_length"]},
+                partial(self._validate_min_content_length, min_length=rules["min_content_length"], severity=severity)
+            ))
 
         if "min_items" in rules:
-            min_items_issues = self._validate_min_items(content, risk_criteria, warning_only)
-            issues.extend(min_items_issues)
+            steps.append(RuleStep(
+                "min_items", {"min": rules["min_items"]},
+                partial(self._validate_min_items, min_items=rules["min_items"], severity=severity)
+            ))
 
         if "min_metrics" in rules:
-            min_metrics_issues = self._validate_min_metrics(content, rules, warning_only)
-            issues.extend(min_metrics_issues)
+            steps.append(RuleStep(
+                "min_metrics", {"min": rules["min_metrics"]},
+                partial(self._validate_min_metrics, min_metrics=rules["min_metrics"], severity=severity)
+            ))
 
         if "min_assumptions" in rules:
-            min_assumptions_issues = self._validate_min_assumptions(content, rules, warning_only)
-            issues.extend(min_assumptions_issues)
+            steps.append(RuleStep(
+                "min_assumptions", {"min": rules["min_assumptions"]},
+                partial(self._validate_min_assumptions, min_assumptions=rules["min_assumptions"], severity=severity)
+            ))
 
         if "min_entries" in rules:
-            min_entries_issues = self._validate_min_entries(content, rules, warning_only)
-            issues.extend(min_entries_issues)
+            steps.append(RuleStep(
+                "min_entries", {"min": rules["min_entries"]},
+                partial(self._validate_min_entries, min_entries=rules["min_entries"], severity=severity)
+            ))
 
         if "has_header" in rules:
-            header_issues = self._validate_has_header(content, warning_only)
-            issues.extend(header_issues)
+            steps.append(RuleStep(
+                "has_header", {},
+                partial(self._validate_has_header, severity=severity)
+            ))
 
         if "has_structure" in rules:
-            structure_issues = self._validate_has_structure(content, warning_only)
-            issues.extend(structure_issues)
-
-        # Calculate completion percentage
-        completion_percent = self._calculate_completion(
-            issues=issues,
-            placeholder_count=placeholder_count,
-            missing_sections=missing_sections,
-            risk_criteria=risk_criteria
-        )
-
-        # Determine if valid (no errors)
-        valid = all(issue.severity != "error" for issue in issues)
+            steps.append(RuleStep(
+                "has_structure", {},
+                partial(self._validate_has_structure, severity=severity)
+            ))
 
-        return ValidationResult(
+        return RulePlan(
             artifact_name=artifact_name,
             risk_level=risk_level,
-            valid=valid,
-            completion_percent=completion_percent,
-            issues=issues,
-            missing_sections=missing_sections,
-            placeholder_count=placeholder_count
+            steps=steps,
+            required_sections=required_sections,
+            warning_only=warning_only,
+            criteria_version=self.config_version
         )
 
-    def _section_exists(self, content: str, section_name: str) -> bool:
-        """
-        Check if a section exists and has content.
+    def _validate_placeholders(self, tree: MarkdownTree, severity: str) -> List[ValidationIssue]:
+        """Placeholders are not allowed at this risk level."""
+        placeholder_count = tree.placeholder_count
+        if placeholder_count == 0:
+            return []
 
-        Looks for markdown headers like:
-        ## Section Name
-        ### Section Name
-        """
-        # Match section headers (## or ###)
-        pattern = rf'^##+ +{re.escape(section_name)}\s*$'
-
-        # Find the section
-        lines = content.split('\n')
-        section_found = False
-        section_content = []
-
-        for i, line in enumerate(lines):
-            if re.match(pattern, line, re.IGNORECASE):
-                section_found = True
-                # Collect content until next section or end
-                for j in range(i + 1, len(lines)):
-                    if lines[j].startswith('#'):
-                        break
-                    section_content.append(lines[j])
-                break
-
-        if not section_found:
-            return False
-
-        # Check if section has actual content (not just whitespace)
-        content_text = '\n'.join(section_content).strip()
-        return len(content_text) > 0
-
-    def _count_sections(self, content: str) -> int:
-        """Count the number of sections (## headers) in the artifact."""
-        return len(re.findall(r'^##+ ', content, re.MULTILINE))
+        return [ValidationIssue(
+            severity=severity,
+            section=None,
+            message=f"Found {placeholder_count} placeholder(s) that must be filled in",
+            suggestion="Replace all [bracketed], TBD, and TODO placeholders with actual content"
+        )]
+
+    def _validate_required_sections(
+        self,
+        tree: MarkdownTree,
+        sections: List[str],
+        severity: str
+    ) -> List[ValidationIssue]:
+        """One issue per required section that is missing or empty."""
+        issues = []
+        for section in sections:
+            if not tree.section_has_content(section):
+                issues.append(ValidationIssue(
+                    severity=severity,
+                    section=section,
+                    message=f"Required section '{section}' is missing or empty",
+                    suggestion=f"Add a '{section}' section with appropriate content"
+                ))
+        return issues
+
+    def _validate_min_sections(
+        self,
+        tree: MarkdownTree,
+        min_sections: int,
+        severity: str
+    ) -> List[ValidationIssue]:
+        """Check minimum number of ## sections present."""
+        section_count = tree.section_count
+        if section_count >= min_sections:
+            return []
+
+        return [ValidationIssue(
+            severity=severity,
+            section=None,
+            message=f"Expected at least {min_sections} sections, found {section_count}",
+            suggestion="Add more detailed sections to meet minimum requirements"
+        )]
 
     def _validate_risk_register(
         self,
-        content: str,
-        risk_criteria: Dict,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        min_risks: int,
+        required_fields: List[str],
+        severity: str
     ) -> List[ValidationIssue]:
         """
         Validate Risk Register structure.
@@ -287,17 +401,13 @@ class ArtifactValidator:
         - Required fields per risk
         """
         issues = []
-        rules = risk_criteria.get("rules", {})
 
-        # Extract risks (look for risk IDs like R-001, RISK-001, etc.)
-        risk_pattern = r'(?:^|\n)(?:#{1,6}\s+)?(?:Risk[- ])?([A-Z]-?\d{3})'
-        risks_found = re.findall(risk_pattern, content, re.IGNORECASE | re.MULTILINE)
-        num_risks = len(set(risks_found))  # Deduplicate
+        # One record per distinct risk ID (R-001, RISK-001, ...)
+        records = parse_risk_records(tree)
+        num_risks = len(records)
 
         # Check minimum risks
-        min_risks = rules.get("min_risks", 0)
         if num_risks < min_risks:
-            severity = "warning" if warning_only else "error"
             issues.append(ValidationIssue(
                 severity=severity,
                 section="Risks",
@@ -305,30 +415,21 @@ class ArtifactValidator:
                 suggestion=f"Add {min_risks - num_risks} more risk(s) to meet requirements"
             ))
 
-        # Check required fields
-        required_fields = rules.get("required_fields", [])
+        # Check required fields on each risk
         if required_fields and num_risks > 0:
-            # Simple heuristic: check if field names appear in content
-            missing_fields = []
-            for field in required_fields:
-                # Look for field name as a header or bold text
-                field_patterns = [
-                    rf'\*\*{re.escape(field)}\*\*',  # **field**
-                    rf'#{1,6}\s+{re.escape(field)}',  # # field
-                    rf'{re.escape(field)}:',  # field:
-                ]
-                found = any(
-                    re.search(pattern, content, re.IGNORECASE)
-                    for pattern in field_patterns
-                )
-                if not found:
-                    missing_fields.append(field)
+            incomplete = missing_fields_by_risk(records, required_fields)
 
-            if missing_fields:
+            if incomplete:
+                shown = [
+                    f"{risk_id} ({', '.join(missing)})"
+                    for risk_id, missing in incomplete[:MAX_RISKS_LISTED]
+                ]
+                if len(incomplete) > MAX_RISKS_LISTED:
+                    shown.append(f"and {len(incomplete) - MAX_RISKS_LISTED} more")
                 issues.append(ValidationIssue(
                     severity="warning",
                     section="Risk Fields",
-                    message=f"Some risks may be missing fields: {', '.join(missing_fields)}",
+                    message=f"{len(incomplete)} risk(s) missing fields: {'; '.join(shown)}",
                     suggestion="Ensure all risks include: " + ", ".join(required_fields)
                 ))
 
@@ -336,203 +437,155 @@ class ArtifactValidator:
 
     def _validate_min_content_length(
         self,
-        content: str,
-        rules: Dict,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        min_length: int,
+        severity: str
     ) -> List[ValidationIssue]:
         """WS-1.9.1: Validate minimum content length (lightweight check)."""
-        issues = []
-        min_length = rules.get("min_content_length", 0)
-
-        # Strip markdown headers and count actual content
-        content_clean = re.sub(r'^#+ .*$', '', content, flags=re.MULTILINE)
-        content_clean = content_clean.strip()
-        actual_length = len(content_clean)
+        # Content length with markdown headers stripped
+        actual_length = tree.content_length
 
-        if actual_length < min_length:
-            severity = "warning" if warning_only else "error"
-            issues.append(ValidationIssue(
-                severity=severity,
-                section=None,
-                message=f"Content too short: {actual_length} characters (minimum {min_length})",
-                suggestion="Add more detailed content to meet minimum length requirement"
-            ))
+        if actual_length >= min_length:
+            return []
 
-        return issues
+        return [ValidationIssue(
+            severity=severity,
+            section=None,
+            message=f"Content too short: {actual_length} characters (minimum {min_length})",
+            suggestion="Add more detailed content to meet minimum length requirement"
+        )]
 
     def _validate_min_items(
         self,
-        content: str,
-        risk_criteria: Dict,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        min_items: int,
+        severity: str
     ) -> List[ValidationIssue]:
         """WS-1.9.1: Validate minimum items in sections (for CTQ Tree)."""
-        issues = []
-        rules = risk_criteria.get("rules", {})
-        min_items = rules.get("min_items", 0)
-
         # Count list items (- or *) and numbered items
-        list_items = len(re.findall(r'^[\s]*[-*]\s+\w', content, re.MULTILINE))
-        numbered_items = len(re.findall(r'^[\s]*\d+\.\s+\w', content, re.MULTILINE))
-        total_items = list_items + numbered_items
+        total_items = tree.list_items + tree.numbered_items
 
-        if total_items < min_items:
-            severity = "warning" if warning_only else "error"
-            issues.append(ValidationIssue(
-                severity=severity,
-                section=None,
-                message=f"Expected at least {min_items} items, found {total_items}",
-                suggestion=f"Add {min_items - total_items} more item(s) to meet requirements"
-            ))
+        if total_items >= min_items:
+            return []
 
-        return issues
+        return [ValidationIssue(
+            severity=severity,
+            section=None,
+            message=f"Expected at least {min_items} items, found {total_items}",
+            suggestion=f"Add {min_items - total_items} more item(s) to meet requirements"
+        )]
 
     def _validate_min_metrics(
         self,
-        content: str,
-        rules: Dict,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        min_metrics: int,
+        severity: str
     ) -> List[ValidationIssue]:
         """WS-1.9.1: Validate minimum metrics (for Measurement Plan)."""
-        issues = []
-        min_metrics = rules.get("min_metrics", 0)
-
         # Count metric definitions (look for patterns like "Metric:", "**Metric**:", etc.)
-        metric_patterns = [
-            r'\*\*.*?Metric.*?\*\*:',  # **Some Metric**:
-            r'Metric \d+:',  # Metric 1:
-            r'^\s*-\s+.*?:.*?(target|baseline|threshold)',  # List items with targets
-        ]
-
         metrics_found = sum(
-            len(re.findall(pattern, content, re.IGNORECASE | re.MULTILINE))
-            for pattern in metric_patterns
+            len(pattern.findall(tree.text))
+            for pattern in METRIC_REGEXES
         )
 
-        if metrics_found < min_metrics:
-            severity = "warning" if warning_only else "error"
-            issues.append(ValidationIssue(
-                severity=severity,
-                section="Key Metrics",
-                message=f"Expected at least {min_metrics} metrics, found {metrics_found}",
-                suggestion=f"Add {min_metrics - metrics_found} more metric(s) with targets/baselines"
-            ))
+        if metrics_found >= min_metrics:
+            return []
 
-        return issues
+        return [ValidationIssue(
+            severity=severity,
+            section="Key Metrics",
+            message=f"Expected at least {min_metrics} metrics, found {metrics_found}",
+            suggestion=f"Add {min_metrics - metrics_found} more metric(s) with targets/baselines"
+        )]
 
     def _validate_min_assumptions(
         self,
-        content: str,
-        rules: Dict,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        min_assumptions: int,
+        severity: str
     ) -> List[ValidationIssue]:
         """WS-1.9.1: Validate minimum assumptions (for Assumptions Register)."""
-        issues = []
-        min_assumptions = rules.get("min_assumptions", 0)
-
         # Count assumption entries (look for numbered or bulleted assumptions)
-        assumption_pattern = r'(?:^|\n)(?:[\s]*(?:[-*]|\d+\.)\s+)(?:Assumption|ASS-\d+|A-\d+)'
-        assumptions_found = len(re.findall(assumption_pattern, content, re.IGNORECASE | re.MULTILINE))
+        assumptions_found = len(ASSUMPTION_REGEX.findall(tree.text))
 
         # Also count table rows under assumptions section
         if assumptions_found == 0:
             # Alternative: count list items in critical assumptions section
-            assumptions_found = len(re.findall(r'^[\s]*[-*]\s+\w', content, re.MULTILINE))
+            assumptions_found = tree.list_items
 
-        if assumptions_found < min_assumptions:
-            severity = "warning" if warning_only else "error"
-            issues.append(ValidationIssue(
-                severity=severity,
-                section="Critical Assumptions",
-                message=f"Expected at least {min_assumptions} assumptions, found {assumptions_found}",
-                suggestion=f"Add {min_assumptions - assumptions_found} more assumption(s)"
-            ))
+        if assumptions_found >= min_assumptions:
+            return []
 
-        return issues
+        return [ValidationIssue(
+            severity=severity,
+            section="Critical Assumptions",
+            message=f"Expected at least {min_assumptions} assumptions, found {assumptions_found}",
+            suggestion=f"Add {min_assumptions - assumptions_found} more assumption(s)"
+        )]
 
     def _validate_min_entries(
         self,
-        content: str,
-        rules: Dict,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        min_entries: int,
+        severity: str
     ) -> List[ValidationIssue]:
         """WS-1.9.1: Validate minimum entries (for Traceability Index, logs)."""
-        issues = []
-        min_entries = rules.get("min_entries", 0)
-
         # Count table rows (look for | separators) or list items
-        table_rows = len(re.findall(r'^\|.*?\|.*?\|', content, re.MULTILINE))
-        list_items = len(re.findall(r'^[\s]*[-*]\s+\w', content, re.MULTILINE))
-        entries_found = max(table_rows - 1, list_items)  # -1 for header row
+        entries_found = max(tree.table_rows - 1, tree.list_items)  # -1 for header row
 
-        if entries_found < min_entries:
-            severity = "warning" if warning_only else "error"
-            issues.append(ValidationIssue(
-                severity=severity,
-                section=None,
-                message=f"Expected at least {min_entries} entries, found {entries_found}",
-                suggestion=f"Add {min_entries - entries_found} more entry(ies)"
-            ))
+        if entries_found >= min_entries:
+            return []
 
-        return issues
+        return [ValidationIssue(
+            severity=severity,
+            section=None,
+            message=f"Expected at least {min_entries} entries, found {entries_found}",
+            suggestion=f"Add {min_entries - entries_found} more entry(ies)"
+        )]
 
     def _validate_has_header(
         self,
-        content: str,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        severity: str
     ) -> List[ValidationIssue]:
         """WS-1.9.1: Validate artifact has proper header structure."""
-        issues = []
-
-        # Check for title (# header) at top
-        has_title = bool(re.match(r'^#\s+\w', content, re.MULTILINE))
-
-        # Check for project name subtitle (## header)
-        has_project = bool(re.search(r'^##\s+\w', content, re.MULTILINE))
-
-        if not (has_title and has_project):
-            severity = "warning" if warning_only else "error"
-            issues.append(ValidationIssue(
-                severity=severity,
-                section=None,
-                message="Missing proper header structure (title + project name)",
-                suggestion="Add '# Title' and '## Project Name' headers at top"
-            ))
+        # Title (# header) at top and project name subtitle (## header)
+        if tree.has_title and tree.has_subtitle:
+            return []
 
-        return issues
+        return [ValidationIssue(
+            severity=severity,
+            section=None,
+            message="Missing proper header structure (title + project name)",
+            suggestion="Add '# Title' and '## Project Name' headers at top"
+        )]
 
     def _validate_has_structure(
         self,
-        content: str,
-        warning_only: bool = False
+        tree: MarkdownTree,
+        severity: str
     ) -> List[ValidationIssue]:
         """WS-1.9.1: Validate artifact has proper structure (sections/table/list)."""
-        issues = []
+        # At least one section header (## or ###), plus a table or list
+        has_sections = tree.section_count > 0
+        has_table_or_list = tree.has_table or tree.list_items > 0
 
-        # Check for at least one section header (## or ###)
-        has_sections = bool(re.search(r'^##+ ', content, re.MULTILINE))
-
-        # Check for table or list structure
-        has_table = bool(re.search(r'^\|.*?\|', content, re.MULTILINE))
-        has_list = bool(re.search(r'^[\s]*[-*]\s+\w', content, re.MULTILINE))
-
-        if not (has_sections and (has_table or has_list)):
-            severity = "warning" if warning_only else "error"
-            issues.append(ValidationIssue(
-                severity=severity,
-                section=None,
-                message="Missing proper structure (sections + table/list)",
-                suggestion="Add section headers and organize content in table or list format"
-            ))
+        if has_sections and has_table_or_list:
+            return []
 
-        return issues
+        return [ValidationIssue(
+            severity=severity,
+            section=None,
+            message="Missing proper structure (sections + table/list)",
+            suggestion="Add section headers and organize content in table or list format"
+        )]
 
     def _calculate_completion(
         self,
         issues: List[ValidationIssue],
         placeholder_count: int,
         missing_sections: List[str],
-        risk_criteria: Dict
+        num_required_sections: int
     ) -> float:
         """
         Calculate artifact completion percentage.
@@ -547,7 +600,6 @@ class ArtifactValidator:
         completion = 1.0
 
         # Penalize missing sections
-        num_required_sections = len(risk_criteria.get("required_sections", []))
         if num_required_sections > 0:
             section_penalty = len(missing_sections) / num_required_sections * 0.5
             completion -= section_penalty
@@ -568,10 +620,50 @@ class ArtifactValidator:
         return max(0.0, min(1.0, completion))
 
 
+# Global validator instance (copy-on-write: replaced, never mutated)
+_validator: Optional[ArtifactValidator] = None
+_validator_signature: Optional[Tuple] = None
+_validator_lock = threading.Lock()
+
+
+def get_artifact_validator() -> ArtifactValidator:
+    """
+    Get the shared ArtifactValidator, reloading it if acceptance_criteria.json changed.
+
+    A reload builds a complete new validator and then swaps the global
+    reference, so callers holding the previous instance keep a consistent
+    view. If the edited file cannot be loaded (e.g. half-written JSON) the
+    previous validator stays in service and a warning is printed.
+    """
+    global _validator, _validator_signature
+
+    signature = config_signature([DEFAULT_CRITERIA_PATH])
+    if _validator is not None and signature == _validator_signature:
+        return _validator
+
+    with _validator_lock:
+        if _validator is None or signature != _validator_signature:
+            try:
+                validator = ArtifactValidator()
+            except Exception as e:
+                if _validator is None:
+                    raise
+                print(f"[VALIDATOR] Warning: Keeping criteria {_validator.config_version}, reload failed: {e}")
+            else:
+                if _validator is not None:
+                    print(f"[VALIDATOR] Reloaded acceptance criteria: {_validator.config_version} -> {validator.config_version}")
+                _validator = validator
+            _validator_signature = signature
+
+    return _validator
+
+
 def validate_artifact_file(
     artifact_path: Path,
     artifact_name: str,
-    risk_level: str
+    risk_level: str,
+    validator: Optional[ArtifactValidator] = None,
+    cache=None
 ) -> ValidationResult:
     """
     Convenience function to validate an artifact from a file.
@@ -580,21 +672,28 @@ def validate_artifact_file(
         artifact_path: Path to artifact markdown file
         artifact_name: Name of artifact
         risk_level: Risk level (R0-R3)
+        validator: Validator to use (optional, uses the shared validator if not provided)
+        cache: Validation result cache (optional, e.g. storage.validation_cache.ValidationCache)
 
     Returns:
         ValidationResult
     """
-    validator = ArtifactValidator()
+    if validator is None:
+        validator = get_artifact_validator()
 
     with open(artifact_path, 'r') as f:
         content = f.read()
 
+    if cache is not None:
+        return cache.validate(validator, artifact_name, content, risk_level)
     return validator.validate_artifact(artifact_name, content, risk_level)
 
 
 def validate_project_artifacts(
     artifacts_dir: Path,
-    risk_level: str
+    risk_level: str,
+    validator: Optional[ArtifactValidator] = None,
+    cache=None
 ) -> Dict[str, ValidationResult]:
     """
     Validate all artifacts in a project directory.
@@ -602,11 +701,15 @@ def validate_project_artifacts(
     Args:
         artifacts_dir: Directory containing QMS-*.md files
         risk_level: Risk level for this project
+        validator: Validator to use (optional, uses the shared validator if not provided)
+        cache: Validation result cache (optional; with it, artifacts unchanged since
+            generation are looked up by their artifact manifest hash without being read)
 
     Returns:
         Dictionary mapping artifact names to ValidationResults
     """
-    validator = ArtifactValidator()
+    if validator is None:
+        validator = get_artifact_validator()
     results = {}
 
     # Map filename patterns to artifact names
@@ -617,10 +720,19 @@ def validate_project_artifacts(
         "QMS-Control-Plan.md": "Control Plan",
     }
 
+    # Artifacts still as generated: cached result by recorded hash (one stat, no read)
+    manifest = ArtifactManifest.load(artifacts_dir) if cache is not None else None
+
     for filename, artifact_name in artifact_mapping.items():
         artifact_path = artifacts_dir / filename
-        if artifact_path.exists():
-            result = validate_artifact_file(artifact_path, artifact_name, risk_level)
+        entry = manifest.verified_entry(artifact_name, artifacts_dir) if manifest is not None else None
+        if entry is not None:
+            result = cache.lookup(validator, artifact_name, entry.sha256, risk_level, entry.size)
+            if result is not None:
+                results[artifact_name] = result
+                continue
+        if entry is not None or artifact_path.exists():
+            result = validate_artifact_file(artifact_path, artifact_name, risk_level, validator, cache)
             results[artifact_name] = result
 
     return results
@@ -31,6 +31,8 @@ class RuntimeConfig:
     - QMS_HOST: Server bind address (default: 0.0.0.0)
     - QMS_PORT: Server port (default: 8000)
     - QMS_CORS_ORIGINS: Comma-separated allowed CORS origins (default: * in dev)
+    - QMS_VALIDATION_CACHE_DISK: Persist validation results under the data root (default: false)
+    - QMS_ARTIFACT_WORKERS: Artifacts rendered and written concurrently (default: 4, at most the CPU count)
     """
 
     def __init__(self):
@@ -81,6 +83,16 @@ class RuntimeConfig:
             else:
                 self.cors_origins = []  # Must be explicitly configured
 
+        # Validation cache disk tier
+        self.validation_cache_disk = os.getenv(
+            "QMS_VALIDATION_CACHE_DISK", "false"
+        ).strip().lower() in ("1", "true", "yes")
+
+        # Artifact generation worker pool
+        self.artifact_workers = int(os.getenv(
+            "QMS_ARTIFACT_WORKERS", str(min(4, os.cpu_count() or 1))
+        ))
+
     def _validate_configuration(self):
         """Validate configuration is complete and sensible."""
         errors = []
@@ -103,6 +115,10 @@ class RuntimeConfig:
         if not (1 <= self.port <= 65535):
             errors.append(f"Invalid QMS_PORT={self.port}. Must be 1-65535")
 
+        # At least one generation worker
+        if self.artifact_workers < 1:
+            errors.append(f"Invalid QMS_ARTIFACT_WORKERS={self.artifact_workers}. Must be at least 1")
+
         if errors:
             raise ConfigurationError(
                 "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
@@ -152,6 +168,18 @@ class RuntimeConfig:
         """Get path to Expert-Review-Log.md."""
         return self.data_root / "Expert-Review-Log.md"
 
+    def get_intake_index_path(self) -> Path:
+        """Get path to the SQLite intake index."""
+        return self.data_root / "intake-index.sqlite3"
+
+    def get_validation_cache_dir(self) -> Path:
+        """Get path to the on-disk validation result cache."""
+        return self.data_root / "validation-cache"
+
+    def get_portfolio_matrix_path(self) -> Path:
+        """Get path to the materialized portfolio readiness matrix."""
+        return self.data_root / "portfolio-readiness.npz"
+
     def summary(self) -> str:
         """Generate configuration summary for logging."""
         return f"""QMS Dashboard Runtime Configuration
@@ -161,6 +189,10 @@ Data Root: {self.data_root}
   - Reviews: {self.reviews_dir}
   - Artifacts: {self.artifacts_dir}
   - Review Log: {self.get_review_log_path()}
+  - Intake Index: {self.get_intake_index_path()}
+  - Validation Cache: {self.get_validation_cache_dir() if self.validation_cache_disk else 'memory only'}
+  - Portfolio Matrix: {self.get_portfolio_matrix_path()}
+Artifact Workers: {self.artifact_workers}
 Server: {self.host}:{self.port}
 CORS Origins: {', '.join(self.cors_origins) if self.cors_origins else 'NONE (deny all)'}
 Log Level: {self.log_level}
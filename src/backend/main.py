@@ -8,15 +8,18 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime
+import hashlib
 import json
+import tempfile
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import Body, FastAPI, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 # Phase 7: Centralized configuration
 from config import get_config, validate_configuration, ConfigurationError
@@ -25,16 +28,24 @@ from security import (
     validate_intake_id,
     validate_review_id,
     validate_json_depth,
+    sanitize_project_name,
     MAX_REQUEST_SIZE,
     ALLOWED_CONTENT_TYPES,
     SecurityError
 )
 
 from models.intake import (
+    IntakeAnswers,
+    IntakeBatchResponse,
+    IntakeBatchResult,
+    IntakePreview,
     IntakeRequest,
     IntakeResponse,
     IntakeResponseSummary,
-    ValidationWarning
+    IntakeListPage,
+    answers_mask,
+    decode_answers,
+    encode_answers
 )
 from models.review import (
     ReviewRequest,
@@ -52,27 +63,64 @@ from artifacts.validator import (
     ArtifactValidator,
     ValidationResult,
     ValidationIssue,
+    get_artifact_validator,
     validate_project_artifacts
 )
+from artifacts.risk_records import RiskRecord, missing_fields_by_risk
+from artifacts.id_index import IdOccurrence, id_kind
+from artifacts.rule_plan import UnknownRuleError
 # Phase 8A WS-2: Dependency management
+from artifacts.dependency_graph import DependencyCycleError
 from artifacts.dependency_manager import (
-    DependencyManager,
+    get_dependency_manager,
     ReadinessAssessment,
     DependencyStatus,
-    NextActionRecommendation
+    NextActionRecommendation,
+    CriticalPathStep
+)
+from artifacts.readiness_engine import ReadinessEngine
+from artifacts.snapshot import artifact_filename
+from validation.classifier import get_required_artifacts
+from validation.decision_table import AnswerChange, get_decision_table
+from artifacts.generator import generate_project_artifacts, render_artifact
+from artifacts.render_cache import get_render_cache
+from artifacts.archive import (
+    DEFAULT_COMPRESSION_LEVEL,
+    ArchiveMember,
+    RangeNotSatisfiable,
+    archive_etag,
+    archive_length,
+    file_member,
+    known_length,
+    parse_range,
+    slice_stream,
+    stream_archive,
+    text_member
 )
-from validation.classifier import classify_risk, get_required_artifacts
-from validation.layer1 import validate_intake_answers, validate_project_name
-from validation.layer2 import cross_validate
-from validation.layer3 import detect_risk_indicators
-from validation.layer4 import generate_confirmation_warnings
-from validation.layer5 import determine_expert_review
-from artifacts.generator import generate_project_artifacts
 from review.request_generator import create_review_request
 from review.storage import get_review_storage
+from storage.intake_store import get_intake_store, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from storage.intake_cache import get_intake_cache
+from storage.validation_cache import get_validation_cache
+from storage.portfolio import (
+    RISK_LEVELS,
+    ReadinessThresholds,
+    RiskLevelReadiness,
+    built_at_iso,
+    get_portfolio_readiness,
+    summarize
+)
+from storage.calibration import (
+    DEFAULT_COMPLETION_GRID,
+    DEFAULT_MAX_ERRORS_GRID,
+    DEFAULT_MAX_WARNINGS_GRID,
+    DEFAULT_VOLATILITY_SCALE_GRID,
+    RiskLevelCalibration,
+    sweep_thresholds
+)
 
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, ValidationError
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 
 # Phase 8A WS-1.4: Response contract for artifact health API
@@ -150,6 +198,11 @@ class ProjectArtifactHealth(BaseModel):
         description="Filesystem path to artifacts (if available)"
     )
 
+    config_version: Optional[str] = Field(
+        default=None,
+        description="Version of the acceptance criteria these artifacts were validated against"
+    )
+
 
 # ============================================================================
 # Phase 8A WS-2: Dependency Management Response Models
@@ -183,6 +236,11 @@ class ProjectDependencyHealth(BaseModel):
         description="Cross-artifact reference consistency issues (structural checks only)"
     )
 
+    orphaned_references: Dict[str, List[IdOccurrence]] = Field(
+        default={},
+        description="Where each cross-reference issue is (first mention of each unresolved ID, per artifact)"
+    )
+
     overall_ready: bool = Field(
         description="True if all required artifacts meet readiness thresholds"
     )
@@ -191,6 +249,11 @@ class ProjectDependencyHealth(BaseModel):
         description="Number of artifacts blocked by dependencies"
     )
 
+    config_version: Optional[str] = Field(
+        default=None,
+        description="Version of the dependency and readiness configuration used"
+    )
+
 
 class NextActionsResponse(BaseModel):
     """
@@ -220,6 +283,165 @@ class NextActionsResponse(BaseModel):
         description="User can always proceed despite recommendations (per WS-2 soft blocking)"
     )
 
+    config_version: Optional[str] = Field(
+        default=None,
+        description="Version of the dependency and readiness configuration used"
+    )
+
+
+class CriticalPathResponse(BaseModel):
+    """
+    Shortest plan of artifact completions that would make the project ready.
+
+    Response contract - Planning aid, NOT a mandate:
+    - Lists every required artifact that is not ready yet, prerequisites first
+    - Weights each step by its completion gap (volatility-adjusted threshold)
+    - Marks the heaviest prerequisite chain (work that cannot run in parallel)
+    - User can always work in any order (per WS-2 soft blocking)
+    """
+    intake_id: str = Field(description="Intake ID")
+    project_name: str = Field(description="Project name")
+    risk_level: str = Field(description="Project risk level (R0-R3)")
+
+    overall_ready: bool = Field(description="True if every required artifact is already ready")
+    steps: List[CriticalPathStep] = Field(description="Not-ready artifacts in completion order")
+    critical_path: List[str] = Field(description="Heaviest chain of dependent steps, first to last")
+    critical_path_gap: float = Field(description="Total completion gap along the critical path")
+    total_gap: float = Field(description="Total completion gap over all steps")
+
+    config_version: Optional[str] = Field(
+        default=None,
+        description="Version of the dependency and readiness configuration used"
+    )
+
+
+class RiskRegisterResponse(BaseModel):
+    """
+    Per-risk records parsed from a project's Risk Register.
+
+    Reports what the register contains and which required fields each risk
+    is missing at the project's risk level (diagnostic only).
+    """
+    intake_id: str = Field(description="Intake ID")
+    project_name: str = Field(description="Project name")
+    risk_level: str = Field(description="Project risk level (R0-R3)")
+
+    register_exists: bool = Field(description="True if the Risk Register artifact has been generated")
+    risk_count: int = Field(description="Number of distinct risks")
+    risks: List[RiskRecord] = Field(description="Risks in order of first mention")
+
+    required_fields: List[str] = Field(description="Fields each risk should include at this risk level")
+    missing_fields: Dict[str, List[str]] = Field(
+        description="Risk ID -> required fields that risk does not fill (only risks missing something)"
+    )
+
+
+class IntakeSensitivityResponse(BaseModel):
+    """
+    Which single-answer changes would change an intake's classification.
+
+    Every alternative answer to each question is classified from the decision
+    table (same pipeline as POST /api/intake) and compared with the intake's
+    own result.
+    """
+    intake_id: str
+    answers_code: int = Field(description="Packed answers code of the intake")
+    risk_level: str = Field(description="Risk level from the intake's answers (before any expert override)")
+    rigor: str
+    expert_review_required: bool
+    expert_review_recommended: bool
+    risk_level_questions: List[str] = Field(
+        description="Questions where some other answer changes the risk level"
+    )
+    changes: List[AnswerChange] = Field(description="One entry per alternative answer (or only those that change something)")
+
+
+class PortfolioReadinessResponse(BaseModel):
+    """
+    Readiness across every project with generated artifacts.
+
+    Answered from the materialized portfolio matrix; readiness is evaluated
+    against the current thresholds (diagnostic only).
+    """
+    projects: int = Field(description="Projects in the matrix")
+    projects_ready: int = Field(description="Projects whose required artifacts are all ready")
+    artifacts: List[str] = Field(description="Artifacts tracked per project")
+    risk_levels: List[RiskLevelReadiness] = Field(description="Aggregates per risk level (R0-R3)")
+
+    built_at: str = Field(description="When the matrix was last refreshed (ISO 8601, UTC)")
+    criteria_version: str = Field(description="Acceptance criteria version the artifacts were validated against")
+    config_version: Optional[str] = Field(
+        default=None,
+        description="Version of the dependency and readiness configuration used"
+    )
+
+
+class ThresholdCalibrationResponse(BaseModel):
+    """
+    What-if sweep of readiness thresholds over the portfolio matrix.
+
+    Every grid setting reports how many required artifacts and projects would
+    be ready, and how many flip relative to the current thresholds (diagnostic only).
+    """
+    projects: int = Field(description="Projects in the matrix")
+    grid_settings: int = Field(description="Settings evaluated per risk level")
+    risk_levels: List[RiskLevelCalibration] = Field(description="Sweep results per risk level")
+
+    built_at: str = Field(description="When the matrix was last refreshed (ISO 8601, UTC)")
+    criteria_version: str = Field(description="Acceptance criteria version the artifacts were validated against")
+    config_version: Optional[str] = Field(
+        default=None,
+        description="Version of the dependency and readiness configuration used"
+    )
+
+
+class IdReferencesResponse(BaseModel):
+    """
+    Where one Risk or CTQ ID is defined and referenced across a project's artifacts.
+
+    Structural lookup only: a mention is a reference whether or not the
+    surrounding text is meaningful.
+    """
+    intake_id: str = Field(description="Intake ID")
+    id: str = Field(description="Looked-up ID, uppercased")
+    kind: Literal["risk", "ctq"] = Field(description="Kind of ID")
+
+    defined: bool = Field(description="True if the ID is defined (Risk Register record or CTQ Tree entry)")
+    definitions: List[IdOccurrence] = Field(description="Where the ID is defined")
+    references: List[IdOccurrence] = Field(description="Every other mention, in artifact and line order")
+
+
+class ArtifactUpdateRequest(BaseModel):
+    """New markdown content for one artifact."""
+    content: str = Field(description="Complete artifact markdown (replaces the file)")
+
+
+class ArtifactUpdateResponse(BaseModel):
+    """
+    Result of saving an artifact edit.
+
+    Only the edited artifact is re-validated, and only its own status and its
+    downstream artifacts' statuses are re-evaluated (diagnostic only).
+    """
+    intake_id: str = Field(description="Intake ID")
+    artifact_name: str = Field(description="Edited artifact")
+    bytes_written: int = Field(description="Size of the saved file in bytes")
+
+    status: Optional[DependencyStatus] = Field(
+        default=None,
+        description="Dependency status of the edited artifact (None if not required at this risk level)"
+    )
+    reevaluated: List[str] = Field(
+        description="Required artifacts whose dependency status was re-evaluated for this edit"
+    )
+    overall_ready: bool = Field(description="True if all required artifacts meet readiness thresholds")
+    blocking_count: int = Field(description="Number of artifacts blocked by dependencies")
+
+    config_version: Optional[str] = Field(
+        default=None,
+        description="Version of the dependency and readiness configuration used"
+    )
+
 
 # Phase 7 WS-1: Validate configuration on startup
 try:
@@ -293,6 +515,41 @@ async def validate_request_middleware(request, call_next):
 # Phase 7 WS-1: Use centralized data paths
 DATA_DIR = config.intake_dir
 
+# Most intakes accepted by one POST /api/intakes/batch request
+MAX_INTAKE_BATCH = 1000
+
+# Seconds a browser may reuse a GET /api/intake/preview response without revalidating
+PREVIEW_MAX_AGE = 300
+
+ANSWER_FILTER_DESCRIPTION = "Only intakes with this answer, as question:option (repeatable, e.g. q2_influence:Automated)"
+
+# Indexed intake store (write-through from _save_intake_response).
+# First start against an existing data root imports the JSON files once.
+intake_store = get_intake_store(config.get_intake_index_path())
+intake_store.ensure_migrated(DATA_DIR)
+
+# Parsed intake cache shared by every endpoint that loads an intake
+intake_cache = get_intake_cache(DATA_DIR)
+
+# Build the shared validator and dependency manager at startup (fail fast on bad config)
+try:
+    get_dependency_manager()
+except (DependencyCycleError, UnknownRuleError) as e:
+    print(f"\n❌ Configuration Error:\n{e}\n", file=sys.stderr)
+    sys.exit(1)
+
+# Validation results keyed by artifact content hash and criteria version
+validation_cache = get_validation_cache()
+
+# Validation pipeline result for every answer combination (built at startup)
+decision_table = get_decision_table()
+
+# Per-project dependency readiness, updated incrementally as artifacts change
+readiness_engine = ReadinessEngine(cache=validation_cache)
+
+# Validation outcomes of every project's artifacts as a (project, artifact) matrix
+portfolio = get_portfolio_readiness()
+
 # Serve static frontend files
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend"
 if FRONTEND_DIR.exists():
@@ -317,6 +574,60 @@ async def health_check():
     }
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """
+    Cache and performance counters.
+
+    Operational diagnostics only - no intake or artifact content is exposed.
+    """
+    return {
+        "intake_cache": intake_cache.stats(),
+        "validation_cache": validation_cache.stats(),
+        "render_cache": get_render_cache().stats(),
+        "decision_table": decision_table.stats(),
+        "readiness_engine": readiness_engine.stats(),
+        "portfolio": portfolio.stats(),
+        "config_versions": {
+            "acceptance_criteria": get_artifact_validator().config_version,
+            "dependency_manager": get_dependency_manager().config_version
+        }
+    }
+
+
+@app.get("/api/validation/rule-plans")
+async def get_rule_plans(
+    artifact_name: Optional[str] = None,
+    risk_level: Optional[Literal["R0", "R1", "R2", "R3"]] = None
+):
+    """
+    Compiled acceptance-criteria rule plans, for debugging validation results.
+
+    Each plan lists the checks run for one (artifact, risk level) in
+    execution order, with their thresholds. Filter with `artifact_name`
+    and/or `risk_level`.
+    """
+    validator = get_artifact_validator()
+
+    plans = [
+        plan.describe()
+        for (plan_artifact, plan_level), plan in validator.plans.items()
+        if (artifact_name is None or plan_artifact == artifact_name)
+        and (risk_level is None or plan_level == risk_level)
+    ]
+
+    if not plans and (artifact_name is not None or risk_level is not None):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No rule plan matches the given artifact_name/risk_level"
+        )
+
+    return {
+        "criteria_version": validator.config_version,
+        "plans": plans
+    }
+
+
 @app.post("/api/intake", response_model=IntakeResponse, status_code=status.HTTP_201_CREATED)
 async def submit_intake(request: IntakeRequest):
     """
@@ -331,71 +642,103 @@ async def submit_intake(request: IntakeRequest):
     6. Layer 5: Expert review triggers (escalate if needed)
     (Layer 6: Override handled separately via /api/intake/override endpoint)
 
+    Layers 1-5 depend only on the answers and the project name check, so
+    their result is looked up in the decision table built at startup
+    (validation/decision_table.py) instead of being re-run.
+
     Returns IntakeResponse with classification and next steps.
     """
     try:
-        # 6-LAYER VALIDATION SYSTEM
-        warnings: list[ValidationWarning] = []
+        # Layers 1-5, classification, artifacts and next steps (precomputed per answer combination)
+        response = _classify_intake(request)
+
+        # Save intake response
+        _save_intake_response(response)
+
+        return response
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error processing intake: {str(e)}"
+        )
 
-        # Layer 1: Input Validation
-        warnings.extend(validate_project_name(request.project_name))
-        warnings.extend(validate_intake_answers(request.answers))
 
-        # Layer 2: Cross-Validation (detect contradictions)
-        warnings.extend(cross_validate(request.answers))
+@app.post("/api/intake/preview", response_model=IntakePreview)
+async def preview_intake(request: IntakeRequest):
+    """
+    Preview the classification of intake answers without saving anything.
 
-        # Layer 3: Risk Indicators (flag high-risk patterns)
-        warnings.extend(detect_risk_indicators(request.answers))
+    Same classification, warnings, expert review flags, artifacts and next
+    steps as POST /api/intake (decision table lookup), but no intake ID is
+    assigned and no file or index row is written.
 
-        # CLASSIFICATION (using Phase 1 classifier)
-        classification, classification_warnings = classify_risk(request.answers)
-        warnings.extend(classification_warnings)
+    POST responses are not cached; for previews on every answer change use
+    GET /api/intake/preview with the returned answers_code.
+    """
+    return _intake_preview(request.answers, request.project_name)
 
-        # Layer 4: Confirmation Warnings
-        warnings.extend(generate_confirmation_warnings(request.answers, classification))
 
-        # Determine required artifacts
-        artifacts_required = get_required_artifacts(classification.risk_level)
+@app.get("/api/intake/preview", response_model=IntakePreview)
+async def get_intake_preview(
+    http_request: Request,
+    response: Response,
+    answers_code: int = Query(..., ge=0, description="Packed answers code (answers_code of a previous preview)"),
+    project_name: str = Query(..., min_length=1, max_length=200, description="Name of the project")
+):
+    """
+    Cacheable preview of the classification for a packed answers code.
 
-        # Layer 5: Expert Review Triggers
-        expert_review_required, expert_review_recommended, review_reasons = determine_expert_review(
-            request.answers,
-            classification,
-            warnings
+    The preview depends only on the answers code, the project name and the
+    pipeline version (decision table version), so it carries a strong ETag
+    built from those and may be reused by the browser for
+    PREVIEW_MAX_AGE seconds; If-None-Match answers 304 without a body.
+    Nothing is saved.
+    """
+    try:
+        answers = decode_answers(answers_code)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
-        # Generate next steps
-        next_steps = _generate_next_steps(
-            classification,
-            expert_review_required,
-            expert_review_recommended,
-            artifacts_required
-        )
+    name_digest = hashlib.sha256(project_name.encode('utf-8')).hexdigest()[:16]
+    headers = {
+        "ETag": f'"{decision_table.version}-{answers_code:04x}-{name_digest}"',
+        "Cache-Control": f"private, max-age={PREVIEW_MAX_AGE}"
+    }
 
-        # Build response
-        response = IntakeResponse(
-            project_name=request.project_name,
-            timestamp=request.timestamp,
-            answers=request.answers,
-            classification=classification,
-            warnings=warnings,
-            expert_review_required=expert_review_required,
-            expert_review_recommended=expert_review_recommended,
-            next_steps=next_steps,
-            artifacts_required=artifacts_required
-        )
+    if _etag_matches(http_request, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-        # Save intake response
-        _save_intake_response(response)
+    response.headers.update(headers)
+    return _intake_preview(answers, project_name)
 
-        return response
 
-    except Exception as e:
+@app.post("/api/intakes/batch", response_model=IntakeBatchResponse)
+async def submit_intake_batch(
+    intakes: List[Any] = Body(..., description=f"IntakeRequest objects (at most {MAX_INTAKE_BATCH})")
+):
+    """
+    Submit many intakes in one request (bulk onboarding).
+
+    Every item is validated and classified on its own (decision table
+    lookup, same result as POST /api/intake); the intake files are then
+    written and the intake index updated in a single transaction (group
+    commit). An invalid or unsaved item is reported in its result and does
+    not fail the rest of the batch.
+
+    Returns one result per submitted item, in request order.
+    """
+    if len(intakes) > MAX_INTAKE_BATCH:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing intake: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_INTAKE_BATCH} intakes per batch (got {len(intakes)})"
         )
 
+    return await run_in_threadpool(_submit_intake_batch, intakes)
+
 
 @app.get("/api/intake/{intake_id}", response_model=IntakeResponse)
 async def get_intake(intake_id: str):
@@ -411,68 +754,130 @@ async def get_intake(intake_id: str):
             detail="Invalid intake ID format"
         )
 
-    file_path = DATA_DIR / f"{intake_id}.json"
+    return _load_intake(intake_id)
+
+
+@app.get("/api/intake/{intake_id}/sensitivity", response_model=IntakeSensitivityResponse)
+async def get_intake_sensitivity(
+    intake_id: str,
+    changed_only: bool = Query(False, description="Only list answer changes that change the risk level, rigor or expert review flags")
+):
+    """
+    Show which single answer changes would move an intake's risk level,
+    rigor or expert review flags.
 
-    if not file_path.exists():
+    Each of the 16 alternative answer vectors one change away is looked up
+    in the decision table, so this costs 17 table reads per intake.
+    """
+    if not validate_intake_id(intake_id):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Intake {intake_id} not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid intake ID format"
         )
 
+    intake = _load_intake(intake_id)
+
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        return IntakeResponse(**data)
+        current, changes = decision_table.sensitivity(intake.answers, intake.project_name)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error loading intake: {str(e)}"
+            detail=f"Error analysing intake sensitivity: {str(e)}"
         )
 
+    risk_level_questions = list(dict.fromkeys(
+        change.question for change in changes if change.changes_risk_level
+    ))
+    if changed_only:
+        changes = [
+            change for change in changes
+            if change.changes_risk_level or change.changes_rigor or change.changes_expert_review
+        ]
 
-@app.get("/api/intakes", response_model=list[IntakeResponseSummary])
-async def list_intakes():
-    """
-    List all saved intake responses (summary view).
+    return IntakeSensitivityResponse(
+        intake_id=intake_id,
+        answers_code=encode_answers(intake.answers),
+        risk_level=current.classification.risk_level,
+        rigor=current.classification.rigor,
+        expert_review_required=current.expert_review_required,
+        expert_review_recommended=current.expert_review_recommended,
+        risk_level_questions=risk_level_questions,
+        changes=changes
+    )
+
+
+@app.get("/api/intakes", response_model=IntakeListPage)
+async def list_intakes(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    risk_level: Optional[Literal["R0", "R1", "R2", "R3"]] = None,
+    expert_review_required: Optional[bool] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    order: Literal["desc", "asc"] = "desc",
+    answer: Optional[List[str]] = Query(None, description=ANSWER_FILTER_DESCRIPTION)
+):
     """
-    summaries = []
+    List saved intake responses (summary view), one page at a time.
 
-    for file_path in DATA_DIR.glob("*.json"):
-        try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-
-            summary = IntakeResponseSummary(
-                intake_id=data["intake_id"],
-                project_name=data["project_name"],
-                timestamp=data["timestamp"],
-                risk_level=data["classification"]["risk_level"],
-                expert_review_required=data.get("expert_review_required", False)
-            )
-            summaries.append(summary)
-        except Exception as e:
-            # Skip files that can't be loaded
-            print(f"Warning: Could not load {file_path}: {e}")
-            continue
+    Served from the intake index using keyset pagination on
+    (timestamp, intake_id). Pass the returned next_cursor back as `cursor`
+    to fetch the following page; it is null on the last page.
 
-    # Sort by timestamp, newest first
-    summaries.sort(key=lambda x: x.timestamp, reverse=True)
+    Args:
+        limit: Page size (1-500)
+        cursor: Token from a previous page
+        risk_level: Filter by risk level
+        expert_review_required: Filter by mandatory review flag
+        since: Only intakes at or after this timestamp (ISO 8601)
+        until: Only intakes before this timestamp (ISO 8601)
+        order: "desc" (newest first, default) or "asc"
+        answer: Only intakes with these answers, e.g. answer=q2_influence:Automated
+            (matched as a bitmask test on the packed answers code)
+    """
+    answers = _answers_filter(answer)
+    try:
+        intakes, next_cursor = intake_store.list_page(
+            limit=limit,
+            cursor=cursor,
+            risk_level=risk_level,
+            expert_review_required=expert_review_required,
+            since=since,
+            until=until,
+            descending=(order == "desc"),
+            answers=answers
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
-    return summaries
+    return IntakeListPage(intakes=intakes, next_cursor=next_cursor, limit=limit)
 
 
 @app.post("/api/intake/{intake_id}/generate-artifacts")
-async def generate_artifacts_for_intake(intake_id: str):
+async def generate_artifacts_for_intake(
+    intake_id: str,
+    force: bool = Query(False, description="Re-render every artifact even if unchanged")
+):
     """
     Generate QMS artifacts for an existing intake.
 
     Phase 7 WS-2: Validates intake ID format for security.
 
+    Idempotent: only artifacts whose intake or template changed since the last
+    generation (per the directory's artifact-manifest.json) are re-rendered,
+    and the ZIP is rebuilt only if one of them changed.
+
     Returns:
         {
             "artifacts_generated": ["Quality Plan", ...],
             "file_paths": ["/path/to/file.md", ...],
-            "zip_file": "/path/to/artifacts.zip"
+            "zip_file": "/path/to/artifacts.zip",
+            "artifacts_regenerated": [...],
+            "artifacts_unchanged": [...],
+            "zip_rebuilt": true
         }
     """
     # Phase 7 WS-2: Validate intake ID format
@@ -483,28 +888,24 @@ async def generate_artifacts_for_intake(intake_id: str):
         )
 
     # Load intake response
-    intake_file = DATA_DIR / f"{intake_id}.json"
-
-    if not intake_file.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Intake {intake_id} not found"
-        )
+    intake_response = _load_intake(intake_id)
 
     try:
-        with open(intake_file, 'r') as f:
-            data = json.load(f)
-
-        # Reconstruct IntakeRequest and IntakeResponse
-        intake_response = IntakeResponse(**data)
+        # Reconstruct IntakeRequest
         intake_request = IntakeRequest(
             project_name=intake_response.project_name,
             timestamp=intake_response.timestamp,
             answers=intake_response.answers
         )
 
-        # Generate artifacts
-        result = generate_project_artifacts(intake_request, intake_response)
+        # Generate artifacts (off the event loop; artifacts are rendered and written by the worker pool)
+        result = await run_in_threadpool(
+            generate_project_artifacts, intake_request, intake_response, force=force
+        )
+
+        # Re-check rewritten artifacts on the next readiness poll
+        for artifact_name in result["artifacts_regenerated"]:
+            readiness_engine.mark_dirty(config.get_artifacts_path(intake_id), artifact_name)
 
         return result
 
@@ -515,6 +916,123 @@ async def generate_artifacts_for_intake(intake_id: str):
         )
 
 
+@app.get("/api/intake/{intake_id}/artifacts.zip")
+async def download_artifacts_zip(
+    intake_id: str,
+    request: Request,
+    source: Literal["files", "render"] = Query(
+        "files", description="Zip the generated artifact files, or render the templates afresh"
+    ),
+    level: int = Query(
+        DEFAULT_COMPRESSION_LEVEL, ge=0, le=9, description="Deflate level (0 = stored, fastest)"
+    )
+):
+    """
+    Download a project's artifacts as a ZIP archive, streamed as it is built.
+
+    No archive is written to disk or held in memory. The archive is
+    deterministic for the same artifacts and level, so it carries a strong
+    ETag (If-None-Match answers 304) and single byte ranges are served
+    (Range, If-Range).
+    """
+    if not validate_intake_id(intake_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid intake ID format"
+        )
+
+    intake_response = _load_intake(intake_id)
+    required_artifacts = get_required_artifacts(intake_response.classification.risk_level)
+
+    try:
+        if source == "render":
+            members = await run_in_threadpool(_rendered_members, intake_response, required_artifacts)
+        else:
+            members = _file_members(config.get_artifacts_path(intake_id), required_artifacts)
+        filename = f"{sanitize_project_name(intake_response.project_name)}-QMS-Artifacts.zip"
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error preparing artifact archive: {str(e)}"
+        )
+
+    if not members:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No artifacts generated for intake {intake_id} (use source=render)"
+        )
+
+    etag = archive_etag(members, level)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"'
+    }
+
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == etag):
+        length = await run_in_threadpool(archive_length, members, level, etag)
+        try:
+            byte_range = parse_range(range_header, length)
+        except RangeNotSatisfiable:
+            # 416 Range Not Satisfiable (its status constant was renamed across Starlette versions)
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{length}"}
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            return StreamingResponse(
+                slice_stream(stream_archive(members, level), start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type="application/zip",
+                headers={
+                    **headers,
+                    "Content-Range": f"bytes {start}-{end}/{length}",
+                    "Content-Length": str(end - start + 1)
+                }
+            )
+
+    length = known_length(etag)
+    if length is not None:
+        headers["Content-Length"] = str(length)
+    return StreamingResponse(stream_archive(members, level, etag), media_type="application/zip", headers=headers)
+
+
+def _file_members(artifacts_dir: Path, required_artifacts: List[str]) -> List[ArchiveMember]:
+    """Archive members for the generated artifact files, in required order (missing files skipped)."""
+    members = []
+    for artifact_name in required_artifacts:
+        try:
+            members.append(file_member(artifacts_dir / artifact_filename(artifact_name)))
+        except FileNotFoundError:
+            continue
+    return members
+
+
+def _rendered_members(intake_response: IntakeResponse, required_artifacts: List[str]) -> List[ArchiveMember]:
+    """Archive members rendered from the templates (nothing is written), in required order."""
+    intake_request = IntakeRequest(
+        project_name=intake_response.project_name,
+        timestamp=intake_response.timestamp,
+        answers=intake_response.answers
+    )
+    # Templates are dated, not timed: midnight keeps the archive identical all day
+    date_time = datetime.now().timetuple()[:3] + (0, 0, 0)
+    return [
+        text_member(
+            artifact_filename(artifact_name),
+            render_artifact(artifact_name, intake_request, intake_response),
+            date_time
+        )
+        for artifact_name in required_artifacts
+    ]
+
+
 # ============================================================================
 # EXPERT REVIEW ENDPOINTS (Phase 5)
 # ============================================================================
@@ -547,19 +1065,9 @@ async def create_review_request_endpoint(
         )
 
     # Load intake response
-    intake_file = DATA_DIR / f"{intake_id}.json"
-
-    if not intake_file.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Intake {intake_id} not found"
-        )
+    intake_response = _load_intake(intake_id)
 
     try:
-        with open(intake_file, 'r') as f:
-            data = json.load(f)
-
-        intake_response = IntakeResponse(**data)
         intake_request = IntakeRequest(
             project_name=intake_response.project_name,
             timestamp=intake_response.timestamp,
@@ -962,17 +1470,7 @@ async def get_artifact_health(intake_id: str):
         )
 
     # Load intake response
-    file_path = DATA_DIR / f"{intake_id}.json"
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Intake {intake_id} not found"
-        )
-
-    with open(file_path, 'r') as f:
-        intake_data = json.load(f)
-
-    intake_response = IntakeResponse(**intake_data)
+    intake_response = _load_intake(intake_id)
     project_name = intake_response.project_name
     risk_level = intake_response.classification.risk_level
 
@@ -993,8 +1491,9 @@ async def get_artifact_health(intake_id: str):
             artifacts_path=str(artifacts_dir)
         )
 
-    # Validate all artifacts
-    validation_results = validate_project_artifacts(artifacts_dir, risk_level)
+    # Validate all artifacts (shared validator, reloaded if acceptance criteria changed)
+    validator = get_artifact_validator()
+    validation_results = validate_project_artifacts(artifacts_dir, risk_level, validator, validation_cache)
 
     # Aggregate results (Step 2: Aggregation logic)
     health = _aggregate_artifact_health(
@@ -1002,7 +1501,8 @@ async def get_artifact_health(intake_id: str):
         project_name=project_name,
         risk_level=risk_level,
         validation_results=validation_results,
-        artifacts_path=str(artifacts_dir)
+        artifacts_path=str(artifacts_dir),
+        config_version=validator.config_version
     )
 
     return health
@@ -1043,17 +1543,7 @@ async def get_dependency_health(intake_id: str):
         )
 
     # Load intake response
-    file_path = DATA_DIR / f"{intake_id}.json"
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Intake {intake_id} not found"
-        )
-
-    with open(file_path, 'r') as f:
-        intake_data = json.load(f)
-
-    intake_response = IntakeResponse(**intake_data)
+    intake_response = _load_intake(intake_id)
     project_name = intake_response.project_name
     risk_level = intake_response.classification.risk_level
 
@@ -1074,37 +1564,23 @@ async def get_dependency_health(intake_id: str):
     # Get required artifacts for this risk level
     required_artifacts = get_required_artifacts(risk_level)
 
-    # Initialize dependency manager
-    dep_manager = DependencyManager()
-
-    # Check dependencies for each artifact
-    dependency_statuses = {}
-    for artifact_name in required_artifacts:
-        status = dep_manager.check_dependencies(artifact_name, artifacts_dir, risk_level)
-        dependency_statuses[artifact_name] = status
-
-    # Check cross-references (WS-2 structural validation)
-    cross_ref_issues = dep_manager.check_cross_references(artifacts_dir, risk_level)
-
-    # Calculate aggregate stats
-    blocking_count = sum(
-        1 for status in dependency_statuses.values()
-        if not status.all_dependencies_ready
-    )
+    # Shared dependency manager (reloaded if configuration files changed)
+    dep_manager = get_dependency_manager()
 
-    overall_ready = all(
-        status.readiness.ready
-        for status in dependency_statuses.values()
-    )
+    # Incremental readiness: only artifacts changed since the last poll (and
+    # their dependents) are re-evaluated; an unchanged project is a lookup
+    readiness = readiness_engine.readiness(dep_manager, artifacts_dir, risk_level, required_artifacts)
 
     return ProjectDependencyHealth(
         intake_id=intake_id,
         project_name=project_name,
         risk_level=risk_level,
-        dependencies=dependency_statuses,
-        cross_reference_issues=cross_ref_issues,
-        overall_ready=overall_ready,
-        blocking_count=blocking_count
+        dependencies=readiness.statuses,
+        cross_reference_issues=readiness.cross_reference_issues,
+        orphaned_references=readiness.orphaned_references,
+        overall_ready=readiness.overall_ready,
+        blocking_count=readiness.blocking_count,
+        config_version=readiness.config_version
     )
 
 
@@ -1142,17 +1618,7 @@ async def get_next_actions(intake_id: str):
         )
 
     # Load intake response
-    file_path = DATA_DIR / f"{intake_id}.json"
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Intake {intake_id} not found"
-        )
-
-    with open(file_path, 'r') as f:
-        intake_data = json.load(f)
-
-    intake_response = IntakeResponse(**intake_data)
+    intake_response = _load_intake(intake_id)
     project_name = intake_response.project_name
     risk_level = intake_response.classification.risk_level
 
@@ -1179,14 +1645,16 @@ async def get_next_actions(intake_id: str):
     # Get required artifacts for this risk level
     required_artifacts = get_required_artifacts(risk_level)
 
-    # Initialize dependency manager
-    dep_manager = DependencyManager()
+    # Shared dependency manager (reloaded if configuration files changed)
+    dep_manager = get_dependency_manager()
 
-    # Get next action recommendations
+    # Get next action recommendations from the project's current readiness
+    readiness = readiness_engine.readiness(dep_manager, artifacts_dir, risk_level, required_artifacts)
     recommendations = dep_manager.get_next_actions(
         artifacts_dir,
         risk_level,
-        required_artifacts
+        required_artifacts,
+        statuses=readiness.statuses
     )
 
     return NextActionsResponse(
@@ -1194,7 +1662,328 @@ async def get_next_actions(intake_id: str):
         project_name=project_name,
         risk_level=risk_level,
         recommendations=recommendations,
-        can_proceed_anyway=True
+        can_proceed_anyway=True,
+        config_version=dep_manager.config_version
+    )
+
+
+@app.get("/api/intake/{intake_id}/critical-path", response_model=CriticalPathResponse)
+async def get_critical_path(intake_id: str):
+    """
+    Get the shortest ordered set of artifact completions that makes the project ready.
+
+    Phase 8A WS-2: Steps are weighted by each artifact's gap to its
+    volatility-adjusted readiness threshold; the critical path is the
+    heaviest chain of prerequisite -> dependent steps. Cached per project
+    until an artifact file changes, so it is cheap to poll.
+
+    Returns:
+        CriticalPathResponse
+    """
+    # Validate intake ID format
+    if not validate_intake_id(intake_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid intake ID format"
+        )
+
+    # Load intake response
+    intake_response = _load_intake(intake_id)
+    risk_level = intake_response.classification.risk_level
+
+    dep_manager = get_dependency_manager()
+    artifacts_dir = config.get_artifacts_path(intake_id)
+    plan = dep_manager.get_critical_path(
+        artifacts_dir,
+        risk_level,
+        get_required_artifacts(risk_level),
+        cache=validation_cache
+    )
+
+    return CriticalPathResponse(
+        intake_id=intake_id,
+        project_name=intake_response.project_name,
+        **plan.model_dump(exclude={"risk_level"}),
+        risk_level=risk_level
+    )
+
+
+@app.get("/api/intake/{intake_id}/risks", response_model=RiskRegisterResponse)
+async def get_risks(intake_id: str):
+    """
+    Get the project's risks as structured records.
+
+    Phase 8A WS-1: Parses the Risk Register into one record per risk (ID,
+    description, likelihood, impact, score, mitigation, owner, status) and
+    reports which required fields each risk is missing at the project's risk level.
+
+    Returns:
+        RiskRegisterResponse (empty if artifacts have not been generated)
+    """
+    # Validate intake ID format
+    if not validate_intake_id(intake_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid intake ID format"
+        )
+
+    # Load intake response
+    intake_response = _load_intake(intake_id)
+    risk_level = intake_response.classification.risk_level
+
+    dep_manager = get_dependency_manager()
+    criteria = dep_manager.validator.criteria["artifacts"].get("Risk Register", {})
+    rules = criteria.get("risk_levels", {}).get(risk_level, {}).get("rules", {})
+    required_fields = rules.get("required_fields", [])
+
+    snapshot = dep_manager.snapshot(config.get_artifacts_path(intake_id), risk_level, validation_cache)
+    records = snapshot.risk_records()
+
+    return RiskRegisterResponse(
+        intake_id=intake_id,
+        project_name=intake_response.project_name,
+        risk_level=risk_level,
+        register_exists=snapshot.exists("Risk Register"),
+        risk_count=len(records),
+        risks=records,
+        required_fields=required_fields,
+        missing_fields=dict(missing_fields_by_risk(records, required_fields))
+    )
+
+
+@app.get("/api/portfolio/readiness", response_model=PortfolioReadinessResponse)
+async def get_portfolio_readiness_summary(
+    refresh: bool = Query(False, description="Refresh the matrix now instead of using the materialized one"),
+    answer: Optional[List[str]] = Query(None, description=ANSWER_FILTER_DESCRIPTION)
+):
+    """
+    Readiness across every project, aggregated per risk level.
+
+    Served from the materialized portfolio matrix (refreshed when older than
+    a minute, when acceptance criteria change, or on request; only projects
+    whose artifact files changed are re-validated). Threshold changes apply
+    immediately because readiness is evaluated against the matrix on every request.
+
+    With answer filters only matching projects are aggregated (one bitmask
+    test over the matrix's answers codes).
+    """
+    answers = _answers_filter(answer)
+    dep_manager = get_dependency_manager()
+    artifact_names = dep_manager.graph.nodes
+
+    try:
+        matrix = portfolio.current(
+            dep_manager.validator,
+            intake_store.risk_levels(),
+            artifact_names,
+            refresh=refresh,
+            answers_codes=intake_store.answers_codes()
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error building portfolio readiness: {str(e)}"
+        )
+
+    if answers is not None:
+        matrix = matrix.subset(matrix.rows_with_answers(*answers))
+
+    thresholds = ReadinessThresholds(
+        dep_manager,
+        artifact_names,
+        {risk_level: get_required_artifacts(risk_level) for risk_level in RISK_LEVELS}
+    )
+    risk_levels = summarize(matrix, thresholds)
+
+    return PortfolioReadinessResponse(
+        projects=matrix.shape[0],
+        projects_ready=sum(level.projects_ready for level in risk_levels),
+        artifacts=list(matrix.artifact_names),
+        risk_levels=risk_levels,
+        built_at=built_at_iso(matrix),
+        criteria_version=matrix.criteria_version,
+        config_version=dep_manager.config_version
+    )
+
+
+@app.get("/api/portfolio/calibration", response_model=ThresholdCalibrationResponse)
+async def get_threshold_calibration(
+    risk_level: Optional[List[str]] = Query(None, description="Risk levels to sweep (default all)"),
+    completion: Optional[List[float]] = Query(None, description="Completion thresholds to try"),
+    max_errors: Optional[List[int]] = Query(None, description="max_errors values to try"),
+    max_warnings: Optional[List[int]] = Query(None, description="max_warnings values to try (-1 = unlimited)"),
+    volatility_scale: Optional[List[float]] = Query(
+        None, description="Multipliers on volatility modifiers to try (1.0 = as configured)"
+    ),
+    changed_only: bool = Query(False, description="Only return settings where at least one artifact flips")
+):
+    """
+    Sweep readiness thresholds over every project and report what would flip.
+
+    Evaluated against the materialized portfolio matrix with one vectorized
+    comparison per risk level, so no artifact is re-validated. Omitted grid
+    parameters use the default grid.
+    """
+    risk_levels = risk_level or list(RISK_LEVELS)
+    unknown = [value for value in risk_levels if value not in RISK_LEVELS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown risk level(s): {', '.join(unknown)}"
+        )
+
+    dep_manager = get_dependency_manager()
+    artifact_names = dep_manager.graph.nodes
+
+    try:
+        matrix = portfolio.current(
+            dep_manager.validator,
+            intake_store.risk_levels(),
+            artifact_names,
+            answers_codes=intake_store.answers_codes()
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error building portfolio readiness: {str(e)}"
+        )
+
+    thresholds = ReadinessThresholds(
+        dep_manager,
+        matrix.artifact_names,
+        {level: get_required_artifacts(level) for level in RISK_LEVELS}
+    )
+    try:
+        calibrations = sweep_thresholds(
+            matrix,
+            dep_manager,
+            thresholds,
+            completion_grid=completion or DEFAULT_COMPLETION_GRID,
+            max_errors_grid=max_errors or DEFAULT_MAX_ERRORS_GRID,
+            max_warnings_grid=(
+                [None if value < 0 else value for value in max_warnings]
+                if max_warnings else DEFAULT_MAX_WARNINGS_GRID
+            ),
+            volatility_scale_grid=volatility_scale or DEFAULT_VOLATILITY_SCALE_GRID,
+            risk_levels=risk_levels
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    grid_settings = len(calibrations[0].settings) if calibrations else 0
+    if changed_only:
+        for calibration in calibrations:
+            calibration.settings = [
+                setting for setting in calibration.settings
+                if setting.artifacts_became_ready or setting.artifacts_became_not_ready
+            ]
+
+    return ThresholdCalibrationResponse(
+        projects=matrix.shape[0],
+        grid_settings=grid_settings,
+        risk_levels=calibrations,
+        built_at=built_at_iso(matrix),
+        criteria_version=matrix.criteria_version,
+        config_version=dep_manager.config_version
+    )
+
+
+@app.get("/api/intake/{intake_id}/references/{ref_id}", response_model=IdReferencesResponse)
+async def get_id_references(intake_id: str, ref_id: str):
+    """
+    Reverse lookup: where is a Risk or CTQ ID (e.g., R-003, CTQ-001) defined and referenced?
+
+    Answered from the project's ID index; only artifacts changed since the
+    index was last used are re-scanned.
+    """
+    if not validate_intake_id(intake_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid intake ID format"
+        )
+
+    kind = id_kind(ref_id)
+    if kind is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid ID format (expected a risk ID like R-003 or a CTQ ID like CTQ-001)"
+        )
+
+    intake_response = _load_intake(intake_id)
+    risk_level = intake_response.classification.risk_level
+
+    dep_manager = get_dependency_manager()
+    index = readiness_engine.id_index(
+        dep_manager,
+        config.get_artifacts_path(intake_id),
+        risk_level,
+        get_required_artifacts(risk_level)
+    )
+    return IdReferencesResponse(
+        intake_id=intake_id,
+        id=ref_id.upper(),
+        kind=kind,
+        defined=index.is_defined(ref_id),
+        definitions=index.definitions(ref_id),
+        references=index.references(ref_id)
+    )
+
+
+@app.put("/api/intake/{intake_id}/artifacts/{artifact_name}", response_model=ArtifactUpdateResponse)
+async def update_artifact(intake_id: str, artifact_name: str, update: ArtifactUpdateRequest):
+    """
+    Save an edited artifact and update the project's readiness incrementally.
+
+    The artifact file is replaced atomically. Only the edited artifact is
+    re-validated; only its status and its downstream artifacts' statuses are
+    re-evaluated, so dependency-health reflects the edit on the next poll.
+
+    Contract:
+        - Stores exactly the submitted markdown (no auto-completion, non-goal #2)
+        - Reports readiness after the edit (diagnostic)
+        - NEVER rejects content for being incomplete (soft blocking only)
+    """
+    if not validate_intake_id(intake_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid intake ID format"
+        )
+
+    intake_response = _load_intake(intake_id)
+    risk_level = intake_response.classification.risk_level
+
+    dep_manager = get_dependency_manager()
+    if artifact_name not in dep_manager.graph.nodes:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown artifact: {artifact_name}"
+        )
+
+    artifacts_dir = config.get_artifacts_path(intake_id)
+    try:
+        bytes_written = _write_artifact(artifacts_dir, artifact_name, update.content)
+    except OSError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error saving artifact: {str(e)}"
+        )
+
+    readiness_engine.mark_dirty(artifacts_dir, artifact_name)
+    required_artifacts = get_required_artifacts(risk_level)
+    readiness = readiness_engine.readiness(dep_manager, artifacts_dir, risk_level, required_artifacts)
+
+    return ArtifactUpdateResponse(
+        intake_id=intake_id,
+        artifact_name=artifact_name,
+        bytes_written=bytes_written,
+        status=readiness.statuses.get(artifact_name),
+        reevaluated=readiness.reevaluated,
+        overall_ready=readiness.overall_ready,
+        blocking_count=readiness.blocking_count,
+        config_version=readiness.config_version
     )
 
 
@@ -1202,12 +1991,34 @@ async def get_next_actions(intake_id: str):
 # Helper Functions
 # ============================================================================
 
+def _write_artifact(artifacts_dir: Path, artifact_name: str, content: str) -> int:
+    """
+    Replace an artifact file atomically (readers never see a partial file).
+
+    Returns:
+        Bytes written
+    """
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
+    data = content.encode('utf-8')
+    fd, tmp_path = tempfile.mkstemp(dir=artifacts_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; match generated artifacts
+        os.replace(tmp_path, artifacts_dir / artifact_filename(artifact_name))
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return len(data)
+
+
 def _aggregate_artifact_health(
     intake_id: str,
     project_name: str,
     risk_level: str,
     validation_results: Dict[str, ValidationResult],
-    artifacts_path: str
+    artifacts_path: str,
+    config_version: Optional[str] = None
 ) -> ProjectArtifactHealth:
     """
     Aggregate validation results into project health summary.
@@ -1279,7 +2090,8 @@ def _aggregate_artifact_health(
         complete_artifacts=complete_artifacts,
         artifacts_with_errors=artifacts_with_errors,
         observations=observations,
-        artifacts_path=artifacts_path
+        artifacts_path=artifacts_path,
+        config_version=config_version
     )
 
 
@@ -1337,52 +2149,229 @@ def _generate_observations(
     return observations[:3]  # Max 3 observations
 
 
-def _generate_next_steps(
-    classification,
-    expert_review_required: bool,
-    expert_review_recommended: bool,
-    artifacts_required: list[str]
-) -> list[str]:
+def _answers_filter(answer: Optional[List[str]]) -> Optional[Tuple[int, int]]:
     """
-    Generate list of next steps for the user.
+    Bitmask (mask, value) for `answer` query parameters ("question:option").
+
+    Raises:
+        HTTPException: 400 if a filter is malformed or names an unknown question or option
     """
-    steps = []
+    if not answer:
+        return None
 
-    # Step 1: Expert review if needed
-    if expert_review_required:
-        steps.append("🔴 REQUIRED: Submit for expert review before proceeding")
-    elif expert_review_recommended:
-        steps.append("🟡 RECOMMENDED: Consider expert review for validation")
+    criteria = {}
+    for item in answer:
+        question, separator, option = item.partition(":")
+        if not separator:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Answer filter must be question:option, got {item!r}"
+            )
+        if criteria.get(question, option) != option:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Conflicting answer filters for {question}"
+            )
+        criteria[question] = option
 
-    # Step 2: Review classification
-    steps.append(f"Review your risk classification: {classification.risk_level} ({classification.rigor} rigor)")
+    try:
+        return answers_mask(**criteria)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
-    # Step 3: Review warnings
-    steps.append("Review all warnings and recommendations above")
 
-    # Step 4: Generate artifacts
-    artifact_count = len(artifacts_required)
-    steps.append(f"Generate {artifact_count} required QMS artifacts: {', '.join(artifacts_required[:3])}{'...' if artifact_count > 3 else ''}")
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    True if the request's If-None-Match lists this ETag (or is *).
 
-    # Step 5: Begin implementation
-    steps.append("Review and approve quality plan before implementation begins")
+    Uses the weak comparison If-None-Match calls for (W/ prefixes ignored).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
 
-    return steps
+
+def _intake_preview(answers: IntakeAnswers, project_name: str) -> IntakePreview:
+    """
+    Classification preview for answers from the decision table (nothing saved).
+    """
+    try:
+        decision = decision_table.lookup(answers, project_name)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error processing intake: {str(e)}"
+        )
+
+    return IntakePreview(
+        project_name=project_name,
+        answers=answers,
+        answers_code=encode_answers(answers),
+        classification=decision.classification,
+        warnings=decision.warnings,
+        expert_review_required=decision.expert_review_required,
+        expert_review_recommended=decision.expert_review_recommended,
+        next_steps=decision.next_steps,
+        artifacts_required=decision.artifacts_required
+    )
+
+
+def _classify_intake(request: IntakeRequest) -> IntakeResponse:
+    """
+    Build the intake response for a request from the decision table.
+    """
+    # Layers 1-5, classification, artifacts and next steps (precomputed per answer combination)
+    decision = decision_table.lookup(request.answers, request.project_name)
+
+    return IntakeResponse(
+        project_name=request.project_name,
+        timestamp=request.timestamp,
+        answers=request.answers,
+        classification=decision.classification.model_copy(),
+        warnings=list(decision.warnings),
+        expert_review_required=decision.expert_review_required,
+        expert_review_recommended=decision.expert_review_recommended,
+        next_steps=list(decision.next_steps),
+        artifacts_required=list(decision.artifacts_required)
+    )
+
+
+def _submit_intake_batch(intakes: List[Any]) -> IntakeBatchResponse:
+    """
+    Classify and save a batch of intakes, collecting per-item errors.
+    """
+    results = [IntakeBatchResult(index=index) for index in range(len(intakes))]
+    responses: Dict[int, IntakeResponse] = {}
+
+    for index, item in enumerate(intakes):
+        try:
+            request = IntakeRequest.model_validate(item)
+        except ValidationError as e:
+            results[index].error = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'intake'}: {error['msg']}"
+                for error in e.errors()
+            )
+            continue
+        try:
+            responses[index] = _classify_intake(request)
+        except Exception as e:
+            results[index].error = f"Error processing intake: {str(e)}"
+
+    errors = _save_intake_responses(list(responses.values()))
+
+    for index, response in responses.items():
+        if response.intake_id in errors:
+            results[index].error = errors[response.intake_id]
+            continue
+        results[index].intake = IntakeResponseSummary(
+            intake_id=response.intake_id,
+            project_name=response.project_name,
+            timestamp=response.timestamp,
+            risk_level=response.classification.risk_level,
+            expert_review_required=response.expert_review_required
+        )
+        results[index].expert_review_recommended = response.expert_review_recommended
+
+    created = sum(1 for result in results if result.intake is not None)
+    return IntakeBatchResponse(
+        submitted=len(intakes),
+        created=created,
+        failed=len(intakes) - created,
+        results=results
+    )
+
+
+def _load_intake(intake_id: str) -> IntakeResponse:
+    """
+    Load a saved intake response through the shared intake cache.
+
+    Callers must validate intake_id first. The returned object is shared
+    with other requests and must not be mutated.
+
+    Raises:
+        HTTPException: 404 if the intake does not exist, 500 if it cannot be parsed
+    """
+    try:
+        intake_response = intake_cache.get(intake_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error loading intake: {str(e)}"
+        )
+
+    if intake_response is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Intake {intake_id} not found"
+        )
+
+    return intake_response
 
 
 def _save_intake_response(response: IntakeResponse) -> None:
     """
     Save intake response to JSON file.
     """
+    file_path = _write_intake_file(response)
+
+    # Write through to the intake index and the parsed-intake cache
+    intake_store.upsert(response)
+    intake_cache.put(response)
+
+    print(f"Intake response saved: {file_path}")
+
+
+def _save_intake_responses(responses: List[IntakeResponse]) -> Dict[str, str]:
+    """
+    Save several intake responses with one index transaction (group commit).
+
+    Returns:
+        Error message by intake ID for responses that were not saved
+    """
+    errors: Dict[str, str] = {}
+    written: List[IntakeResponse] = []
+    for response in responses:
+        try:
+            _write_intake_file(response)
+            written.append(response)
+        except OSError as e:
+            errors[response.intake_id] = f"Error saving intake: {str(e)}"
+
+    try:
+        intake_store.upsert_many(written)
+    except Exception as e:
+        # Don't leave intake files the index doesn't know about
+        for response in written:
+            (DATA_DIR / f"{response.intake_id}.json").unlink(missing_ok=True)
+            errors[response.intake_id] = f"Error indexing intake: {str(e)}"
+        return errors
+
+    for response in written:
+        intake_cache.put(response)
+
+    print(f"Intake batch saved: {len(written)} responses in {DATA_DIR}")
+    return errors
+
+
+def _write_intake_file(response: IntakeResponse) -> Path:
+    """
+    Write an intake response to its JSON file.
+    """
     file_path = DATA_DIR / f"{response.intake_id}.json"
 
-    # Convert to dict for JSON serialization
-    data = response.model_dump(mode='json')
+    # Convert to dict for JSON serialization (serialized in one piece, then written once)
+    data = json.dumps(response.model_dump(mode='json'), indent=2, default=str)
 
     with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+        f.write(data)
 
-    print(f"Intake response saved: {file_path}")
+    return file_path
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ Data models for QMS Dashboard intake system.
 Implements IntakeResponse structure from intake-validation-spec.md.
 """
 
-from typing import Optional, Literal
+from typing import Dict, Iterator, Optional, Literal, Tuple
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 import uuid
@@ -44,6 +44,109 @@ class IntakeAnswers(BaseModel):
     )
 
 
+# Options of each answer, in IntakeAnswers field order
+ANSWER_CHOICES: Dict[str, Tuple[str, ...]] = {
+    name: field.annotation.__args__ for name, field in IntakeAnswers.model_fields.items()
+}
+
+# Bits per answer in the packed answers code (every question has at most 4 options)
+ANSWER_BITS = 2
+
+# Width of the packed answers code: q1_users in the lowest bits, q7_regulated in the highest
+ANSWERS_CODE_BITS = ANSWER_BITS * len(ANSWER_CHOICES)
+
+# Bits of each answer within the code
+ANSWER_MASKS: Dict[str, int] = {
+    name: ((1 << ANSWER_BITS) - 1) << (position * ANSWER_BITS)
+    for position, name in enumerate(ANSWER_CHOICES)
+}
+
+# Code bits of every option (answer -> option -> bits)
+_OPTION_BITS: Dict[str, Dict[str, int]] = {
+    name: {option: index << (position * ANSWER_BITS) for index, option in enumerate(choices)}
+    for position, (name, choices) in enumerate(ANSWER_CHOICES.items())
+}
+
+
+def encode_answers(answers: IntakeAnswers) -> int:
+    """
+    Canonical packed code of an answer combination (fits in ANSWERS_CODE_BITS bits).
+
+    Each answer takes ANSWER_BITS bits holding the index of the chosen option
+    in its Literal, so the code is stable as long as options are only ever
+    appended.
+    """
+    code = 0
+    for name, options in _OPTION_BITS.items():
+        code |= options[getattr(answers, name)]
+    return code
+
+
+def decode_answers(code: int) -> IntakeAnswers:
+    """
+    Answer combination of a packed code (inverse of encode_answers).
+
+    Raises:
+        ValueError: If the code does not encode a valid combination
+    """
+    if not 0 <= code < 1 << ANSWERS_CODE_BITS:
+        raise ValueError(f"Answers code out of range: {code}")
+
+    values = {}
+    for position, (name, choices) in enumerate(ANSWER_CHOICES.items()):
+        index = (code >> (position * ANSWER_BITS)) & ((1 << ANSWER_BITS) - 1)
+        if index >= len(choices):
+            raise ValueError(f"Answers code {code} has no option {index} for {name}")
+        values[name] = choices[index]
+    return IntakeAnswers(**values)
+
+
+def answers_mask(**criteria: str) -> Tuple[int, int]:
+    """
+    Bitmask test for intakes with the given answers.
+
+    An intake matches when (code & mask) == value, e.g.
+    answers_mask(q2_influence="Automated", q4_reversibility="Hard").
+
+    Raises:
+        ValueError: If an answer or option does not exist
+    """
+    mask = 0
+    value = 0
+    for name, option in criteria.items():
+        if name not in _OPTION_BITS:
+            raise ValueError(f"Unknown intake question: {name}")
+        if option not in _OPTION_BITS[name]:
+            raise ValueError(f"Unknown option for {name}: {option}")
+        mask |= ANSWER_MASKS[name]
+        value |= _OPTION_BITS[name][option]
+    return mask, value
+
+
+def answer_neighbours(code: int) -> Iterator[Tuple[str, str, int]]:
+    """
+    Every answer combination that differs from a code in exactly one answer.
+
+    Yields:
+        (question, alternative option, code of the changed combination)
+    """
+    for name, options in _OPTION_BITS.items():
+        current = code & ANSWER_MASKS[name]
+        for option, bits in options.items():
+            if bits != current:
+                yield name, option, (code & ~ANSWER_MASKS[name]) | bits
+
+
+def all_answer_codes() -> Iterator[int]:
+    """Every valid answers code, in increasing order."""
+    for code in range(1 << ANSWERS_CODE_BITS):
+        if all(
+            (code >> (position * ANSWER_BITS)) & ((1 << ANSWER_BITS) - 1) < len(choices)
+            for position, choices in enumerate(ANSWER_CHOICES.values())
+        ):
+            yield code
+
+
 class IntakeRequest(BaseModel):
     """
     Complete intake submission from user.
@@ -155,6 +258,48 @@ class IntakeResponse(BaseModel):
     )
 
 
+class IntakePreview(BaseModel):
+    """
+    Classification preview for unsaved intake answers (no intake ID, nothing stored).
+    """
+    project_name: str = Field(
+        ...,
+        description="Name of the project"
+    )
+    answers: IntakeAnswers = Field(
+        ...,
+        description="User's answers to intake questions"
+    )
+    answers_code: int = Field(
+        ...,
+        description="Packed answers code (encode_answers); previews for the same code and project name are identical"
+    )
+    classification: RiskClassification = Field(
+        ...,
+        description="Risk classification result"
+    )
+    warnings: list[ValidationWarning] = Field(
+        default_factory=list,
+        description="Validation warnings from 6-layer system"
+    )
+    expert_review_required: bool = Field(
+        default=False,
+        description="True if expert review is mandatory"
+    )
+    expert_review_recommended: bool = Field(
+        default=False,
+        description="True if expert review is recommended but not mandatory"
+    )
+    next_steps: list[str] = Field(
+        default_factory=list,
+        description="Actions user should take next"
+    )
+    artifacts_required: list[str] = Field(
+        default_factory=list,
+        description="QMS artifacts required for this risk level"
+    )
+
+
 class IntakeResponseSummary(BaseModel):
     """
     Simplified summary for listing intakes.
@@ -164,3 +309,65 @@ class IntakeResponseSummary(BaseModel):
     timestamp: datetime
     risk_level: Literal["R0", "R1", "R2", "R3"]
     expert_review_required: bool
+
+
+class IntakeBatchResult(BaseModel):
+    """
+    Outcome of one intake in a batch submission.
+    """
+    index: int = Field(
+        ...,
+        description="Position of the intake in the submitted array"
+    )
+    intake: Optional[IntakeResponseSummary] = Field(
+        None,
+        description="Saved intake (None if this item failed)"
+    )
+    expert_review_recommended: bool = Field(
+        default=False,
+        description="True if expert review is recommended but not mandatory"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Why this item was not saved (None on success)"
+    )
+
+
+class IntakeBatchResponse(BaseModel):
+    """
+    Per-item results of a batch intake submission.
+    """
+    submitted: int = Field(
+        ...,
+        description="Number of intakes in the request"
+    )
+    created: int = Field(
+        ...,
+        description="Number of intakes classified and saved"
+    )
+    failed: int = Field(
+        ...,
+        description="Number of intakes rejected or not saved"
+    )
+    results: list[IntakeBatchResult] = Field(
+        default_factory=list,
+        description="One result per submitted intake, in request order"
+    )
+
+
+class IntakeListPage(BaseModel):
+    """
+    One page of intake summaries (keyset pagination).
+    """
+    intakes: list[IntakeResponseSummary] = Field(
+        default_factory=list,
+        description="Intake summaries on this page"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page (None on the last page)"
+    )
+    limit: int = Field(
+        ...,
+        description="Page size used for this page"
+    )
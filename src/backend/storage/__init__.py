@@ -0,0 +1 @@
+"""Persistent storage backends for QMS Dashboard."""
@@ -0,0 +1,263 @@
+"""
+Readiness Threshold Calibration
+
+What-if sweep over readiness_thresholds.json using the portfolio matrix.
+For every risk level, each combination of
+
+- completion threshold (before volatility modifiers)
+- max_errors
+- max_warnings (None = unlimited)
+- volatility scale (multiplier on every volatility class modifier; 1.0 = as configured)
+
+is evaluated against the stored completion/error/warning counts of every
+project at that level with one broadcast comparison per chunk of projects,
+so thousands of settings cost no re-validation. Each setting reports how
+many required artifacts and projects would be ready and how many flip
+relative to the current configuration.
+
+Run `python storage/calibration.py` for the full sweep as CSV.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifacts.dependency_manager import DependencyManager
+from storage.portfolio import RISK_LEVELS, PortfolioMatrix, ReadinessThresholds, evaluate_readiness
+
+
+# Default sweep grid
+DEFAULT_COMPLETION_GRID = tuple(round(0.5 + 0.05 * step, 2) for step in range(11))  # 0.50 .. 1.00
+DEFAULT_MAX_ERRORS_GRID = (0, 1, 2, 3, 4, 5)
+DEFAULT_MAX_WARNINGS_GRID = (0, 1, 2, 3, 5, 8, None)
+DEFAULT_VOLATILITY_SCALE_GRID = (0.0, 0.5, 1.0, 1.5, 2.0)
+
+# Largest grid accepted (settings per risk level)
+MAX_GRID_SETTINGS = 20_000
+
+# Booleans materialized per broadcast chunk (bounds memory on large portfolios)
+MAX_CHUNK_ELEMENTS = 16_000_000
+
+
+class ThresholdSetting(BaseModel):
+    """Readiness outcome of one threshold combination at one risk level."""
+    completion: float = Field(description="Completion threshold before volatility modifiers")
+    max_errors: int
+    max_warnings: Optional[int] = Field(description="None = unlimited")
+    volatility_scale: float = Field(description="Multiplier on volatility modifiers (1.0 = as configured)")
+    is_current: bool = Field(default=False, description="True if this is the configured setting")
+
+    artifacts_ready: int = Field(description="Required artifacts that would be ready")
+    projects_ready: int = Field(description="Projects whose required artifacts would all be ready")
+    artifacts_became_ready: int = Field(description="Not ready today, ready with this setting")
+    artifacts_became_not_ready: int = Field(description="Ready today, not ready with this setting")
+    projects_became_ready: int
+    projects_became_not_ready: int
+
+
+class RiskLevelCalibration(BaseModel):
+    """Sweep results for one risk level."""
+    risk_level: str
+    projects: int
+    required_artifacts: int = Field(description="Required (project, artifact) pairs")
+
+    current_completion: float
+    current_max_errors: int
+    current_max_warnings: Optional[int]
+    current_artifacts_ready: int
+    current_projects_ready: int
+
+    settings: List[ThresholdSetting] = Field(description="Every grid combination, in grid order")
+
+
+def grid_size(*grids: Sequence) -> int:
+    """Number of settings a grid produces per risk level."""
+    size = 1
+    for grid in grids:
+        size *= len(grid)
+    return size
+
+
+def sweep_thresholds(
+    matrix: PortfolioMatrix,
+    manager: DependencyManager,
+    thresholds: ReadinessThresholds,
+    completion_grid: Sequence[float] = DEFAULT_COMPLETION_GRID,
+    max_errors_grid: Sequence[int] = DEFAULT_MAX_ERRORS_GRID,
+    max_warnings_grid: Sequence[Optional[int]] = DEFAULT_MAX_WARNINGS_GRID,
+    volatility_scale_grid: Sequence[float] = DEFAULT_VOLATILITY_SCALE_GRID,
+    risk_levels: Sequence[str] = RISK_LEVELS
+) -> List[RiskLevelCalibration]:
+    """
+    Evaluate every grid combination against the portfolio matrix.
+
+    Args:
+        matrix: Portfolio matrix (validation outcomes per project and artifact)
+        manager: Dependency manager providing the current thresholds and volatility modifiers
+        thresholds: Current thresholds over the matrix columns (defines required artifacts)
+        completion_grid: Completion thresholds to try
+        max_errors_grid: max_errors values to try
+        max_warnings_grid: max_warnings values to try (None = unlimited)
+        volatility_scale_grid: Volatility modifier multipliers to try
+        risk_levels: Risk levels to calibrate
+
+    Returns:
+        One RiskLevelCalibration per risk level
+
+    Raises:
+        ValueError: If the grid is empty or larger than MAX_GRID_SETTINGS
+    """
+    grids = (completion_grid, volatility_scale_grid, max_errors_grid, max_warnings_grid)
+    size = grid_size(*grids)
+    if size == 0 or size > MAX_GRID_SETTINGS:
+        raise ValueError(f"Grid must have between 1 and {MAX_GRID_SETTINGS} settings (got {size})")
+
+    completion_values = np.array(completion_grid, dtype=float)
+    scale_values = np.array(volatility_scale_grid, dtype=float)
+    error_values = np.array(max_errors_grid, dtype=float)
+    warning_values = np.array([np.inf if value is None else value for value in max_warnings_grid], dtype=float)
+    grid_shape = (len(completion_values), len(scale_values), len(error_values), len(warning_values))
+
+    modifiers = np.array([
+        manager.volatility_classes[manager.volatility_lookup.get(name, "foundation")]["modifier"]
+        for name in matrix.artifact_names
+    ])
+    current_ready = evaluate_readiness(matrix, thresholds)
+
+    calibrations = []
+    for risk_level in risk_levels:
+        level = RISK_LEVELS.index(risk_level)
+        rows = np.flatnonzero(matrix.risk_index == level)
+        columns = np.flatnonzero(thresholds.required[level])
+        config = manager.thresholds[risk_level]
+
+        # Effective completion per (completion, scale, artifact), as effective_completion clamps it
+        effective = np.clip(
+            completion_values[:, None, None] + scale_values[None, :, None] * modifiers[columns][None, None, :],
+            0.5, 1.0
+        )
+
+        counts = {name: np.zeros(grid_shape, dtype=np.int64) for name in (
+            "artifacts_ready", "projects_ready", "artifacts_became_ready",
+            "artifacts_became_not_ready", "projects_became_ready", "projects_became_not_ready"
+        )}
+
+        chunk = max(1, MAX_CHUNK_ELEMENTS // max(1, size * max(1, len(columns))))
+        for start in range(0, len(rows), chunk):
+            chunk_rows = rows[start:start + chunk]
+            cells = np.ix_(chunk_rows, columns)
+            completion = matrix.completion[cells]
+            present = matrix.present[cells]
+            current = current_ready[cells]
+
+            # (C, S, rows, A) & (E, rows, A) & (W, rows, A) -> (C, S, E, W, rows, A)
+            completion_ok = (completion[None, None] >= effective[:, :, None, :]) & present
+            errors_ok = matrix.errors[cells][None] <= error_values[:, None, None]
+            warnings_ok = matrix.warnings[cells][None] <= warning_values[:, None, None]
+            ready = (
+                completion_ok[:, :, None, None]
+                & errors_ok[None, None, :, None]
+                & warnings_ok[None, None, None, :]
+            )
+
+            project_ready = ready.all(axis=-1)
+            project_current = current.all(axis=-1)
+
+            counts["artifacts_ready"] += ready.sum(axis=(-2, -1))
+            counts["artifacts_became_ready"] += (ready & ~current).sum(axis=(-2, -1))
+            counts["artifacts_became_not_ready"] += (~ready & current).sum(axis=(-2, -1))
+            counts["projects_ready"] += project_ready.sum(axis=-1)
+            counts["projects_became_ready"] += (project_ready & ~project_current).sum(axis=-1)
+            counts["projects_became_not_ready"] += (~project_ready & project_current).sum(axis=-1)
+
+        settings = []
+        for index in np.ndindex(*grid_shape):
+            c, s, e, w = index
+            settings.append(ThresholdSetting(
+                completion=float(completion_values[c]),
+                max_errors=int(error_values[e]),
+                max_warnings=max_warnings_grid[w],
+                volatility_scale=float(scale_values[s]),
+                is_current=(
+                    completion_values[c] == config["completion"]
+                    and scale_values[s] == 1.0
+                    and error_values[e] == config["max_errors"]
+                    and max_warnings_grid[w] == config["max_warnings"]
+                ),
+                **{name: int(values[index]) for name, values in counts.items()}
+            ))
+
+        current_cells = current_ready[np.ix_(rows, columns)]
+        calibrations.append(RiskLevelCalibration(
+            risk_level=risk_level,
+            projects=len(rows),
+            required_artifacts=len(rows) * len(columns),
+            current_completion=config["completion"],
+            current_max_errors=config["max_errors"],
+            current_max_warnings=config["max_warnings"],
+            current_artifacts_ready=int(current_cells.sum()),
+            current_projects_ready=int(current_cells.all(axis=-1).sum()),
+            settings=settings
+        ))
+
+    return calibrations
+
+
+if __name__ == "__main__":
+    """Sweep the default grid over the materialized portfolio matrix and write CSV."""
+    import argparse
+    import csv
+
+    from artifacts.dependency_manager import get_dependency_manager
+    from config import get_config
+    from storage.intake_store import get_intake_store
+    from storage.portfolio import get_portfolio_readiness
+    from validation.classifier import get_required_artifacts
+
+    parser = argparse.ArgumentParser(description="Readiness threshold what-if sweep")
+    parser.add_argument("--risk-level", choices=RISK_LEVELS, action="append",
+                        help="Risk level to calibrate (repeatable, default all)")
+    parser.add_argument("--output", type=Path, help="CSV file (default stdout)")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="Only settings where at least one artifact flips")
+    args = parser.parse_args()
+
+    config = get_config()
+    manager = get_dependency_manager()
+    store = get_intake_store(config.get_intake_index_path())
+    store.ensure_migrated(config.intake_dir)
+
+    matrix = get_portfolio_readiness().current(
+        manager.validator, store.risk_levels(), manager.graph.nodes, answers_codes=store.answers_codes()
+    )
+    thresholds = ReadinessThresholds(
+        manager, matrix.artifact_names, {level: get_required_artifacts(level) for level in RISK_LEVELS}
+    )
+    calibrations = sweep_thresholds(matrix, manager, thresholds, risk_levels=args.risk_level or RISK_LEVELS)
+
+    output = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        fields = ["risk_level", "projects", *ThresholdSetting.model_fields]
+        writer = csv.DictWriter(output, fieldnames=fields)
+        writer.writeheader()
+        for calibration in calibrations:
+            for setting in calibration.settings:
+                if args.changed_only and not (setting.artifacts_became_ready or setting.artifacts_became_not_ready):
+                    continue
+                writer.writerow({
+                    "risk_level": calibration.risk_level,
+                    "projects": calibration.projects,
+                    **setting.model_dump()
+                })
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"\n✅ Swept {len(calibrations[0].settings) if calibrations else 0} setting(s) per risk level "
+          f"over {matrix.shape[0]} project(s)", file=sys.stderr)
@@ -0,0 +1,158 @@
+"""
+Intake Response Cache
+
+Bounded LRU cache of parsed IntakeResponse objects keyed by intake_id.
+Each entry remembers the mtime and size of the JSON file it was parsed from
+and is only served while the file on disk still matches, so edits made
+outside the API are picked up on the next request.
+"""
+
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.intake import IntakeResponse
+from config import get_config
+
+
+# Default number of parsed intakes kept in memory
+DEFAULT_MAX_ENTRIES = 256
+
+
+class IntakeCache:
+    """LRU cache of parsed intake responses, validated by file mtime and size."""
+
+    def __init__(self, intake_dir: Path = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize intake cache.
+
+        Args:
+            intake_dir: Directory containing intake JSON files (optional, uses config if not provided)
+            max_entries: Maximum number of parsed intakes to keep
+        """
+        # Phase 7 WS-1: Use centralized config
+        if intake_dir is None:
+            config = get_config()
+            intake_dir = config.intake_dir
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.intake_dir = Path(intake_dir)
+        self.max_entries = max_entries
+
+        # intake_id -> ((mtime_ns, size), IntakeResponse)
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], IntakeResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, intake_id: str) -> Optional[IntakeResponse]:
+        """
+        Get a parsed intake response.
+
+        Returns the cached object if the file is unchanged since it was
+        parsed; otherwise reads and parses the file and caches the result.
+
+        Returns:
+            IntakeResponse, or None if no intake file exists
+
+        Raises:
+            Exception: If the intake file exists but cannot be parsed
+        """
+        file_path = self.intake_dir / f"{intake_id}.json"
+
+        try:
+            signature = self._signature(file_path)
+        except FileNotFoundError:
+            self.invalidate(intake_id)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(intake_id)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(intake_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+        response = IntakeResponse(**data)
+
+        self._store(intake_id, signature, response)
+        return response
+
+    def put(self, response: IntakeResponse) -> None:
+        """
+        Cache a response that has just been written to disk (write-through).
+
+        Must be called after the JSON file is written so the recorded
+        signature matches the file.
+        """
+        file_path = self.intake_dir / f"{response.intake_id}.json"
+        self._store(response.intake_id, self._signature(file_path), response)
+
+    def invalidate(self, intake_id: str) -> None:
+        """Drop a cached intake, if present."""
+        with self._lock:
+            self._entries.pop(intake_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached intakes (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int | float]:
+        """Hit/miss/eviction counters for the metrics endpoint."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+    def _store(self, intake_id: str, signature: Tuple[int, int], response: IntakeResponse) -> None:
+        """Insert an entry and evict least-recently-used entries over capacity."""
+        with self._lock:
+            self._entries[intake_id] = (signature, response)
+            self._entries.move_to_end(intake_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @staticmethod
+    def _signature(file_path: Path) -> Tuple[int, int]:
+        """(mtime_ns, size) of an intake file."""
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+
+# Global cache instance
+_cache: Optional[IntakeCache] = None
+
+
+def get_intake_cache(intake_dir: Path = None) -> IntakeCache:
+    """
+    Get or create intake cache singleton.
+
+    Args:
+        intake_dir: Directory containing intake JSON files (optional, uses config if not provided)
+    """
+    global _cache
+    if _cache is None:
+        _cache = IntakeCache(intake_dir)
+    return _cache
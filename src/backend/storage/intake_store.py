@@ -0,0 +1,432 @@
+"""
+Indexed Intake Store
+
+SQLite index (WAL mode) over saved intake responses.
+The JSON files in intake-responses/ remain the system of record; this store
+holds the summary columns needed for listing so GET /api/intakes becomes an
+indexed range query instead of a full directory scan.
+
+Each row also keeps the packed answers code (models.intake.encode_answers),
+so questions like "all intakes with Automated + Hard" are a bitmask test
+(answers_code & mask = value) instead of parsing every intake file.
+"""
+
+import base64
+import json
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.intake import IntakeAnswers, IntakeResponse, IntakeResponseSummary, encode_answers
+from config import get_config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS intakes (
+    intake_id TEXT PRIMARY KEY,
+    project_name TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    ts_key TEXT NOT NULL,
+    risk_level TEXT NOT NULL,
+    expert_review_required INTEGER NOT NULL,
+    answers_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_intakes_ts
+    ON intakes (ts_key, intake_id);
+CREATE INDEX IF NOT EXISTS idx_intakes_risk_ts
+    ON intakes (risk_level, ts_key, intake_id);
+CREATE INDEX IF NOT EXISTS idx_intakes_review_ts
+    ON intakes (expert_review_required, ts_key, intake_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Meta key recording that the one-shot JSON import has run
+JSON_IMPORT_KEY = "json_import_completed"
+
+# Meta key recording that answers codes were filled in for rows indexed before the column existed
+ANSWERS_CODE_KEY = "answers_code_backfilled"
+
+# Page size bounds for keyset pagination
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def timestamp_key(timestamp: datetime) -> str:
+    """
+    Normalize a timestamp into a fixed-width, lexically sortable key.
+
+    Timezone-aware values are converted to naive UTC (intakes default to
+    datetime.utcnow()), and microseconds are always present so string
+    comparison matches chronological order.
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def encode_cursor(ts_key: str, intake_id: str) -> str:
+    """Encode a (timestamp key, intake_id) keyset position as an opaque token."""
+    raw = f"{ts_key}|{intake_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Decode a cursor token produced by encode_cursor().
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts_key, intake_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|", 1)
+        datetime.strptime(ts_key, "%Y-%m-%dT%H:%M:%S.%f")
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    if not intake_id:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    return ts_key, intake_id
+
+
+class IntakeStore:
+    """SQLite-backed index of intake summaries."""
+
+    def __init__(self, db_path: Path = None):
+        """
+        Initialize intake store.
+
+        Args:
+            db_path: Path to SQLite database (optional, uses config if not provided)
+        """
+        # Phase 7 WS-1: Use centralized config
+        if db_path is None:
+            config = get_config()
+            db_path = config.get_intake_index_path()
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Writes are serialized through one connection. Reads go through a
+        # connection per thread (_reader), so under WAL they see only
+        # committed transactions and proceed while a write is in flight.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # Indexes created before answers codes were stored get the column (filled by ensure_migrated)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(intakes)")}
+        if "answers_code" not in columns:
+            self._conn.execute("ALTER TABLE intakes ADD COLUMN answers_code INTEGER")
+
+    def close(self) -> None:
+        """Close the underlying database connections."""
+        with self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
+        self._conn.close()
+
+    def _reader(self) -> sqlite3.Connection:
+        """This thread's read connection (opened on first use)."""
+        reader = getattr(self._local, "conn", None)
+        if reader is None:
+            reader = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            reader.row_factory = sqlite3.Row
+            self._local.conn = reader
+            with self._readers_lock:
+                self._readers.append(reader)
+        return reader
+
+    def upsert(self, response: IntakeResponse) -> None:
+        """Insert or replace the index row for a single intake response."""
+        self.upsert_many([response])
+
+    def upsert_many(self, responses: Iterable[IntakeResponse]) -> int:
+        """
+        Insert or replace index rows for several intake responses in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        return self._write_rows([
+            self._to_row(response, encode_answers(response.answers)) for response in responses
+        ])
+
+    def _write_rows(self, rows: list[tuple]) -> int:
+        """Write index rows in a single transaction."""
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO intakes
+                        (intake_id, project_name, timestamp, ts_key,
+                         risk_level, expert_review_required, answers_code)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return len(rows)
+
+    def delete(self, intake_id: str) -> None:
+        """Remove an intake from the index."""
+        with self._lock:
+            self._conn.execute("DELETE FROM intakes WHERE intake_id = ?", (intake_id,))
+
+    def count(self) -> int:
+        """Number of indexed intakes."""
+        return self._reader().execute("SELECT COUNT(*) FROM intakes").fetchone()[0]
+
+    def risk_levels(self) -> dict[str, str]:
+        """Risk level of every indexed intake (intake_id -> risk level)."""
+        rows = self._reader().execute("SELECT intake_id, risk_level FROM intakes").fetchall()
+        return {row["intake_id"]: row["risk_level"] for row in rows}
+
+    def answers_codes(self) -> dict[str, int]:
+        """Packed answers code of every indexed intake (intake_id -> code)."""
+        rows = self._reader().execute(
+            "SELECT intake_id, answers_code FROM intakes WHERE answers_code IS NOT NULL"
+        ).fetchall()
+        return {row["intake_id"]: row["answers_code"] for row in rows}
+
+    def list_page(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        risk_level: Optional[str] = None,
+        expert_review_required: Optional[bool] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        descending: bool = True,
+        answers: Optional[tuple[int, int]] = None
+    ) -> tuple[list[IntakeResponseSummary], Optional[str]]:
+        """
+        Return one page of intake summaries using keyset pagination.
+
+        Pages are ordered on (timestamp, intake_id) so each page is an indexed
+        range query that starts where the previous one stopped, regardless of
+        how deep into the history it is.
+
+        Args:
+            limit: Page size (1 to MAX_PAGE_SIZE)
+            cursor: Token from a previous page's next_cursor
+            risk_level: Only intakes with this risk level
+            expert_review_required: Only intakes with this review flag
+            since: Only intakes at or after this timestamp
+            until: Only intakes strictly before this timestamp
+            descending: Newest first (default) or oldest first
+            answers: Only intakes whose answers code matches (mask, value),
+                as returned by models.intake.answers_mask
+
+        Returns:
+            (summaries, next_cursor) - next_cursor is None on the last page
+
+        Raises:
+            ValueError: If limit is out of range or the cursor is malformed
+        """
+        if not (1 <= limit <= MAX_PAGE_SIZE):
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+        clauses = []
+        params: list = []
+
+        if risk_level is not None:
+            clauses.append("risk_level = ?")
+            params.append(risk_level)
+
+        if expert_review_required is not None:
+            clauses.append("expert_review_required = ?")
+            params.append(int(expert_review_required))
+
+        if since is not None:
+            clauses.append("ts_key >= ?")
+            params.append(timestamp_key(since))
+
+        if until is not None:
+            clauses.append("ts_key < ?")
+            params.append(timestamp_key(until))
+
+        if answers is not None:
+            clauses.append("(answers_code & ?) = ?")
+            params.extend(answers)
+
+        if cursor is not None:
+            clauses.append("(ts_key, intake_id) < (?, ?)" if descending
+                           else "(ts_key, intake_id) > (?, ?)")
+            params.extend(decode_cursor(cursor))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        direction = "DESC" if descending else "ASC"
+
+        # Fetch one extra row to learn whether another page exists
+        rows = self._reader().execute(
+            f"""
+            SELECT intake_id, project_name, timestamp, ts_key, risk_level, expert_review_required
+            FROM intakes
+            {where}
+            ORDER BY ts_key {direction}, intake_id {direction}
+            LIMIT ?
+            """,
+            (*params, limit + 1)
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["ts_key"], last["intake_id"])
+
+        return [self._to_summary(row) for row in rows], next_cursor
+
+    def import_json_directory(self, intake_dir: Path) -> int:
+        """
+        Import every intake JSON file in a directory into the index.
+
+        Only the summary fields are read, and files that cannot be parsed are
+        skipped with a warning, matching the old directory-scan listing.
+
+        Returns:
+            Number of intakes imported
+        """
+        rows = []
+
+        for file_path in Path(intake_dir).glob("*.json"):
+            try:
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
+
+                summary = IntakeResponseSummary(
+                    intake_id=data["intake_id"],
+                    project_name=data["project_name"],
+                    timestamp=data["timestamp"],
+                    risk_level=data["classification"]["risk_level"],
+                    expert_review_required=data.get("expert_review_required", False)
+                )
+                try:
+                    answers_code = encode_answers(IntakeAnswers(**data["answers"]))
+                except Exception:
+                    # Still listed, just not matched by answer filters
+                    answers_code = None
+                rows.append(self._to_row(summary, answers_code))
+            except Exception as e:
+                print(f"[INTAKE-STORE] Warning: Could not import {file_path}: {e}")
+                continue
+
+        return self._write_rows(rows)
+
+    def ensure_migrated(self, intake_dir: Path) -> int:
+        """
+        One-shot migration of existing intake JSON files into the index.
+
+        Runs the import only the first time it is called against a database;
+        afterwards intakes arrive through write-through from
+        _save_intake_response. An index built before answers codes were
+        stored is re-imported once to fill them in.
+
+        Returns:
+            Number of intakes imported (0 if migration already ran)
+        """
+        done = {
+            row["key"] for row in self._reader().execute(
+                "SELECT key FROM meta WHERE key IN (?, ?)", (JSON_IMPORT_KEY, ANSWERS_CODE_KEY)
+            )
+        }
+        if done == {JSON_IMPORT_KEY, ANSWERS_CODE_KEY}:
+            return 0
+
+        imported = 0
+        if JSON_IMPORT_KEY not in done or self._reader().execute(
+            "SELECT 1 FROM intakes WHERE answers_code IS NULL LIMIT 1"
+        ).fetchone() is not None:
+            imported = self.import_json_directory(intake_dir)
+            print(f"[INTAKE-STORE] Imported {imported} intake(s) from {intake_dir}")
+
+        now = datetime.utcnow().isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, now) for key in (JSON_IMPORT_KEY, ANSWERS_CODE_KEY) if key not in done]
+            )
+
+        return imported
+
+    def _to_row(self, intake: IntakeResponse | IntakeResponseSummary, answers_code: Optional[int]) -> tuple:
+        """Convert an intake response (or summary) and its answers code into an index row."""
+        if isinstance(intake, IntakeResponse):
+            risk_level = intake.classification.risk_level
+        else:
+            risk_level = intake.risk_level
+
+        return (
+            intake.intake_id,
+            intake.project_name,
+            intake.timestamp.isoformat(),
+            timestamp_key(intake.timestamp),
+            risk_level,
+            int(intake.expert_review_required),
+            answers_code
+        )
+
+    def _to_summary(self, row: sqlite3.Row) -> IntakeResponseSummary:
+        """Convert an index row into an API summary."""
+        return IntakeResponseSummary(
+            intake_id=row["intake_id"],
+            project_name=row["project_name"],
+            timestamp=row["timestamp"],
+            risk_level=row["risk_level"],
+            expert_review_required=bool(row["expert_review_required"])
+        )
+
+
+# Global store instance
+_store: Optional[IntakeStore] = None
+
+
+def get_intake_store(db_path: Path = None) -> IntakeStore:
+    """
+    Get or create intake store singleton.
+
+    Args:
+        db_path: Path to SQLite database (optional, uses config if not provided)
+    """
+    global _store
+    if _store is None:
+        _store = IntakeStore(db_path)
+    return _store
+
+
+if __name__ == "__main__":
+    """Run the one-shot JSON import manually (e.g. after restoring a backup)."""
+    config = get_config()
+    store = get_intake_store()
+    count = store.import_json_directory(config.intake_dir)
+    print(f"\n✅ Indexed {count} intake(s) into {store.db_path}")
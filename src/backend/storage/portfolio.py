@@ -0,0 +1,503 @@
+"""
+Portfolio Readiness Matrix
+
+Validation outcomes of every artifact of every project, materialized as
+dense NumPy arrays indexed by (project, artifact):
+
+- completion (float64), errors and warnings (int32), present (bool)
+- file mtime_ns and size (int64), so a refresh only re-validates projects
+  whose artifact files changed
+- per project, the packed answers code (models.intake.encode_answers), so
+  slicing the portfolio by intake answers is a bitmask test over one array
+
+Readiness against readiness_thresholds.json (plus volatility modifiers) is
+evaluated with vectorized comparisons over the whole matrix, so changing a
+threshold never requires re-validating anything. The matrix is saved to
+$QMS_DATA_ROOT/portfolio-readiness.npz; `python storage/portfolio.py`
+rebuilds it as a batch job.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifacts.dependency_manager import DependencyManager
+from artifacts.snapshot import ProjectSnapshot, artifact_filename
+from artifacts.validator import ArtifactValidator
+from config import get_config
+from storage.validation_cache import get_validation_cache
+
+
+# Risk levels, in matrix order
+RISK_LEVELS = ("R0", "R1", "R2", "R3")
+
+# Seconds before the endpoint refreshes the matrix on its own
+DEFAULT_MAX_AGE = 60.0
+
+# Arrays stored per matrix (one row per project)
+MATRIX_ARRAYS = ("completion", "errors", "warnings", "present", "mtime_ns", "size")
+
+
+class PortfolioMatrix:
+    """Validation outcomes of every (project, artifact) pair (never mutated once built)."""
+
+    def __init__(
+        self,
+        project_ids: Sequence[str],
+        risk_index: np.ndarray,
+        artifact_names: Sequence[str],
+        arrays: Mapping[str, np.ndarray],
+        criteria_version: str,
+        built_at: float,
+        answers_code: Optional[np.ndarray] = None,
+        rules_version: str = ""
+    ):
+        """
+        Initialize matrix.
+
+        Args:
+            project_ids: Intake ID per row
+            risk_index: Index into RISK_LEVELS per row
+            artifact_names: Artifact name per column
+            arrays: Every MATRIX_ARRAYS entry, each shaped (projects, artifacts)
+            criteria_version: Acceptance criteria version the artifacts were validated against
+            built_at: Unix time the matrix was built
+            answers_code: Packed answers code per row (-1 if unknown; all unknown if not provided)
+            rules_version: Validator code version the artifacts were validated with ("" if unknown)
+        """
+        self.project_ids: Tuple[str, ...] = tuple(project_ids)
+        self.risk_index = risk_index
+        self.artifact_names: Tuple[str, ...] = tuple(artifact_names)
+        self.criteria_version = criteria_version
+        self.rules_version = rules_version
+        self.built_at = built_at
+
+        self.completion: np.ndarray = arrays["completion"]
+        self.errors: np.ndarray = arrays["errors"]
+        self.warnings: np.ndarray = arrays["warnings"]
+        self.present: np.ndarray = arrays["present"]
+        self.mtime_ns: np.ndarray = arrays["mtime_ns"]
+        self.size: np.ndarray = arrays["size"]
+        self.answers_code: np.ndarray = (
+            answers_code if answers_code is not None else np.full(len(self.project_ids), -1, dtype=np.int32)
+        )
+
+        self.position: Dict[str, int] = {project_id: row for row, project_id in enumerate(self.project_ids)}
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(projects, artifacts)"""
+        return self.completion.shape
+
+    def rows_with_answers(self, mask: int, value: int) -> np.ndarray:
+        """Bool array of the rows whose answers code matches (mask, value) from models.intake.answers_mask."""
+        return (self.answers_code >= 0) & ((self.answers_code & mask) == value)
+
+    def subset(self, rows: np.ndarray) -> "PortfolioMatrix":
+        """Matrix of only the selected rows (bool array over projects)."""
+        return PortfolioMatrix(
+            [project_id for project_id, keep in zip(self.project_ids, rows) if keep],
+            self.risk_index[rows],
+            self.artifact_names,
+            {name: getattr(self, name)[rows] for name in MATRIX_ARRAYS},
+            self.criteria_version,
+            self.built_at,
+            self.answers_code[rows],
+            self.rules_version
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the matrix to an .npz file atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f,
+                    project_ids=np.array(self.project_ids, dtype=str),
+                    risk_index=self.risk_index,
+                    artifact_names=np.array(self.artifact_names, dtype=str),
+                    criteria_version=np.array(self.criteria_version),
+                    rules_version=np.array(self.rules_version),
+                    built_at=np.array(self.built_at),
+                    answers_code=self.answers_code,
+                    **{name: getattr(self, name) for name in MATRIX_ARRAYS}
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["PortfolioMatrix"]:
+        """Read a saved matrix, or None if there is none (or it cannot be read)."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return cls(
+                    project_ids=[str(project_id) for project_id in data["project_ids"]],
+                    risk_index=data["risk_index"],
+                    artifact_names=[str(name) for name in data["artifact_names"]],
+                    arrays={name: data[name] for name in MATRIX_ARRAYS},
+                    criteria_version=str(data["criteria_version"]),
+                    built_at=float(data["built_at"]),
+                    # Matrices saved before answers codes were stored load with every code unknown
+                    answers_code=data["answers_code"] if "answers_code" in data else None,
+                    # Matrices saved before rules versions were stored never match a validator (stale)
+                    rules_version=str(data["rules_version"]) if "rules_version" in data else ""
+                )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[PORTFOLIO] Warning: Ignoring unreadable matrix {path}: {e}")
+            return None
+
+
+class ReadinessThresholds:
+    """readiness_thresholds.json and volatility modifiers as arrays over (risk level, artifact)."""
+
+    def __init__(
+        self,
+        manager: DependencyManager,
+        artifact_names: Sequence[str],
+        required_artifacts: Mapping[str, Sequence[str]]
+    ):
+        """
+        Initialize thresholds.
+
+        Args:
+            manager: Dependency manager whose thresholds and volatility classes apply
+            artifact_names: Matrix columns
+            required_artifacts: Risk level -> artifacts required at that level
+        """
+        self.config_version = manager.config_version
+
+        # Volatility-adjusted completion each artifact needs at each risk level
+        self.completion = np.array([
+            [manager.effective_completion(name, risk_level) for name in artifact_names]
+            for risk_level in RISK_LEVELS
+        ])
+        self.max_errors = np.array(
+            [manager.thresholds[risk_level]["max_errors"] for risk_level in RISK_LEVELS], dtype=float
+        )
+        self.max_warnings = np.array([
+            np.inf if manager.thresholds[risk_level]["max_warnings"] is None
+            else manager.thresholds[risk_level]["max_warnings"]
+            for risk_level in RISK_LEVELS
+        ])
+        self.required = np.array([
+            [name in required_artifacts.get(risk_level, ()) for name in artifact_names]
+            for risk_level in RISK_LEVELS
+        ])
+
+
+def evaluate_readiness(matrix: PortfolioMatrix, thresholds: ReadinessThresholds) -> np.ndarray:
+    """
+    Readiness of every (project, artifact) pair, as DependencyManager.is_ready decides it.
+
+    Returns:
+        Bool array shaped (projects, artifacts); missing artifacts are not ready
+    """
+    risk = matrix.risk_index
+    return (
+        matrix.present
+        & (matrix.completion >= thresholds.completion[risk])
+        & (matrix.errors <= thresholds.max_errors[risk, None])
+        & (matrix.warnings <= thresholds.max_warnings[risk, None])
+    )
+
+
+class RiskLevelReadiness(BaseModel):
+    """Readiness of every project at one risk level."""
+    risk_level: str
+    projects: int = Field(description="Projects at this risk level with generated artifacts")
+    projects_ready: int = Field(description="Projects whose required artifacts are all ready")
+    required_artifacts: int = Field(description="Required (project, artifact) pairs")
+    artifacts_ready: int = Field(description="Required artifacts that are ready")
+    artifacts_missing: int = Field(description="Required artifacts not generated")
+    mean_completion: float = Field(description="Mean completion over required artifacts (missing count as 0)")
+    artifact_ready_rate: Dict[str, float] = Field(
+        description="Artifact -> share of projects where it is ready (required artifacts only)"
+    )
+
+
+def summarize(matrix: PortfolioMatrix, thresholds: ReadinessThresholds) -> List[RiskLevelReadiness]:
+    """Per-risk-level aggregates of the matrix (risk levels without projects included as zeros)."""
+    levels = len(RISK_LEVELS)
+    risk = matrix.risk_index
+    required = thresholds.required[risk]                     # (projects, artifacts)
+    ready = evaluate_readiness(matrix, thresholds) & required
+
+    projects = np.bincount(risk, minlength=levels)
+    projects_ready = np.bincount(risk, weights=(ready | ~required).all(axis=1), minlength=levels)
+    artifacts_ready = np.bincount(risk, weights=ready.sum(axis=1), minlength=levels)
+    artifacts_missing = np.bincount(risk, weights=(required & ~matrix.present).sum(axis=1), minlength=levels)
+    completion_sum = np.bincount(
+        risk, weights=np.where(required, matrix.completion, 0.0).sum(axis=1), minlength=levels
+    )
+
+    ready_by_level = np.zeros((levels, len(matrix.artifact_names)))
+    np.add.at(ready_by_level, risk, ready)
+
+    summaries = []
+    for level, risk_level in enumerate(RISK_LEVELS):
+        required_count = int(projects[level] * thresholds.required[level].sum())
+        summaries.append(RiskLevelReadiness(
+            risk_level=risk_level,
+            projects=int(projects[level]),
+            projects_ready=int(projects_ready[level]),
+            required_artifacts=required_count,
+            artifacts_ready=int(artifacts_ready[level]),
+            artifacts_missing=int(artifacts_missing[level]),
+            mean_completion=float(completion_sum[level] / required_count) if required_count else 0.0,
+            artifact_ready_rate={
+                name: float(ready_by_level[level, column] / projects[level])
+                for column, name in enumerate(matrix.artifact_names)
+                if projects[level] and thresholds.required[level, column]
+            }
+        ))
+    return summaries
+
+
+class PortfolioReadiness:
+    """Materialized portfolio matrix, refreshed incrementally from the artifacts directory."""
+
+    def __init__(
+        self,
+        artifacts_root: Path,
+        matrix_path: Optional[Path] = None,
+        cache=None,
+        max_age: float = DEFAULT_MAX_AGE
+    ):
+        """
+        Initialize portfolio readiness.
+
+        Args:
+            artifacts_root: Directory with one artifacts directory per intake
+            matrix_path: Where the matrix is saved (optional, memory only if not provided)
+            cache: Validation result cache (optional)
+            max_age: Seconds before current() refreshes the matrix
+        """
+        self.artifacts_root = Path(artifacts_root)
+        self.matrix_path = Path(matrix_path) if matrix_path is not None else None
+        self.cache = cache
+        self.max_age = max_age
+
+        self.matrix: Optional[PortfolioMatrix] = (
+            PortfolioMatrix.load(self.matrix_path) if self.matrix_path is not None else None
+        )
+        self._lock = threading.Lock()
+
+        # Counters
+        self._builds = 0
+        self._rows_reused = 0
+        self._rows_validated = 0
+
+    def current(
+        self,
+        validator: ArtifactValidator,
+        projects: Mapping[str, str],
+        artifact_names: Sequence[str],
+        refresh: bool = False,
+        answers_codes: Optional[Mapping[str, int]] = None
+    ) -> PortfolioMatrix:
+        """
+        The materialized matrix, refreshed first if it is missing, older than
+        max_age, built for other criteria, validator rules or artifacts, or refresh
+        is requested.
+
+        answers_codes (intake ID -> packed answers code) is used when refreshing.
+        """
+        matrix = self.matrix
+        if (
+            refresh
+            or matrix is None
+            or time.time() - matrix.built_at >= self.max_age
+            or matrix.criteria_version != validator.config_version
+            or matrix.rules_version != validator.rules_version
+            or matrix.artifact_names != tuple(artifact_names)
+        ):
+            matrix = self.refresh(validator, projects, artifact_names, answers_codes)
+        return matrix
+
+    def refresh(
+        self,
+        validator: ArtifactValidator,
+        projects: Mapping[str, str],
+        artifact_names: Sequence[str],
+        answers_codes: Optional[Mapping[str, int]] = None
+    ) -> PortfolioMatrix:
+        """
+        Rebuild the matrix, re-validating only projects whose files changed.
+
+        Args:
+            validator: WS-1 validator (a different criteria or rules version re-validates everything)
+            projects: Intake ID -> risk level (only intakes with an artifacts directory are included)
+            artifact_names: Matrix columns
+            answers_codes: Intake ID -> packed answers code (optional, -1 for intakes not listed)
+
+        Returns:
+            The new matrix (also saved to matrix_path if set)
+        """
+        with self._lock:
+            artifact_names = tuple(artifact_names)
+            project_ids = sorted(
+                project_id for project_id, risk_level in projects.items()
+                if risk_level in RISK_LEVELS and (self.artifacts_root / project_id).is_dir()
+            )
+            shape = (len(project_ids), len(artifact_names))
+            risk_index = np.array([RISK_LEVELS.index(projects[project_id]) for project_id in project_ids],
+                                  dtype=np.int64)
+            answers_codes = answers_codes or {}
+            answers_code = np.array([answers_codes.get(project_id, -1) for project_id in project_ids],
+                                    dtype=np.int32)
+
+            arrays = {
+                "completion": np.zeros(shape),
+                "errors": np.zeros(shape, dtype=np.int32),
+                "warnings": np.zeros(shape, dtype=np.int32),
+                "present": np.zeros(shape, dtype=bool),
+                "mtime_ns": np.full(shape, -1, dtype=np.int64),
+                "size": np.full(shape, -1, dtype=np.int64),
+            }
+
+            # File signatures first: a file written during the refresh is picked up next time
+            for row, project_id in enumerate(project_ids):
+                for column, name in enumerate(artifact_names):
+                    try:
+                        stat = os.stat(self.artifacts_root / project_id / artifact_filename(name))
+                    except FileNotFoundError:
+                        continue
+                    arrays["mtime_ns"][row, column] = stat.st_mtime_ns
+                    arrays["size"][row, column] = stat.st_size
+
+            # Rows of the previous matrix that are still valid
+            previous = self.matrix
+            reusable = np.zeros(len(project_ids), dtype=bool)
+            previous_rows = np.full(len(project_ids), -1, dtype=np.int64)
+            if (
+                previous is not None
+                and previous.criteria_version == validator.config_version
+                and previous.rules_version == validator.rules_version
+                and previous.artifact_names == artifact_names
+            ):
+                previous_rows[:] = [previous.position.get(project_id, -1) for project_id in project_ids]
+                known = previous_rows >= 0
+                rows = previous_rows[known]
+                reusable[known] = (
+                    (previous.risk_index[rows] == risk_index[known])
+                    & (previous.mtime_ns[rows] == arrays["mtime_ns"][known]).all(axis=1)
+                    & (previous.size[rows] == arrays["size"][known]).all(axis=1)
+                )
+                for name in ("completion", "errors", "warnings", "present"):
+                    arrays[name][reusable] = getattr(previous, name)[previous_rows[reusable]]
+
+            for row in np.flatnonzero(~reusable):
+                project_id = project_ids[row]
+                snapshot = ProjectSnapshot(
+                    self.artifacts_root / project_id, RISK_LEVELS[risk_index[row]], validator, self.cache
+                )
+                for column, name in enumerate(artifact_names):
+                    result = snapshot.validation(name)
+                    if result is None:
+                        continue
+                    arrays["completion"][row, column] = result.completion_percent
+                    arrays["errors"][row, column] = sum(1 for issue in result.issues if issue.severity == "error")
+                    arrays["warnings"][row, column] = sum(1 for issue in result.issues if issue.severity == "warning")
+                    arrays["present"][row, column] = True
+
+            matrix = PortfolioMatrix(
+                project_ids, risk_index, artifact_names, arrays, validator.config_version, time.time(),
+                answers_code, validator.rules_version
+            )
+
+            if self.matrix_path is not None:
+                try:
+                    matrix.save(self.matrix_path)
+                except OSError as e:
+                    print(f"[PORTFOLIO] Warning: Could not save matrix: {e}")
+
+            self.matrix = matrix
+            self._builds += 1
+            self._rows_reused += int(reusable.sum())
+            self._rows_validated += int((~reusable).sum())
+            return matrix
+
+    def stats(self) -> Dict:
+        """Matrix size and refresh counters for diagnostics."""
+        matrix = self.matrix
+        return {
+            "projects": matrix.shape[0] if matrix is not None else 0,
+            "built_at": built_at_iso(matrix) if matrix is not None else None,
+            "builds": self._builds,
+            "rows_reused": self._rows_reused,
+            "rows_validated": self._rows_validated
+        }
+
+
+def built_at_iso(matrix: PortfolioMatrix) -> str:
+    """Matrix build time as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(matrix.built_at, tz=timezone.utc).isoformat()
+
+
+# Global portfolio instance
+_portfolio: Optional[PortfolioReadiness] = None
+
+
+def get_portfolio_readiness() -> PortfolioReadiness:
+    """
+    Get or create the portfolio readiness singleton.
+
+    Uses the shared validation cache, so artifacts already validated by other
+    endpoints are not validated again.
+    """
+    global _portfolio
+    if _portfolio is None:
+        # Phase 7 WS-1: Use centralized config
+        config = get_config()
+        _portfolio = PortfolioReadiness(
+            config.artifacts_dir,
+            config.get_portfolio_matrix_path(),
+            get_validation_cache()
+        )
+    return _portfolio
+
+
+if __name__ == "__main__":
+    """Rebuild the portfolio matrix as a batch job and print the per-risk-level summary."""
+    from artifacts.dependency_manager import get_dependency_manager
+    from storage.intake_store import get_intake_store
+    from validation.classifier import get_required_artifacts
+
+    config = get_config()
+    manager = get_dependency_manager()
+    store = get_intake_store(config.get_intake_index_path())
+    store.ensure_migrated(config.intake_dir)
+    projects = store.risk_levels()
+    artifact_names = manager.graph.nodes
+
+    portfolio = get_portfolio_readiness()
+    start = time.perf_counter()
+    matrix = portfolio.refresh(manager.validator, projects, artifact_names, store.answers_codes())
+    elapsed = time.perf_counter() - start
+
+    thresholds = ReadinessThresholds(
+        manager, artifact_names, {risk_level: get_required_artifacts(risk_level) for risk_level in RISK_LEVELS}
+    )
+    print(f"\n✅ Portfolio matrix: {matrix.shape[0]} project(s) x {matrix.shape[1]} artifact(s) "
+          f"in {elapsed:.2f}s -> {portfolio.matrix_path}")
+    for level in summarize(matrix, thresholds):
+        print(f"  {level.risk_level}: {level.projects_ready}/{level.projects} projects ready, "
+              f"{level.artifacts_ready}/{level.required_artifacts} artifacts ready, "
+              f"mean completion {level.mean_completion:.0%}")
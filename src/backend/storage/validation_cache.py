@@ -0,0 +1,225 @@
+"""
+Validation Result Cache
+
+Content-addressed cache of WS-1 ValidationResult objects. Entries are keyed
+by (sha256 of the artifact content, artifact name, risk level, acceptance
+criteria version, validator code version), so an unchanged artifact is
+validated once no matter how many endpoints or dashboard polls look at it,
+and a criteria or validator code change naturally misses (also in the
+on-disk tier, which outlives the code that wrote it).
+
+Two tiers:
+- In-memory LRU bounded by entry count (always on)
+- Optional on-disk tier under $QMS_DATA_ROOT/validation-cache/ that
+  survives restarts (QMS_VALIDATION_CACHE_DISK=true)
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from artifacts.validator import ArtifactValidator, ValidationResult
+from config import get_config
+
+
+# Default number of validation results kept in memory
+DEFAULT_MAX_ENTRIES = 1024
+
+# (content sha256, artifact_name, risk_level, criteria_version, rules_version)
+CacheKey = Tuple[str, str, str, str, str]
+
+
+class ValidationCache:
+    """LRU cache of validation results keyed by content hash, criteria and code version."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: Optional[Path] = None):
+        """
+        Initialize validation cache.
+
+        Args:
+            max_entries: Maximum number of results kept in memory
+            disk_dir: Directory for the on-disk tier (optional, memory only if not provided)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[CacheKey, ValidationResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0  # Artifact content not re-validated thanks to hits
+
+    def validate(
+        self,
+        validator: ArtifactValidator,
+        artifact_name: str,
+        content: str,
+        risk_level: str
+    ) -> ValidationResult:
+        """
+        Validate an artifact, reusing a cached result for identical content.
+
+        Drop-in for validator.validate_artifact(artifact_name, content, risk_level).
+        Cached results are shared between callers and must not be mutated.
+        """
+        encoded = content.encode("utf-8")
+        key = (
+            hashlib.sha256(encoded).hexdigest(),
+            artifact_name,
+            risk_level,
+            validator.config_version,
+            validator.rules_version
+        )
+
+        result = self._get(key, len(encoded))
+        if result is not None:
+            return result
+
+        with self._lock:
+            self.misses += 1
+
+        result = validator.validate_artifact(artifact_name, content, risk_level)
+        self._store(key, result)
+        self._write_disk(key, result)
+        return result
+
+    def lookup(
+        self,
+        validator: ArtifactValidator,
+        artifact_name: str,
+        content_sha256: str,
+        risk_level: str,
+        size: int = 0
+    ) -> Optional[ValidationResult]:
+        """
+        Cached result for content known only by its sha256 (e.g. from the artifact manifest).
+
+        Returns None if not cached; the caller then reads the content and
+        calls validate() (only that call counts as a miss).
+
+        Args:
+            size: Content size in bytes (counted as bytes saved on a hit)
+        """
+        return self._get(
+            (content_sha256, artifact_name, risk_level, validator.config_version, validator.rules_version),
+            size
+        )
+
+    def _get(self, key: CacheKey, size: int) -> Optional[ValidationResult]:
+        """Result from memory or disk (promoted to memory), counting the hit."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.bytes_saved += size
+                return result
+
+        result = self._read_disk(key)
+        if result is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self.bytes_saved += size
+            self._store(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop all in-memory results (counters and the disk tier are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int | float | bool]:
+        """Hit/miss/eviction counters for the metrics endpoint."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "disk_enabled": self.disk_dir is not None
+            }
+
+    def _store(self, key: CacheKey, result: ValidationResult) -> None:
+        """Insert an entry and evict least-recently-used entries over capacity."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _disk_path(self, key: CacheKey) -> Path:
+        """File for a cache key: <disk_dir>/<2 hex>/<sha256 of the key>.json"""
+        digest = hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
+        return self.disk_dir / digest[:2] / f"{digest}.json"
+
+    def _read_disk(self, key: CacheKey) -> Optional[ValidationResult]:
+        """Load a result from the disk tier, ignoring missing or unreadable files."""
+        if self.disk_dir is None:
+            return None
+
+        try:
+            return ValidationResult.model_validate_json(self._disk_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[VALIDATION-CACHE] Warning: Ignoring unreadable cache entry: {e}")
+            return None
+
+    def _write_disk(self, key: CacheKey, result: ValidationResult) -> None:
+        """Write a result to the disk tier atomically (best effort)."""
+        if self.disk_dir is None:
+            return
+
+        path = self._disk_path(key)
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                f.write(result.model_dump_json())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            print(f"[VALIDATION-CACHE] Warning: Could not write cache entry: {e}")
+
+
+# Global cache instance
+_cache: Optional[ValidationCache] = None
+
+
+def get_validation_cache() -> ValidationCache:
+    """
+    Get or create validation cache singleton.
+
+    The disk tier is enabled when QMS_VALIDATION_CACHE_DISK is set.
+    """
+    global _cache
+    if _cache is None:
+        # Phase 7 WS-1: Use centralized config
+        config = get_config()
+        disk_dir = config.get_validation_cache_dir() if config.validation_cache_disk else None
+        _cache = ValidationCache(disk_dir=disk_dir)
+    return _cache
@@ -0,0 +1,339 @@
+"""
+Intake Decision Table
+
+Everything submit_intake decides about an intake - classification, warnings
+from Layers 1-4, expert review flags (Layer 5), required artifacts and next
+steps - depends only on the seven intake answers, apart from the project
+name check. The answers allow 3x3x4x3x3x4x3 = 3,888 combinations, so the
+whole pipeline is evaluated once per combination at startup and a
+submission becomes a table lookup by packed answers code (encode_answers).
+
+The project name check only adds Layer 1 warnings, which Layer 5 counts; the
+table is therefore keyed by (answers code, project name warnings), with
+entries for the name warnings of NAME_EXAMPLES built up front and any other
+name warnings evaluated on first use.
+
+evaluate_intake() is the layered reference; verify() re-runs it for every
+entry and reports any difference (python validation/decision_table.py --verify).
+The table's version is a hash of the pipeline's source, for cache validators.
+
+sensitivity() reads the entries of every single-answer change of an intake
+(16 neighbours) to show which answers would move the risk level, the rigor
+or the expert review flags.
+"""
+
+import argparse
+import hashlib
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.intake import (
+    ANSWERS_CODE_BITS,
+    IntakeAnswers,
+    RiskClassification,
+    ValidationWarning,
+    all_answer_codes,
+    answer_neighbours,
+    decode_answers,
+    encode_answers
+)
+from validation.classifier import classify_risk, get_required_artifacts
+from validation.layer1 import validate_intake_answers, validate_project_name
+from validation.layer2 import cross_validate
+from validation.layer3 import detect_risk_indicators
+from validation.layer4 import generate_confirmation_warnings
+from validation.layer5 import determine_expert_review
+
+
+# Project names whose name warnings (none, empty, generic) are tabulated up front
+NAME_EXAMPLES = ("Project", " ", "test")
+
+# (severity, layer, message, recommendation) of each project name warning
+NameKey = Tuple[Tuple[str, str, str, Optional[str]], ...]
+
+class IntakeDecision(BaseModel):
+    """Result of the validation pipeline for one intake."""
+    classification: RiskClassification
+    warnings: List[ValidationWarning] = Field(description="Layers 1-4 and classifier warnings, in pipeline order")
+    expert_review_required: bool
+    expert_review_recommended: bool
+    review_reasons: List[str]
+    artifacts_required: List[str]
+    next_steps: List[str]
+
+
+class AnswerChange(BaseModel):
+    """Pipeline result if one answer of an intake were different."""
+    question: str
+    answer: str = Field(description="Current answer")
+    alternative: str = Field(description="Answer it is changed to")
+    risk_level: str
+    rigor: str
+    expert_review_required: bool
+    expert_review_recommended: bool
+    changes_risk_level: bool
+    changes_rigor: bool
+    changes_expert_review: bool = Field(description="Required or recommended flag differs")
+
+
+def generate_next_steps(
+    classification: RiskClassification,
+    expert_review_required: bool,
+    expert_review_recommended: bool,
+    artifacts_required: list[str]
+) -> list[str]:
+    """
+    Generate list of next steps for the user.
+    """
+    steps = []
+
+    # Step 1: Expert review if needed
+    if expert_review_required:
+        steps.append("🔴 REQUIRED: Submit for expert review before proceeding")
+    elif expert_review_recommended:
+        steps.append("🟡 RECOMMENDED: Consider expert review for validation")
+
+    # Step 2: Review classification
+    steps.append(f"Review your risk classification: {classification.risk_level} ({classification.rigor} rigor)")
+
+    # Step 3: Review warnings
+    steps.append("Review all warnings and recommendations above")
+
+    # Step 4: Generate artifacts
+    artifact_count = len(artifacts_required)
+    steps.append(f"Generate {artifact_count} required QMS artifacts: {', '.join(artifacts_required[:3])}{'...' if artifact_count > 3 else ''}")
+
+    # Step 5: Begin implementation
+    steps.append("Review and approve quality plan before implementation begins")
+
+    return steps
+
+
+def evaluate_intake(answers: IntakeAnswers, project_name: str) -> IntakeDecision:
+    """
+    Run the validation pipeline layer by layer (reference for the table).
+
+    1. Layer 1: Input validation (all questions answered, basic sanity)
+    2. Layer 2: Cross-validation (detect contradictions)
+    3. Layer 3: Risk indicators (flag high-risk patterns)
+    4. Classification: Calculate risk level (R0-R3)
+    5. Layer 4: Confirmation warnings (require acknowledgment)
+    6. Layer 5: Expert review triggers (escalate if needed)
+    """
+    warnings: list[ValidationWarning] = []
+
+    # Layer 1: Input Validation
+    warnings.extend(validate_project_name(project_name))
+    warnings.extend(validate_intake_answers(answers))
+
+    # Layer 2: Cross-Validation (detect contradictions)
+    warnings.extend(cross_validate(answers))
+
+    # Layer 3: Risk Indicators (flag high-risk patterns)
+    warnings.extend(detect_risk_indicators(answers))
+
+    # CLASSIFICATION (using Phase 1 classifier)
+    classification, classification_warnings = classify_risk(answers)
+    warnings.extend(classification_warnings)
+
+    # Layer 4: Confirmation Warnings
+    warnings.extend(generate_confirmation_warnings(answers, classification))
+
+    # Determine required artifacts
+    artifacts_required = get_required_artifacts(classification.risk_level)
+
+    # Layer 5: Expert Review Triggers
+    expert_review_required, expert_review_recommended, review_reasons = determine_expert_review(
+        answers,
+        classification,
+        warnings
+    )
+
+    return IntakeDecision(
+        classification=classification,
+        warnings=warnings,
+        expert_review_required=expert_review_required,
+        expert_review_recommended=expert_review_recommended,
+        review_reasons=review_reasons,
+        artifacts_required=artifacts_required,
+        next_steps=generate_next_steps(
+            classification,
+            expert_review_required,
+            expert_review_recommended,
+            artifacts_required
+        )
+    )
+
+
+def _name_key(name_warnings: List[ValidationWarning]) -> NameKey:
+    return tuple((w.severity, w.layer, w.message, w.recommendation) for w in name_warnings)
+
+
+def rules_version() -> str:
+    """
+    Version of the pipeline: sha256 of the source of every module it runs.
+
+    Changes whenever the answers, classifier, any layer or this table change.
+    """
+    digest = hashlib.sha256()
+    for func in (
+        IntakeAnswers,
+        classify_risk,
+        validate_intake_answers,
+        cross_validate,
+        detect_risk_indicators,
+        generate_confirmation_warnings,
+        determine_expert_review,
+        evaluate_intake
+    ):
+        digest.update(Path(sys.modules[func.__module__].__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class DecisionTable:
+    """Precomputed pipeline results for every answer combination."""
+
+    def __init__(self, name_examples: Tuple[str, ...] = NAME_EXAMPLES):
+        """
+        Build the table (every answer combination for each example name's warnings).
+
+        Args:
+            name_examples: Project names whose name warnings are tabulated up front
+        """
+        start = time.perf_counter()
+        self.version = rules_version()
+        self._tables: Dict[NameKey, List[Optional[IntakeDecision]]] = {}
+        self._names: Dict[NameKey, str] = {}
+        self._lock = threading.Lock()
+        for project_name in name_examples:
+            self._table_for(project_name, _name_key(validate_project_name(project_name)))
+        self.build_seconds = time.perf_counter() - start
+
+        self.lookups = 0
+
+    def _table_for(self, project_name: str, name_key: NameKey) -> List[Optional[IntakeDecision]]:
+        """Entries for one set of project name warnings, indexed by answers code (evaluated on first use)."""
+        table = self._tables.get(name_key)
+        if table is None:
+            table = [None] * (1 << ANSWERS_CODE_BITS)
+            for code in all_answer_codes():
+                table[code] = evaluate_intake(decode_answers(code), project_name)
+            with self._lock:
+                table = self._tables.setdefault(name_key, table)
+                self._names.setdefault(name_key, project_name)
+        return table
+
+    def lookup(self, answers: IntakeAnswers, project_name: str) -> IntakeDecision:
+        """
+        Pipeline result for an intake; same as evaluate_intake(answers, project_name).
+
+        The result is shared between callers and must not be mutated.
+        """
+        name_key = _name_key(validate_project_name(project_name))
+        with self._lock:
+            self.lookups += 1
+        return self._table_for(project_name, name_key)[encode_answers(answers)]
+
+    def sensitivity(self, answers: IntakeAnswers, project_name: str) -> Tuple[IntakeDecision, List[AnswerChange]]:
+        """
+        Pipeline result of an intake and of every single-answer change to it.
+
+        Returns:
+            (result for the answers as given, one AnswerChange per alternative answer)
+        """
+        name_key = _name_key(validate_project_name(project_name))
+        with self._lock:
+            self.lookups += 1
+        table = self._table_for(project_name, name_key)
+
+        code = encode_answers(answers)
+        current = table[code]
+        changes = []
+        for question, alternative, neighbour in answer_neighbours(code):
+            decision = table[neighbour]
+            changes.append(AnswerChange(
+                question=question,
+                answer=getattr(answers, question),
+                alternative=alternative,
+                risk_level=decision.classification.risk_level,
+                rigor=decision.classification.rigor,
+                expert_review_required=decision.expert_review_required,
+                expert_review_recommended=decision.expert_review_recommended,
+                changes_risk_level=decision.classification.risk_level != current.classification.risk_level,
+                changes_rigor=decision.classification.rigor != current.classification.rigor,
+                changes_expert_review=(
+                    decision.expert_review_required != current.expert_review_required
+                    or decision.expert_review_recommended != current.expert_review_recommended
+                )
+            ))
+        return current, changes
+
+    def verify(self) -> List[str]:
+        """
+        Re-run the layered pipeline for every entry and compare.
+
+        Returns:
+            One line per entry that differs (empty if the table is exact)
+        """
+        mismatches = []
+        for name_key, table in list(self._tables.items()):
+            project_name = self._names[name_key]
+            for code, decision in enumerate(table):
+                if decision is None:
+                    continue
+                answers = decode_answers(code)
+                expected = evaluate_intake(answers, project_name)
+                if decision.model_dump() != expected.model_dump():
+                    mismatches.append(f"{project_name!r} {answers.model_dump()}")
+        return mismatches
+
+    def stats(self) -> Dict[str, int | float | str]:
+        """Table version, size and lookup counter for the metrics endpoint."""
+        return {
+            "version": self.version,
+            "name_variants": len(self._tables),
+            "entries": sum(len(table) - table.count(None) for table in self._tables.values()),
+            "lookups": self.lookups,
+            "build_seconds": round(self.build_seconds, 3)
+        }
+
+
+# Global table instance
+_table: Optional[DecisionTable] = None
+
+
+def get_decision_table() -> DecisionTable:
+    """Get or build decision table singleton."""
+    global _table
+    if _table is None:
+        _table = DecisionTable()
+    return _table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the intake decision table")
+    parser.add_argument("--verify", action="store_true", help="Check every entry against the layered pipeline")
+    args = parser.parse_args()
+
+    table = DecisionTable()
+    stats = table.stats()
+    print(f"Built {stats['entries']} entries ({stats['name_variants']} name variants) in {stats['build_seconds']}s")
+
+    if args.verify:
+        mismatches = table.verify()
+        for line in mismatches:
+            print(f"MISMATCH {line}")
+        print(f"Verified {stats['entries']} entries: {len(mismatches)} mismatches")
+        sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
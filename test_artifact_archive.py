@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streamed artifact archives.
+Tests ZIP validity at every compression level, deterministic output and ETags, and byte ranges.
+"""
+
+import io
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.archive import (
+    RangeNotSatisfiable,
+    archive_etag,
+    archive_length,
+    file_member,
+    parse_range,
+    slice_stream,
+    stream_archive,
+    text_member
+)
+
+
+DOCUMENTS = sorted(Path(__file__).parent.glob("QMS-*.md"))
+DATE = (2025, 1, 15, 0, 0, 0)
+
+
+def test_archive_contents():
+    """Test the streamed archive is a valid ZIP with the members' exact content at every level."""
+    print("\n" + "="*70)
+    print("TEST: Archive Contents")
+    print("="*70)
+
+    members = [file_member(path, chunk_size=1024) for path in DOCUMENTS]
+    for level in (0, 1, 6, 9):
+        chunks = list(stream_archive(members, level))
+        assert len(chunks) > 1 and all(chunks), "archive should arrive as several non-empty chunks"
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == [path.name for path in DOCUMENTS]
+            for path in DOCUMENTS:
+                assert zipf.read(path.name) == path.read_bytes(), path.name
+            expected = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+            assert {info.compress_type for info in zipf.infolist()} == {expected}
+
+        print(f"✓ Level {level}: {len(chunks)} chunks, {sum(map(len, chunks))} bytes")
+
+
+def test_deterministic_output_and_etag():
+    """Test the same members give the same bytes and ETag, and a change gives a new ETag."""
+    print("\n" + "="*70)
+    print("TEST: Deterministic Output")
+    print("="*70)
+
+    members = [text_member(path.name, path.read_text(), DATE) for path in DOCUMENTS]
+    first = b"".join(stream_archive(members, 6))
+    second = b"".join(stream_archive(members, 6))
+    assert first == second
+    assert archive_etag(members, 6) == archive_etag(members, 6)
+    assert archive_etag(members, 6) != archive_etag(members, 0)
+    print("✓ Same members and level: identical bytes and ETag")
+
+    changed = members[:-1] + [text_member(DOCUMENTS[-1].name, "# Changed\n", DATE)]
+    assert archive_etag(changed, 6) != archive_etag(members, 6)
+    print("✓ Changed member: new ETag")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "QMS-Test.md"
+        path.write_text("# Test\n")
+        before = archive_etag([file_member(path)], 6)
+        path.write_text("# Test, edited\n")
+        assert archive_etag([file_member(path)], 6) != before
+    print("✓ Edited file: new ETag")
+
+
+def test_byte_ranges():
+    """Test range parsing and that slices of the stream match slices of the whole archive."""
+    print("\n" + "="*70)
+    print("TEST: Byte Ranges")
+    print("="*70)
+
+    members = [text_member(path.name, path.read_text(), DATE) for path in DOCUMENTS]
+    etag = archive_etag(members, 1)
+    full = b"".join(stream_archive(members, 1))
+    length = archive_length(members, 1, etag)
+    assert length == len(full)
+
+    cases = {
+        "bytes=0-99": (0, 99),
+        "bytes=100-": (100, length - 1),
+        "bytes=-50": (length - 50, length - 1),
+        f"bytes=10-{length + 100}": (10, length - 1),
+    }
+    for header, expected in cases.items():
+        byte_range = parse_range(header, length)
+        assert byte_range == expected, (header, byte_range)
+        start, end = byte_range
+        assert b"".join(slice_stream(stream_archive(members, 1), start, end)) == full[start:end + 1]
+    print(f"✓ {len(cases)} ranges served exactly")
+
+    for header in ("bytes=0-1,5-9", "items=0-1", "bytes=9-2", "bytes=-"):
+        assert parse_range(header, length) is None, header
+    print("✓ Multiple or malformed ranges fall back to the whole archive")
+
+    for header in (f"bytes={length}-", "bytes=-0"):
+        try:
+            parse_range(header, length)
+            assert False, f"{header} should not be satisfiable"
+        except RangeNotSatisfiable:
+            pass
+    print("✓ Ranges beyond the archive rejected")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_archive_contents,
+        test_deterministic_output_and_etag,
+        test_byte_ranges
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -6,6 +6,8 @@ Tests artifact generation for different risk levels.
 
 import sys
 import shutil
+import tempfile
+import zipfile
 from pathlib import Path
 from datetime import datetime
 
@@ -177,6 +179,129 @@ def test_r0_artifact_generation():
     return True
 
 
+def test_parallel_generation_matches_sequential():
+    """Test the worker pool writes the same files and ZIP as one-at-a-time generation."""
+    print("\n" + "="*60)
+    print("TEST: Parallel Artifact Generation")
+    print("="*60)
+
+    answers = IntakeAnswers(
+        q1_users="External",
+        q2_influence="Automated",
+        q3_worst_failure="Safety_Legal_Compliance",
+        q4_reversibility="Hard",
+        q5_domain="No",
+        q6_scale="Organization_Public",
+        q7_regulated="Yes"
+    )
+    intake_request = IntakeRequest(project_name="Parallel Project", timestamp=datetime.utcnow(), answers=answers)
+    intake_response = IntakeResponse(
+        intake_id="test-parallel",
+        project_name="Parallel Project",
+        timestamp=datetime.utcnow(),
+        answers=answers,
+        classification=RiskClassification(
+            risk_level="R3",
+            rigor="Maximum",
+            rationale="External, automated, regulated",
+            borderline=False
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sequential = generate_project_artifacts(
+            intake_request, intake_response, output_dir=Path(tmp) / "sequential", workers=1
+        )
+        parallel = generate_project_artifacts(
+            intake_request, intake_response, output_dir=Path(tmp) / "parallel", workers=4
+        )
+
+        assert parallel['artifacts_generated'] == sequential['artifacts_generated']
+        assert [Path(f).name for f in parallel['file_paths']] == [Path(f).name for f in sequential['file_paths']]
+        print(f"   ✅ {len(parallel['file_paths'])} artifacts generated in the same order")
+
+        with zipfile.ZipFile(parallel['zip_file']) as zipf:
+            assert zipf.namelist() == [Path(f).name for f in parallel['file_paths']]
+            for file_path in parallel['file_paths']:
+                content = Path(file_path).read_bytes()
+                assert zipf.read(Path(file_path).name) == content, f"ZIP entry differs: {file_path}"
+                assert content == (Path(sequential['output_directory']) / Path(file_path).name).read_bytes()
+        print(f"   ✅ Files and ZIP entries match sequential generation")
+
+    print(f"\n✅ Parallel Artifact Generation Test PASSED")
+    return True
+
+
+def test_idempotent_regeneration():
+    """Test regeneration skips unchanged artifacts and rewrites only edited or stale ones."""
+    print("\n" + "="*60)
+    print("TEST: Idempotent Artifact Regeneration")
+    print("="*60)
+
+    answers = IntakeAnswers(
+        q1_users="Internal",
+        q2_influence="Recommendations",
+        q3_worst_failure="Financial",
+        q4_reversibility="Partial",
+        q5_domain="No",
+        q6_scale="Team",
+        q7_regulated="No"
+    )
+    intake_request = IntakeRequest(project_name="Idempotent Project", timestamp=datetime.utcnow(), answers=answers)
+    intake_response = IntakeResponse(
+        intake_id="test-idempotent",
+        project_name="Idempotent Project",
+        timestamp=datetime.utcnow(),
+        answers=answers,
+        classification=RiskClassification(
+            risk_level="R1",
+            rigor="Moderate",
+            rationale="Internal recommendations",
+            borderline=False
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "artifacts"
+        first = generate_project_artifacts(intake_request, intake_response, output_dir=output_dir)
+        assert len(first['artifacts_regenerated']) == len(first['artifacts_generated'])
+        assert first['zip_rebuilt']
+        assert (output_dir / "artifact-manifest.json").exists()
+        mtimes = {f: Path(f).stat().st_mtime_ns for f in first['file_paths'] + [first['zip_file']]}
+
+        second = generate_project_artifacts(intake_request, intake_response, output_dir=output_dir)
+        assert second['artifacts_regenerated'] == []
+        assert len(second['artifacts_unchanged']) == len(first['artifacts_generated'])
+        assert not second['zip_rebuilt']
+        assert {f: Path(f).stat().st_mtime_ns for f in mtimes} == mtimes, "unchanged files were rewritten"
+        print(f"   ✅ Second run: nothing rewritten")
+
+        edited = Path(first['file_paths'][0])
+        original = edited.read_text()
+        edited.write_text("# Edited by hand\n")
+        third = generate_project_artifacts(intake_request, intake_response, output_dir=output_dir)
+        assert len(third['artifacts_regenerated']) == 1
+        assert edited.read_text() == original
+        assert not third['zip_rebuilt'], "ZIP should be kept when the restored content is identical"
+        print(f"   ✅ Edited file: only {third['artifacts_regenerated'][0]} regenerated")
+
+        intake_response.classification.rationale = "Internal recommendations, reviewed"
+        fourth = generate_project_artifacts(intake_request, intake_response, output_dir=output_dir)
+        assert len(fourth['artifacts_regenerated']) == len(first['artifacts_generated'])
+        print(f"   ✅ Changed intake: all artifacts regenerated")
+
+        forced = generate_project_artifacts(intake_request, intake_response, output_dir=output_dir, force=True)
+        assert len(forced['artifacts_regenerated']) == len(first['artifacts_generated'])
+        assert forced['zip_rebuilt']
+        with zipfile.ZipFile(forced['zip_file']) as zipf:
+            for file_path in forced['file_paths']:
+                assert zipf.read(Path(file_path).name) == Path(file_path).read_bytes()
+        print(f"   ✅ force=True: all artifacts and the ZIP rebuilt")
+
+    print(f"\n✅ Idempotent Artifact Regeneration Test PASSED")
+    return True
+
+
 def main():
     """Run all artifact generation tests."""
     print("QMS Dashboard - Phase 4: Artifact Generation Tests")
@@ -185,6 +310,8 @@ def main():
     tests = [
         ("R2 Artifact Generation", test_r2_artifact_generation),
         ("R0 Artifact Generation", test_r0_artifact_generation),
+        ("Parallel Artifact Generation", test_parallel_generation_matches_sequential),
+        ("Idempotent Artifact Regeneration", test_idempotent_regeneration),
     ]
 
     passed = 0
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Unit tests for readiness threshold calibration.
+Tests the broadcast sweep against per-setting evaluate_readiness and the current-threshold point.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.dependency_manager import DependencyManager
+from storage.calibration import grid_size, sweep_thresholds
+from storage.portfolio import RISK_LEVELS, PortfolioReadiness, evaluate_readiness
+
+from test_portfolio import build_projects, thresholds_for
+
+
+def test_sweep_matches_evaluate_readiness():
+    """Test every grid setting's counts agree with evaluate_readiness at that setting."""
+    print("\n" + "="*70)
+    print("TEST: Sweep Matches evaluate_readiness")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        projects = build_projects(root, dep_manager, count=12)
+        matrix = PortfolioReadiness(root).refresh(dep_manager.validator, projects, dep_manager.graph.nodes)
+        thresholds = thresholds_for(dep_manager, matrix)
+        current = evaluate_readiness(matrix, thresholds)
+
+        grids = dict(
+            completion_grid=(0.5, 0.75, 0.9),
+            max_errors_grid=(0, 2),
+            max_warnings_grid=(1, None),
+            volatility_scale_grid=(0.0, 1.0)
+        )
+        calibrations = sweep_thresholds(matrix, dep_manager, thresholds, **grids)
+        assert [calibration.risk_level for calibration in calibrations] == list(RISK_LEVELS)
+
+        modifiers = np.array([
+            dep_manager.volatility_classes[dep_manager.volatility_lookup.get(name, "foundation")]["modifier"]
+            for name in matrix.artifact_names
+        ])
+
+        checked = 0
+        for calibration in calibrations:
+            level = RISK_LEVELS.index(calibration.risk_level)
+            rows = matrix.risk_index == level
+            required = thresholds.required[level]
+            assert len(calibration.settings) == grid_size(*grids.values())
+
+            for setting in calibration.settings:
+                thresholds.completion[level] = np.clip(setting.completion + setting.volatility_scale * modifiers, 0.5, 1.0)
+                thresholds.max_errors[level] = setting.max_errors
+                thresholds.max_warnings[level] = np.inf if setting.max_warnings is None else setting.max_warnings
+                ready = evaluate_readiness(matrix, thresholds)[rows][:, required]
+                before = current[rows][:, required]
+
+                assert setting.artifacts_ready == int(ready.sum())
+                assert setting.projects_ready == int(ready.all(axis=1).sum())
+                assert setting.artifacts_became_ready == int((ready & ~before).sum())
+                assert setting.artifacts_became_not_ready == int((~ready & before).sum())
+                assert setting.projects_became_ready == int((ready.all(axis=1) & ~before.all(axis=1)).sum())
+                assert setting.projects_became_not_ready == int((~ready.all(axis=1) & before.all(axis=1)).sum())
+                checked += 1
+
+            thresholds = thresholds_for(dep_manager, matrix)
+
+        print(f"✓ {checked} settings match evaluate_readiness")
+
+
+def test_current_setting_has_no_flips():
+    """Test the configured thresholds appear in the default grid with no flips."""
+    print("\n" + "="*70)
+    print("TEST: Current Setting")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        projects = build_projects(root, dep_manager)
+        matrix = PortfolioReadiness(root).refresh(dep_manager.validator, projects, dep_manager.graph.nodes)
+        calibrations = sweep_thresholds(matrix, dep_manager, thresholds_for(dep_manager, matrix))
+
+        for calibration in calibrations:
+            current = [setting for setting in calibration.settings if setting.is_current]
+            assert len(current) == 1, calibration.risk_level
+            setting = current[0]
+            assert setting.artifacts_ready == calibration.current_artifacts_ready
+            assert setting.projects_ready == calibration.current_projects_ready
+            assert not (setting.artifacts_became_ready or setting.artifacts_became_not_ready)
+            print(f"✓ {calibration.risk_level}: current setting found, "
+                  f"{calibration.current_artifacts_ready}/{calibration.required_artifacts} ready")
+
+        try:
+            sweep_thresholds(matrix, dep_manager, thresholds_for(dep_manager, matrix), completion_grid=())
+            assert False, "Empty grid should be rejected"
+        except ValueError:
+            print("✓ Empty grid rejected")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_sweep_matches_evaluate_readiness,
+        test_current_setting_has_no_flips
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
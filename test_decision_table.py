@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the intake decision table.
+Tests the table against the layered pipeline, the packed answers code, and project name variants.
+"""
+
+import itertools
+import sys
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from models.intake import (
+    ANSWER_CHOICES,
+    ANSWERS_CODE_BITS,
+    IntakeAnswers,
+    all_answer_codes,
+    answers_mask,
+    decode_answers,
+    encode_answers
+)
+from validation.decision_table import DecisionTable, evaluate_intake, rules_version
+
+
+ANSWER_COMBINATIONS = 3888
+
+
+def test_table_matches_pipeline():
+    """Test every entry equals the layered pipeline (verification mode)."""
+    print("\n" + "="*70)
+    print("TEST: Table Matches Pipeline")
+    print("="*70)
+
+    table = DecisionTable()
+    stats = table.stats()
+    assert stats["entries"] == 3 * ANSWER_COMBINATIONS
+    print(f"✓ Built {stats['entries']} entries in {stats['build_seconds']}s")
+
+    mismatches = table.verify()
+    assert mismatches == [], mismatches[:5]
+    print("✓ Verification: 0 mismatches")
+
+    assert table.version == rules_version() == DecisionTable(name_examples=()).version
+    assert len(table.version) == 16
+    print(f"✓ Pipeline version {table.version} (stable across builds)")
+
+
+def test_answers_code():
+    """Test every answer combination has its own 14-bit code, decodes back, and matches bitmask queries."""
+    print("\n" + "="*70)
+    print("TEST: Packed Answers Code")
+    print("="*70)
+
+    codes = {}
+    for values in itertools.product(*ANSWER_CHOICES.values()):
+        answers = IntakeAnswers(**dict(zip(ANSWER_CHOICES, values)))
+        code = encode_answers(answers)
+        assert decode_answers(code) == answers
+        codes[code] = answers
+    assert ANSWERS_CODE_BITS == 14
+    assert len(codes) == ANSWER_COMBINATIONS and max(codes) < 1 << 14
+    assert sorted(codes) == list(all_answer_codes())
+    print(f"✓ {len(codes)} combinations map one-to-one onto 14-bit codes")
+
+    mask, value = answers_mask(q2_influence="Automated", q4_reversibility="Hard")
+    matches = {code for code in codes if code & mask == value}
+    expected = {
+        code for code, answers in codes.items()
+        if answers.q2_influence == "Automated" and answers.q4_reversibility == "Hard"
+    }
+    assert matches == expected and len(matches) == ANSWER_COMBINATIONS // 9
+    print(f"✓ Automated + Hard: {len(matches)} codes matched by one bitmask test")
+
+    for code in (-1, 1 << 14, 0b11):
+        try:
+            decode_answers(code)
+            assert False, f"code {code} should be rejected"
+        except ValueError:
+            pass
+    for criteria in ({"q8_unknown": "Yes"}, {"q1_users": "Robots"}):
+        try:
+            answers_mask(**criteria)
+            assert False, f"{criteria} should be rejected"
+        except ValueError:
+            pass
+    print("✓ Invalid codes and criteria rejected")
+
+
+def test_project_name_variants():
+    """Test project names with and without name warnings, including ones not built up front."""
+    print("\n" + "="*70)
+    print("TEST: Project Name Variants")
+    print("="*70)
+
+    table = DecisionTable(name_examples=("Project",))
+    answers = IntakeAnswers(
+        q1_users="External",
+        q2_influence="Automated",
+        q3_worst_failure="Annoyance",
+        q4_reversibility="Hard",
+        q5_domain="No",
+        q6_scale="Team",
+        q7_regulated="No"
+    )
+
+    for project_name in ("Customer Portal", "", "   ", "Untitled", "TEST"):
+        decision = table.lookup(answers, project_name)
+        assert decision.model_dump() == evaluate_intake(answers, project_name).model_dump(), project_name
+    assert table.stats()["name_variants"] == 3
+    print("✓ Empty and generic names: table built on first use, results match the pipeline")
+
+    flipped = [
+        code for code in all_answer_codes()
+        if table.lookup(decode_answers(code), "").expert_review_recommended
+        != table.lookup(decode_answers(code), "Customer Portal").expert_review_recommended
+    ]
+    assert flipped, "an empty-name warning should tip some intakes into recommended review (ER1)"
+    print(f"✓ Empty-name warning changes the review recommendation for {len(flipped)} answer combinations")
+
+    assert table.verify() == []
+    print("✓ Verification after lazy builds: 0 mismatches")
+
+
+def test_sensitivity():
+    """Test single-answer changes match the pipeline run on the changed answers."""
+    print("\n" + "="*70)
+    print("TEST: Answer Sensitivity")
+    print("="*70)
+
+    table = DecisionTable(name_examples=("Project",))
+    moved = 0
+    for code in list(all_answer_codes())[::97]:
+        answers = decode_answers(code)
+        current, changes = table.sensitivity(answers, "Project")
+        assert current.model_dump() == evaluate_intake(answers, "Project").model_dump()
+        assert len(changes) == 16
+        assert len({(change.question, change.alternative) for change in changes}) == 16
+
+        for change in changes:
+            assert change.answer == getattr(answers, change.question) != change.alternative
+            expected = evaluate_intake(answers.model_copy(update={change.question: change.alternative}), "Project")
+            assert change.risk_level == expected.classification.risk_level
+            assert change.rigor == expected.classification.rigor
+            assert change.expert_review_required == expected.expert_review_required
+            assert change.expert_review_recommended == expected.expert_review_recommended
+            assert change.changes_risk_level == (change.risk_level != current.classification.risk_level)
+            moved += change.changes_risk_level
+    assert moved
+    print(f"✓ 16 changes per intake match the pipeline; {moved} move the risk level")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_table_matches_pipeline,
+        test_answers_code,
+        test_project_name_variants,
+        test_sensitivity
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
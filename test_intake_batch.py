@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batch intake submission (POST /api/intakes/batch).
+Tests per-item results with partial failures, the index rollback path, and parity with POST /api/intake.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+# Keep the app's own data root out of the repository (ignored if config is already loaded)
+os.environ.setdefault("QMS_DATA_ROOT", tempfile.mkdtemp(prefix="qms-batch-test-"))
+
+from fastapi.testclient import TestClient
+
+import main
+from storage.intake_cache import IntakeCache
+from storage.intake_store import IntakeStore
+
+
+ANSWERS = {
+    "q1_users": "External",
+    "q2_influence": "Recommendations",
+    "q3_worst_failure": "Financial",
+    "q4_reversibility": "Hard",
+    "q5_domain": "Yes",
+    "q6_scale": "Team",
+    "q7_regulated": "No"
+}
+
+
+@contextmanager
+def isolated_app():
+    """Test client whose intake files, index and cache live in a temporary directory."""
+    saved = (main.DATA_DIR, main.intake_store, main.intake_cache, main._write_intake_file)
+    with tempfile.TemporaryDirectory() as tmp:
+        intake_dir = Path(tmp) / "intake-responses"
+        intake_dir.mkdir()
+        main.DATA_DIR = intake_dir
+        main.intake_store = IntakeStore(Path(tmp) / "index.sqlite3")
+        main.intake_cache = IntakeCache(intake_dir)
+        try:
+            yield TestClient(main.app), intake_dir
+        finally:
+            main.intake_store.close()
+            main.DATA_DIR, main.intake_store, main.intake_cache, main._write_intake_file = saved
+
+
+def intake(project_name: str, **answers) -> dict:
+    """Intake request body with default answers."""
+    return {"project_name": project_name, "answers": {**ANSWERS, **answers}}
+
+
+def test_partial_failures_reported_per_item():
+    """Test valid, invalid and unwritable items are reported in request order without failing the batch."""
+    print("\n" + "="*70)
+    print("TEST: Partial Failures Reported Per Item")
+    print("="*70)
+
+    with isolated_app() as (client, intake_dir):
+        write_intake_file = main._write_intake_file
+
+        def failing_write(response):
+            if response.project_name == "Unwritable":
+                raise OSError("No space left on device")
+            return write_intake_file(response)
+
+        main._write_intake_file = failing_write
+
+        batch = [
+            intake("First"),
+            intake("Bad Answer", q1_users="Robots"),
+            intake("Unwritable"),
+            "not an intake",
+            {"answers": ANSWERS},
+            intake("Last", q2_influence="Automated")
+        ]
+        response = client.post("/api/intakes/batch", json=batch)
+        assert response.status_code == 200, response.text
+        body = response.json()
+
+        assert (body["submitted"], body["created"], body["failed"]) == (6, 2, 4)
+        results = body["results"]
+        assert [result["index"] for result in results] == list(range(6))
+
+        saved = {result["index"]: result["intake"] for result in results if result["intake"]}
+        assert sorted(saved) == [0, 5]
+        assert [saved[0]["project_name"], saved[5]["project_name"]] == ["First", "Last"]
+        assert all(result["error"] is None for result in results if result["intake"])
+        print("✓ Valid items saved, results in request order")
+
+        errors = {result["index"]: result["error"] for result in results if result["intake"] is None}
+        assert "answers.q1_users" in errors[1]
+        assert "No space left on device" in errors[2]
+        assert errors[3].startswith("intake:")
+        assert "project_name" in errors[4]
+        print(f"✓ Failures reported per item: {errors}")
+
+        files = sorted(path.stem for path in intake_dir.glob("*.json"))
+        assert files == sorted(intake["intake_id"] for intake in saved.values())
+        listed = client.get("/api/intakes").json()["intakes"]
+        assert sorted(summary["intake_id"] for summary in listed) == files
+        print("✓ Only saved items have files and index rows")
+
+        assert client.post("/api/intakes/batch", json=[intake("Too many")] * (main.MAX_INTAKE_BATCH + 1)).status_code == 400
+        print("✓ Oversized batch rejected")
+
+
+def test_index_failure_unlinks_files():
+    """Test a failed index transaction removes the batch's intake files and reports every item."""
+    print("\n" + "="*70)
+    print("TEST: Index Failure Unlinks Files")
+    print("="*70)
+
+    with isolated_app() as (client, intake_dir):
+        def failing_upsert_many(responses):
+            raise sqlite3.OperationalError("database is locked")
+
+        main.intake_store.upsert_many = failing_upsert_many
+
+        response = client.post("/api/intakes/batch", json=[intake(f"Project {i}") for i in range(5)] + ["invalid"])
+        body = response.json()
+        assert (body["created"], body["failed"]) == (0, 6)
+        for result in body["results"][:5]:
+            assert result["intake"] is None
+            assert result["error"] == "Error indexing intake: database is locked"
+        assert body["results"][5]["error"].startswith("intake:")
+        print("✓ Every written item reported as not indexed")
+
+        assert list(intake_dir.glob("*.json")) == []
+        assert list(intake_dir.glob("*.tmp")) == []
+        del main.intake_store.upsert_many
+        assert main.intake_store.count() == 0
+        print("✓ No intake files or index rows left behind")
+
+
+def test_batch_item_matches_single_submission():
+    """Test a batch item is saved exactly as POST /api/intake saves the same input."""
+    print("\n" + "="*70)
+    print("TEST: Batch Item Matches Single Submission")
+    print("="*70)
+
+    with isolated_app() as (client, intake_dir):
+        for body in (
+            {**intake("Parity Project"), "timestamp": "2025-12-01T09:30:00"},
+            {**intake("   ", q2_influence="Automated", q3_worst_failure="Safety_Legal_Compliance"),
+             "timestamp": "2025-12-01T09:45:00"}
+        ):
+            single = client.post("/api/intake", json=body)
+            assert single.status_code == 201, single.text
+            batch = client.post("/api/intakes/batch", json=[body]).json()["results"][0]
+
+            single = single.json()
+            assert batch["error"] is None, batch
+            saved = client.get(f"/api/intake/{batch['intake']['intake_id']}").json()
+            assert saved["intake_id"] != single["intake_id"]
+            assert {**saved, "intake_id": None} == {**single, "intake_id": None}
+
+            single_file = json.loads((intake_dir / f"{single['intake_id']}.json").read_text())
+            batch_file = json.loads((intake_dir / f"{saved['intake_id']}.json").read_text())
+            assert {**batch_file, "intake_id": None} == {**single_file, "intake_id": None}
+
+            assert batch["intake"]["risk_level"] == single["classification"]["risk_level"]
+            assert batch["intake"]["expert_review_required"] == single["expert_review_required"]
+            assert batch["expert_review_recommended"] == single["expert_review_recommended"]
+            print(f"✓ {body['project_name']!r}: saved response and file identical apart from intake_id")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_partial_failures_reported_per_item,
+        test_index_failure_unlinks_files,
+        test_batch_item_matches_single_submission
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
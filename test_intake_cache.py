@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the parsed intake cache.
+Tests hit/miss accounting, mtime/size invalidation, write-through, and LRU eviction.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from models.intake import IntakeAnswers, IntakeResponse, RiskClassification
+from storage.intake_cache import IntakeCache
+
+
+def write_intake(intake_dir: Path, project_name: str) -> IntakeResponse:
+    """Helper to write an intake JSON file the way main._save_intake_response does."""
+    response = IntakeResponse(
+        project_name=project_name,
+        timestamp=datetime(2025, 12, 1, 9, 0, 0),
+        answers=IntakeAnswers(
+            q1_users="Internal",
+            q2_influence="Informational",
+            q3_worst_failure="Annoyance",
+            q4_reversibility="Easy",
+            q5_domain="Yes",
+            q6_scale="Team",
+            q7_regulated="No"
+        ),
+        classification=RiskClassification(risk_level="R0", rigor="Minimal", rationale="test")
+    )
+    with open(intake_dir / f"{response.intake_id}.json", 'w') as f:
+        json.dump(response.model_dump(mode='json'), f, indent=2, default=str)
+    return response
+
+
+def test_hit_after_first_load():
+    """Test that the second lookup of an unchanged file is a cache hit."""
+    print("\n" + "="*70)
+    print("TEST: Cache Hit After First Load")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        intake_dir = Path(tmp)
+        written = write_intake(intake_dir, "Cached Project")
+        cache = IntakeCache(intake_dir)
+
+        first = cache.get(written.intake_id)
+        second = cache.get(written.intake_id)
+
+        assert first.project_name == "Cached Project"
+        assert second is first, "Unchanged file should return the cached object"
+        assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
+        print(f"✓ Counters: {cache.stats()}")
+
+        assert cache.get("does-not-exist") is None
+        print("✓ Missing intake returns None")
+
+
+def test_external_edit_invalidates_entry():
+    """Test that a changed mtime/size forces a reload."""
+    print("\n" + "="*70)
+    print("TEST: External Edit Invalidates Entry")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        intake_dir = Path(tmp)
+        written = write_intake(intake_dir, "Original Name")
+        cache = IntakeCache(intake_dir)
+        cache.get(written.intake_id)
+
+        # Edit the file outside the API and bump its mtime
+        file_path = intake_dir / f"{written.intake_id}.json"
+        data = json.loads(file_path.read_text())
+        data["project_name"] = "Edited Name"
+        file_path.write_text(json.dumps(data))
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = cache.get(written.intake_id)
+        assert reloaded.project_name == "Edited Name"
+        assert cache.stats()["misses"] == 2
+        print("✓ Edited file reloaded")
+
+        file_path.unlink()
+        assert cache.get(written.intake_id) is None
+        assert cache.stats()["entries"] == 0
+        print("✓ Deleted file drops the entry")
+
+
+def test_write_through_and_eviction():
+    """Test write-through put() and LRU eviction at capacity."""
+    print("\n" + "="*70)
+    print("TEST: Write-Through and LRU Eviction")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        intake_dir = Path(tmp)
+        cache = IntakeCache(intake_dir, max_entries=2)
+
+        a = write_intake(intake_dir, "A")
+        cache.put(a)
+        assert cache.get(a.intake_id) is a
+        print("✓ Written intake served from cache without a reload")
+
+        b = write_intake(intake_dir, "B")
+        c = write_intake(intake_dir, "C")
+        cache.put(b)
+        cache.get(a.intake_id)  # A becomes most recently used
+        cache.put(c)            # B is evicted
+
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+        hits_before = stats["hits"]
+        cache.get(a.intake_id)
+        assert cache.stats()["hits"] == hits_before + 1, "A should still be cached"
+        cache.get(b.intake_id)
+        assert cache.stats()["misses"] == 1, "B should have been evicted"
+        print(f"✓ Least recently used entry evicted: {cache.stats()}")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_hit_after_first_load,
+        test_external_edit_invalidates_entry,
+        test_write_through_and_eviction
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Unit tests for classification previews (POST and GET /api/intake/preview).
+Tests that nothing is saved, what the ETag depends on, and conditional GET requests.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from fastapi.testclient import TestClient
+
+# Shared intake answers and temporary-directory app (also sets the test data root before main loads)
+from test_intake_batch import ANSWERS, isolated_app
+
+import main
+from models.intake import IntakeAnswers, encode_answers
+from validation.decision_table import evaluate_intake
+
+
+CODE = encode_answers(IntakeAnswers(**ANSWERS))
+
+
+def get_preview(client: TestClient, answers_code: int = CODE, project_name: str = "Preview Project", **headers):
+    """GET /api/intake/preview."""
+    return client.get(
+        "/api/intake/preview",
+        params={"answers_code": answers_code, "project_name": project_name},
+        headers=headers
+    )
+
+
+def test_preview_saves_nothing():
+    """Test POST and GET previews match the pipeline and write no file or index row."""
+    print("\n" + "="*70)
+    print("TEST: Preview Saves Nothing")
+    print("="*70)
+
+    with isolated_app() as (client, intake_dir):
+        posted = client.post("/api/intake/preview", json={"project_name": "Preview Project", "answers": ANSWERS})
+        assert posted.status_code == 200, posted.text
+        body = posted.json()
+        assert "intake_id" not in body and body["answers_code"] == CODE
+
+        expected = evaluate_intake(IntakeAnswers(**ANSWERS), "Preview Project").model_dump(mode="json")
+        for field in ("classification", "warnings", "expert_review_required", "expert_review_recommended",
+                      "artifacts_required", "next_steps"):
+            assert body[field] == expected[field], field
+        print("✓ POST preview matches the pipeline")
+
+        fetched = get_preview(client)
+        assert fetched.status_code == 200 and fetched.json() == body
+        print("✓ GET preview by answers code returns the same body")
+
+        assert list(intake_dir.iterdir()) == []
+        assert main.intake_store.count() == 0
+        assert client.get("/api/intakes").json()["intakes"] == []
+        print("✓ No intake files or index rows written")
+
+
+def test_etag_inputs():
+    """Test the ETag changes with the answers, the project name and the pipeline version."""
+    print("\n" + "="*70)
+    print("TEST: ETag Inputs")
+    print("="*70)
+
+    with isolated_app() as (client, _):
+        etag = get_preview(client).headers["etag"]
+        assert etag == get_preview(client).headers["etag"]
+        assert get_preview(client).headers["cache-control"] == f"private, max-age={main.PREVIEW_MAX_AGE}"
+
+        other_answers = encode_answers(IntakeAnswers(**{**ANSWERS, "q2_influence": "Automated"}))
+        assert get_preview(client, answers_code=other_answers).headers["etag"] != etag
+        assert get_preview(client, project_name="Other Project").headers["etag"] != etag
+        print("✓ Answers and project name change the ETag")
+
+        version = main.decision_table.version
+        main.decision_table.version = "changed-rules"
+        try:
+            assert get_preview(client).headers["etag"] != etag
+        finally:
+            main.decision_table.version = version
+        print("✓ Pipeline version changes the ETag")
+
+
+def test_conditional_requests():
+    """Test If-None-Match answers 304 on GET only; POST previews are never conditional or cached."""
+    print("\n" + "="*70)
+    print("TEST: Conditional Requests")
+    print("="*70)
+
+    with isolated_app() as (client, _):
+        etag = get_preview(client).headers["etag"]
+
+        for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+            response = get_preview(client, **{"If-None-Match": if_none_match})
+            assert response.status_code == 304, if_none_match
+            assert response.content == b""
+            assert response.headers["etag"] == etag and "max-age" in response.headers["cache-control"]
+        print("✓ Matching If-None-Match answers 304 with ETag and Cache-Control")
+
+        assert get_preview(client, **{"If-None-Match": '"stale"'}).status_code == 200
+        assert get_preview(client, project_name="Other Project", **{"If-None-Match": etag}).status_code == 200
+        print("✓ Non-matching If-None-Match answers 200")
+
+        posted = client.post(
+            "/api/intake/preview",
+            json={"project_name": "Preview Project", "answers": ANSWERS},
+            headers={"If-None-Match": etag}
+        )
+        assert posted.status_code == 200 and posted.json()["answers_code"] == CODE
+        assert "etag" not in posted.headers and "cache-control" not in posted.headers
+        print("✓ POST ignores If-None-Match and carries no cache headers")
+
+        for answers_code in (3, 1 << 14):
+            assert get_preview(client, answers_code=answers_code).status_code == 400
+        assert get_preview(client, answers_code=-1).status_code == 422
+        print("✓ Invalid answers codes rejected")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_preview_saves_nothing,
+        test_etag_inputs,
+        test_conditional_requests
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the indexed intake store.
+Tests write-through upserts, keyset pagination, filters, answers codes, the one-shot JSON migration, and read isolation.
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from models.intake import IntakeAnswers, IntakeResponse, RiskClassification, answers_mask, encode_answers
+from storage.intake_store import IntakeStore, timestamp_key, decode_cursor
+
+
+def make_response(project_name: str, timestamp: datetime, risk_level: str = "R1",
+                  expert_review_required: bool = False) -> IntakeResponse:
+    """Helper to build a minimal intake response."""
+    return IntakeResponse(
+        project_name=project_name,
+        timestamp=timestamp,
+        answers=IntakeAnswers(
+            q1_users="Internal",
+            q2_influence="Informational",
+            q3_worst_failure="Annoyance",
+            q4_reversibility="Easy",
+            q5_domain="Yes",
+            q6_scale="Team",
+            q7_regulated="No"
+        ),
+        classification=RiskClassification(
+            risk_level=risk_level,
+            rigor="Moderate",
+            rationale="test"
+        ),
+        expert_review_required=expert_review_required
+    )
+
+
+def test_upsert_and_list_newest_first():
+    """Test that listing is ordered newest first and upserts replace rows."""
+    print("\n" + "="*70)
+    print("TEST: Upsert and Newest-First Listing")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = IntakeStore(Path(tmp) / "index.sqlite3")
+        base = datetime(2025, 12, 1, 9, 0, 0)
+
+        older = make_response("Older", base)
+        newer = make_response("Newer", base + timedelta(hours=1), risk_level="R3",
+                              expert_review_required=True)
+        store.upsert(older)
+        store.upsert(newer)
+
+        summaries, next_cursor = store.list_page()
+        assert next_cursor is None
+        assert [s.project_name for s in summaries] == ["Newer", "Older"]
+        assert summaries[0].risk_level == "R3"
+        assert summaries[0].expert_review_required is True
+        print("✓ Newest intake listed first")
+
+        # Re-saving the same intake replaces its row
+        older.project_name = "Older (renamed)"
+        store.upsert(older)
+        assert store.count() == 2
+        assert store.list_page()[0][1].project_name == "Older (renamed)"
+        print("✓ Upsert replaces existing row")
+
+        store.close()
+
+
+def test_keyset_pagination_and_filters():
+    """Test cursor pagination visits every intake exactly once, in order, with filters."""
+    print("\n" + "="*70)
+    print("TEST: Keyset Pagination and Filters")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = IntakeStore(Path(tmp) / "index.sqlite3")
+        base = datetime(2025, 12, 1, 9, 0, 0)
+
+        # Two intakes share each timestamp so the intake_id tie-breaker matters
+        responses = []
+        for i in range(25):
+            responses.append(make_response(
+                f"Project {i}",
+                base + timedelta(minutes=i // 2),
+                risk_level="R3" if i % 3 == 0 else "R1",
+                expert_review_required=(i % 5 == 0)
+            ))
+        store.upsert_many(responses)
+
+        # Walk all pages newest first
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page, cursor = store.list_page(limit=7, cursor=cursor)
+            seen.extend(page)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert pages == 4, f"Expected 4 pages, got {pages}"
+        assert len({s.intake_id for s in seen}) == 25
+        keys = [(timestamp_key(s.timestamp), s.intake_id) for s in seen]
+        assert keys == sorted(keys, reverse=True)
+        print(f"✓ {len(seen)} intakes across {pages} pages, no duplicates, newest first")
+
+        # Ascending order
+        page, _ = store.list_page(limit=3, descending=False)
+        assert page[0].timestamp == base
+        print("✓ Ascending order supported")
+
+        # Filters
+        page, _ = store.list_page(limit=100, risk_level="R3")
+        assert len(page) == 9 and all(s.risk_level == "R3" for s in page)
+        page, _ = store.list_page(limit=100, expert_review_required=True)
+        assert len(page) == 5 and all(s.expert_review_required for s in page)
+        page, _ = store.list_page(
+            limit=100,
+            since=base + timedelta(minutes=2),
+            until=base + timedelta(minutes=4)
+        )
+        assert len(page) == 4, f"Expected 4 intakes in range, got {len(page)}"
+        print("✓ risk_level, expert_review_required and timestamp range filters applied")
+
+        # Malformed cursors are rejected
+        try:
+            decode_cursor("not-a-cursor")
+            assert False, "Expected ValueError for malformed cursor"
+        except ValueError:
+            print("✓ Malformed cursor rejected")
+
+        store.close()
+
+
+def test_timestamp_key_orders_mixed_precision():
+    """Test that timestamp keys sort chronologically regardless of precision or timezone."""
+    print("\n" + "="*70)
+    print("TEST: Timestamp Key Normalization")
+    print("="*70)
+
+    whole_second = datetime(2025, 12, 1, 9, 0, 0)
+    fractional = datetime(2025, 12, 1, 9, 0, 0, 500000)
+    aware = datetime(2025, 12, 1, 10, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+
+    assert timestamp_key(whole_second) < timestamp_key(fractional)
+    assert timestamp_key(aware) < timestamp_key(whole_second)
+    print(f"✓ {timestamp_key(aware)} < {timestamp_key(whole_second)} < {timestamp_key(fractional)}")
+
+
+def test_one_shot_json_migration():
+    """Test that existing JSON files are imported once and bad files are skipped."""
+    print("\n" + "="*70)
+    print("TEST: One-Shot JSON Migration")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        intake_dir = Path(tmp) / "intake-responses"
+        intake_dir.mkdir()
+
+        for i in range(3):
+            response = make_response(f"Project {i}", datetime(2025, 12, 1 + i))
+            with open(intake_dir / f"{response.intake_id}.json", 'w') as f:
+                json.dump(response.model_dump(mode='json'), f)
+
+        with open(intake_dir / "corrupt.json", 'w') as f:
+            f.write("{not json")
+
+        store = IntakeStore(Path(tmp) / "index.sqlite3")
+        imported = store.ensure_migrated(intake_dir)
+        assert imported == 3, f"Expected 3 imported, got {imported}"
+        print(f"✓ Imported {imported} intakes (corrupt file skipped)")
+
+        # Second call is a no-op
+        assert store.ensure_migrated(intake_dir) == 0
+        assert store.count() == 3
+        print("✓ Migration does not run twice")
+
+        store.close()
+
+
+def test_answers_code_filter_and_backfill():
+    """Test answer bitmask filters and that an index without answers codes is backfilled once."""
+    print("\n" + "="*70)
+    print("TEST: Answers Code Filter and Backfill")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        intake_dir = Path(tmp) / "intake-responses"
+        intake_dir.mkdir()
+
+        responses = []
+        for i, (influence, reversibility) in enumerate([
+            ("Automated", "Hard"), ("Automated", "Easy"), ("Informational", "Hard"), ("Automated", "Hard")
+        ]):
+            response = make_response(f"Project {i}", datetime(2025, 12, 1 + i))
+            response.answers = response.answers.model_copy(
+                update={"q2_influence": influence, "q4_reversibility": reversibility}
+            )
+            responses.append(response)
+            with open(intake_dir / f"{response.intake_id}.json", 'w') as f:
+                json.dump(response.model_dump(mode='json'), f)
+        expected = {r.intake_id for r in responses
+                    if r.answers.q2_influence == "Automated" and r.answers.q4_reversibility == "Hard"}
+        automated_hard = answers_mask(q2_influence="Automated", q4_reversibility="Hard")
+
+        store = IntakeStore(Path(tmp) / "index.sqlite3")
+        store.upsert_many(responses)
+        page, _ = store.list_page(answers=automated_hard)
+        assert {s.intake_id for s in page} == expected
+        assert store.answers_codes() == {r.intake_id: encode_answers(r.answers) for r in responses}
+        print(f"✓ Automated + Hard filter: {len(page)} of {len(responses)} intakes")
+        store.close()
+
+        # Index from before answers codes were stored
+        old_path = Path(tmp) / "old-index.sqlite3"
+        conn = sqlite3.connect(old_path)
+        conn.executescript("""
+            CREATE TABLE intakes (
+                intake_id TEXT PRIMARY KEY, project_name TEXT NOT NULL, timestamp TEXT NOT NULL,
+                ts_key TEXT NOT NULL, risk_level TEXT NOT NULL, expert_review_required INTEGER NOT NULL
+            );
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            INSERT INTO meta VALUES ('json_import_completed', '2025-12-01T00:00:00');
+        """)
+        conn.executemany(
+            "INSERT INTO intakes VALUES (?, ?, ?, ?, ?, ?)",
+            [(r.intake_id, r.project_name, r.timestamp.isoformat(), timestamp_key(r.timestamp), "R1", 0)
+             for r in responses]
+        )
+        conn.commit()
+        conn.close()
+
+        store = IntakeStore(old_path)
+        assert store.list_page(answers=automated_hard)[0] == []
+        assert store.ensure_migrated(intake_dir) == len(responses)
+        assert {s.intake_id for s in store.list_page(answers=automated_hard)[0]} == expected
+        assert store.ensure_migrated(intake_dir) == 0
+        print("✓ Old index gains the column and is backfilled from the JSON files once")
+        store.close()
+
+
+def test_readers_see_only_committed_writes():
+    """Test that reads from other threads never see a write transaction before it commits."""
+    print("\n" + "="*70)
+    print("TEST: Readers See Only Committed Writes")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = IntakeStore(Path(tmp) / "index.sqlite3")
+        committed = make_response("Committed", datetime(2025, 12, 1))
+        store.upsert(committed)
+
+        def read_from_other_thread():
+            seen = {}
+            thread = threading.Thread(target=lambda: seen.update(
+                count=store.count(),
+                listed=[s.intake_id for s in store.list_page()[0]],
+                risk_levels=store.risk_levels()
+            ))
+            thread.start()
+            thread.join()
+            return seen
+
+        # Hold a write transaction open the way _write_rows does, then roll it back
+        pending = make_response("Rolled back", datetime(2025, 12, 2))
+        with store._lock:
+            store._conn.execute("BEGIN")
+            store._conn.execute(
+                "INSERT INTO intakes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                store._to_row(pending, encode_answers(pending.answers))
+            )
+            seen = read_from_other_thread()
+            store._conn.execute("ROLLBACK")
+
+        assert seen["count"] == 1
+        assert seen["listed"] == [committed.intake_id]
+        assert list(seen["risk_levels"]) == [committed.intake_id]
+        print("✓ Uncommitted row invisible to readers in other threads")
+
+        store.upsert(pending)
+        assert read_from_other_thread()["count"] == 2
+        print("✓ Row visible once committed")
+
+        store.close()
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_upsert_and_list_newest_first,
+        test_keyset_pagination_and_filters,
+        test_timestamp_key_orders_mixed_precision,
+        test_one_shot_json_migration,
+        test_answers_code_filter_and_backfill,
+        test_readers_see_only_committed_writes
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the single-pass markdown section tree.
+Tests section lookup, per-section counts, and parity with the regex checks it replaces.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.markdown_tree import parse_markdown
+from artifacts.placeholder_scanner import REFERENCE_PLACEHOLDER_PATTERN
+
+
+SAMPLE = """# Risk Register
+## Demo Project
+
+Intro text [TBD]
+
+## Risk Assessment
+- R-001: Outage
+- R-002: Data loss
+  * nested detail
+
+### Mitigations
+1. Backups
+2. Failover
+
+## Empty Section
+
+## Parent Only
+### Child
+content
+
+## Register Table
+| ID | Risk | Owner |
+|----|------|-------|
+| R-001 | Outage | {owner} |
+"""
+
+
+def test_sections_and_body_counts():
+    """Test headings become a tree with per-section counts."""
+    print("\n" + "="*70)
+    print("TEST: Sections and Per-Section Counts")
+    print("="*70)
+
+    tree = parse_markdown(SAMPLE, re.compile(REFERENCE_PLACEHOLDER_PATTERN, re.IGNORECASE))
+
+    titles = [section.title for section in tree.sections]
+    assert titles == ["Risk Register", "Demo Project", "Risk Assessment", "Mitigations",
+                      "Empty Section", "Parent Only", "Child", "Register Table"]
+    assert tree.section_count == 7, "Only ## and deeper headings count as sections"
+    print(f"✓ {len(tree.sections)} headings, {tree.section_count} sections")
+
+    assessment = tree.find_section("risk assessment")
+    assert assessment is not None and assessment.level == 2
+    assert assessment.list_items == 3
+    assert [child.title for child in assessment.children] == ["Mitigations"]
+    assert assessment.children[0].numbered_items == 2
+    print("✓ Case-insensitive lookup, nesting and list counts")
+
+    table = tree.find_section("Register Table")
+    assert table.table_rows == 3 and tree.table_rows == 3
+    assert table.placeholder_count == 1
+    assert tree.find_section("Demo Project").placeholder_count == 1
+    assert tree.placeholder_count == 2
+    start, end = table.body_span
+    assert SAMPLE[start:end].startswith("| ID |")
+    print("✓ Table rows, placeholder spans and body span attributed to sections")
+
+
+def test_section_content_edge_cases():
+    """Test the empty-section rules the validator has always applied."""
+    print("\n" + "="*70)
+    print("TEST: Section Content Edge Cases")
+    print("="*70)
+
+    tree = parse_markdown(SAMPLE)
+
+    assert tree.section_has_content("Risk Assessment")
+    assert not tree.section_has_content("Empty Section")
+    assert not tree.section_has_content("Parent Only"), "Body stops at the first subsection"
+    assert not tree.section_has_content("Missing")
+    print("✓ Empty, subsection-only and missing sections have no content")
+
+    tree = parse_markdown("##Purpose\ntext\n##\tScope\ntext\n#### Scope  \ntext")
+    assert tree.find_section("Purpose") is None, "##Title without a space is not a section"
+    assert tree.section_has_content("Scope"), "Trailing whitespace is ignored"
+    assert tree.find_section("Scope").level == 4
+    print("✓ Heading forms handled like the original regex")
+
+    tree = parse_markdown("# Title\n## Project\n-\n\n  word\n")
+    assert tree.list_items == 1, "Marker and text may be separated by blank lines"
+    assert tree.has_title and tree.has_subtitle
+    print("✓ List item spanning blank lines counted once")
+
+
+def test_parity_with_regex_checks():
+    """Test tree counts match the regexes the validator used before."""
+    print("\n" + "="*70)
+    print("TEST: Parity With Regex Checks")
+    print("="*70)
+
+    documents = [SAMPLE, "", "#", "##\nword", "- \n- x\n*\ty", "1.\n2. x", "|a|\n|a|b|",
+                 "   \n# x\n\n", "## A\n\n## B\ntext\n"]
+    for repo_artifact in sorted(Path(__file__).parent.glob("QMS-*.md")):
+        documents.append(repo_artifact.read_text())
+
+    for content in documents:
+        tree = parse_markdown(content)
+        assert tree.section_count == len(re.findall(r'^##+ ', content, re.MULTILINE))
+        assert tree.list_items == len(re.findall(r'^[\s]*[-*]\s+\w', content, re.MULTILINE))
+        assert tree.numbered_items == len(re.findall(r'^[\s]*\d+\.\s+\w', content, re.MULTILINE))
+        assert tree.table_rows == len(re.findall(r'^\|.*?\|.*?\|', content, re.MULTILINE))
+        assert tree.has_table == bool(re.search(r'^\|.*?\|', content, re.MULTILINE))
+        assert tree.has_title == bool(re.match(r'^#\s+\w', content))
+        assert tree.has_subtitle == bool(re.search(r'^##\s+\w', content, re.MULTILINE))
+        assert tree.content_length == len(re.sub(r'^#+ .*$', '', content, flags=re.MULTILINE).strip())
+
+    print(f"✓ {len(documents)} documents match the regex checks")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_sections_and_body_counts,
+        test_section_content_edge_cases,
+        test_parity_with_regex_checks
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
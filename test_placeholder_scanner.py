@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the linear-time placeholder scanner.
+Tests parity with the placeholder regex it replaces and bounded cost on pathological input.
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.placeholder_scanner import REFERENCE_PLACEHOLDER_PATTERN, PlaceholderScanner
+from artifacts.validator import ArtifactValidator
+
+
+def regex_spans(regex, text):
+    """Spans found by the original placeholder regex."""
+    return [match.span() for match in regex.finditer(text)]
+
+
+def test_known_placeholders():
+    """Test spans for the placeholder forms the validator documents."""
+    print("\n" + "="*70)
+    print("TEST: Known Placeholders")
+    print("="*70)
+
+    scanner = PlaceholderScanner()
+    text = "Owner: [Name]\nDue: tbd\n{value} and [x\n] To Be Determined <PLACEHOLDER> TODOs"
+    found = [text[start:end] for start, end in scanner.spans(text)]
+
+    assert found == ["[Name]", "tbd", "{value}", "To Be Determined", "<PLACEHOLDER>", "TODO"], found
+    assert scanner.count("[[a]] {}") == 2, "Match runs to the first closing bracket"
+    assert scanner.count("no placeholders here") == 0
+    print(f"✓ Found: {found}")
+
+
+def test_parity_with_regex():
+    """Test the scanner returns exactly the spans of the placeholder regex it replaced."""
+    print("\n" + "="*70)
+    print("TEST: Parity With Placeholder Regex")
+    print("="*70)
+
+    validator = ArtifactValidator()
+    scanner = validator.placeholder_scanner
+    regex = re.compile(REFERENCE_PLACEHOLDER_PATTERN, re.IGNORECASE)
+
+    documents = [path.read_text() for path in sorted(Path(__file__).parent.glob("QMS-*.md"))]
+
+    alphabet = ["[", "]", "{", "}", "\n", "\r", " ", "a", "t", "T", "B", "d", "o", "O", "x", "X",
+                "[Name]", "to be determined", "<placeholder>", "FixMe", "İ", "ſ", "K"]
+    rng = random.Random(8)
+    for _ in range(3000):
+        documents.append("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))))
+
+    for text in documents:
+        assert scanner.spans(text) == regex_spans(regex, text), repr(text)
+
+    print(f"✓ {len(documents)} documents match the regex")
+
+
+def test_pathological_input_is_linear():
+    """Test unmatched brackets no longer cost quadratic time."""
+    print("\n" + "="*70)
+    print("TEST: Pathological Input")
+    print("="*70)
+
+    scanner = PlaceholderScanner()
+    content = "[{" * 100_000  # 200 KB line of unmatched brackets (minutes for the regex)
+
+    start = time.perf_counter()
+    assert scanner.count(content) == 0
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.0, f"Scanning took {elapsed:.2f}s"
+    print(f"✓ {len(content):,} unmatched brackets scanned in {elapsed * 1000:.0f}ms")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_known_placeholders,
+        test_parity_with_regex,
+        test_pathological_input_is_linear
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
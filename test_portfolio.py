@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the portfolio readiness matrix.
+Tests vectorized readiness against DependencyManager.is_ready, incremental refresh and per-risk-level aggregates.
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.dependency_manager import DependencyManager
+from artifacts.snapshot import artifact_filename
+from storage.portfolio import (
+    RISK_LEVELS,
+    PortfolioMatrix,
+    PortfolioReadiness,
+    ReadinessThresholds,
+    evaluate_readiness,
+    summarize
+)
+from validation.classifier import get_required_artifacts
+
+
+DOCUMENTS = sorted(Path(__file__).parent.glob("QMS-*.md"))
+
+
+def build_projects(root: Path, dep_manager: DependencyManager, count: int = 8):
+    """Projects at every risk level with a random mix of real, stub and missing artifacts."""
+    rng = random.Random(15)
+    projects = {}
+    for number in range(count):
+        project_id = f"project-{number}"
+        projects[project_id] = RISK_LEVELS[number % len(RISK_LEVELS)]
+        (root / project_id).mkdir()
+        for name in dep_manager.graph.nodes:
+            roll = rng.random()
+            if roll < 0.5:
+                content = rng.choice(DOCUMENTS).read_text()
+            elif roll < 0.8:
+                content = f"# {name}\n\n[TBD]\n"
+            else:
+                continue
+            (root / project_id / artifact_filename(name)).write_text(content)
+    return projects
+
+
+def thresholds_for(dep_manager: DependencyManager, matrix: PortfolioMatrix) -> ReadinessThresholds:
+    """Thresholds over the matrix columns with the classifier's required artifacts."""
+    return ReadinessThresholds(
+        dep_manager,
+        matrix.artifact_names,
+        {risk_level: get_required_artifacts(risk_level) for risk_level in RISK_LEVELS}
+    )
+
+
+def test_vectorized_readiness_matches_is_ready():
+    """Test the matrix evaluation agrees with is_ready for every (project, artifact) pair."""
+    print("\n" + "="*70)
+    print("TEST: Vectorized Readiness")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        projects = build_projects(root, dep_manager)
+        portfolio = PortfolioReadiness(root)
+        matrix = portfolio.refresh(dep_manager.validator, projects, dep_manager.graph.nodes)
+        assert matrix.shape == (len(projects), len(dep_manager.graph.nodes))
+
+        ready = evaluate_readiness(matrix, thresholds_for(dep_manager, matrix))
+        for row, project_id in enumerate(matrix.project_ids):
+            risk_level = projects[project_id]
+            snapshot = dep_manager.snapshot(root / project_id, risk_level)
+            for column, name in enumerate(matrix.artifact_names):
+                result = snapshot.validation(name)
+                expected = result is not None and dep_manager.is_ready(result, risk_level, name)
+                assert bool(ready[row, column]) == expected, (project_id, name)
+
+        print(f"✓ {ready.size} (project, artifact) pairs match is_ready ({int(ready.sum())} ready)")
+
+
+def test_incremental_refresh():
+    """Test a refresh re-validates only changed projects and the saved matrix round-trips."""
+    print("\n" + "="*70)
+    print("TEST: Incremental Refresh")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "artifacts"
+        root.mkdir()
+        projects = build_projects(root, dep_manager)
+        matrix_path = Path(tmp) / "portfolio-readiness.npz"
+
+        portfolio = PortfolioReadiness(root, matrix_path)
+        first = portfolio.refresh(dep_manager.validator, projects, dep_manager.graph.nodes)
+
+        (root / "project-2" / artifact_filename("CTQ Tree")).write_text("# CTQ Tree\n\nChanged\n")
+        second = portfolio.refresh(dep_manager.validator, projects, dep_manager.graph.nodes)
+        stats = portfolio.stats()
+        assert stats["rows_reused"] == len(projects) - 1 and stats["rows_validated"] == len(projects) + 1, stats
+        column = second.artifact_names.index("CTQ Tree")
+        assert second.completion[2, column] != first.completion[2, column] or second.size[2, column] != first.size[2, column]
+        print(f"✓ One changed project re-validated, {stats['rows_reused']} reused")
+
+        reloaded = PortfolioReadiness(root, matrix_path).matrix
+        assert reloaded.project_ids == second.project_ids and reloaded.artifact_names == second.artifact_names
+        assert (reloaded.completion == second.completion).all() and (reloaded.present == second.present).all()
+        assert reloaded.rules_version == second.rules_version == dep_manager.validator.rules_version
+        print(f"✓ Matrix saved and reloaded from {matrix_path.name}")
+
+        rules_version = dep_manager.validator.rules_version
+        dep_manager.validator.rules_version = "changed-rules"
+        try:
+            assert portfolio.current(dep_manager.validator, projects, dep_manager.graph.nodes) is not second
+            stats = portfolio.stats()
+            assert stats["rows_reused"] == len(projects) - 1 and stats["rows_validated"] == 2 * len(projects) + 1, stats
+            assert portfolio.matrix.rules_version == "changed-rules"
+        finally:
+            dep_manager.validator.rules_version = rules_version
+        print("✓ Changed rules version re-validates every project")
+
+
+def test_risk_level_aggregates():
+    """Test per-risk-level aggregates add up to the project-level readiness."""
+    print("\n" + "="*70)
+    print("TEST: Risk Level Aggregates")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        projects = build_projects(root, dep_manager)
+        matrix = PortfolioReadiness(root).refresh(dep_manager.validator, projects, dep_manager.graph.nodes)
+        thresholds = thresholds_for(dep_manager, matrix)
+        ready = evaluate_readiness(matrix, thresholds)
+
+        levels = {level.risk_level: level for level in summarize(matrix, thresholds)}
+        assert sum(level.projects for level in levels.values()) == len(projects)
+
+        for risk_level, level in levels.items():
+            rows = [row for row, project_id in enumerate(matrix.project_ids) if projects[project_id] == risk_level]
+            required = [matrix.artifact_names.index(name) for name in get_required_artifacts(risk_level)]
+            assert level.required_artifacts == len(rows) * len(required)
+            assert level.artifacts_ready == sum(int(ready[row, column]) for row in rows for column in required)
+            assert level.projects_ready == sum(all(ready[row, column] for column in required) for row in rows)
+            assert set(level.artifact_ready_rate) == set(get_required_artifacts(risk_level))
+            print(f"✓ {risk_level}: {level.artifacts_ready}/{level.required_artifacts} artifacts ready, "
+                  f"mean completion {level.mean_completion:.0%}")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_vectorized_readiness_matches_is_ready,
+        test_incremental_refresh,
+        test_risk_level_aggregates
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the template render cache.
+Tests cached output against direct rendering across answer combinations, name/date substitution, and keying.
+"""
+
+import itertools
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.generator import _template_functions, render_artifact, template_version
+from artifacts.render_cache import RenderCache
+from models.intake import IntakeAnswers, IntakeRequest, IntakeResponse
+from validation.classifier import classify_risk, get_required_artifacts
+
+
+def answer_combinations():
+    """Every combination of the seven intake answers."""
+    fields = IntakeAnswers.model_fields
+    choices = [field.annotation.__args__ for field in fields.values()]
+    for values in itertools.product(*choices):
+        yield IntakeAnswers(**dict(zip(fields, values)))
+
+
+def build_intake(answers: IntakeAnswers, project_name: str):
+    """Intake request and classified response for these answers."""
+    classification, warnings = classify_risk(answers)
+    timestamp = datetime.utcnow()
+    request = IntakeRequest(project_name=project_name, timestamp=timestamp, answers=answers)
+    response = IntakeResponse(
+        intake_id="test-render-cache",
+        project_name=project_name,
+        timestamp=timestamp,
+        answers=answers,
+        classification=classification,
+        warnings=warnings,
+        artifacts_required=get_required_artifacts(classification.risk_level)
+    )
+    return request, response
+
+
+def test_cached_output_matches_templates():
+    """Test cached rendering is identical to the templates for every answer combination."""
+    print("\n" + "="*70)
+    print("TEST: Cached Output Matches Templates")
+    print("="*70)
+
+    cache = RenderCache(max_entries=100000)
+    templates = _template_functions()
+    combinations = list(answer_combinations())
+    assert len(combinations) == 3888
+
+    renders = 0
+    for prefix in ("First", "Second"):
+        for number, answers in enumerate(combinations):
+            request, response = build_intake(answers, f"{prefix} Project {number}")
+            for artifact_name in response.artifacts_required:
+                generator_func = templates[artifact_name]
+                expected = generator_func(request, response)
+                cached = cache.render(artifact_name, template_version(artifact_name), generator_func, request, response)
+                assert cached == expected, (artifact_name, answers)
+                renders += 1
+
+    stats = cache.stats()
+    assert stats["misses"] == stats["hits"] == stats["entries"] == renders // 2
+    print(f"✓ {renders} renders identical; {stats['misses']} templates rendered, {stats['hits']} substituted")
+
+
+def test_project_name_and_date_substitution():
+    """Test only the project name and date differ between projects with the same answers."""
+    print("\n" + "="*70)
+    print("TEST: Project Name and Date Substitution")
+    print("="*70)
+
+    cache = RenderCache()
+    templates = _template_functions()
+    answers = next(answer_combinations())
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    names = ["Alpha", "Braces {0} {} }{", "Percent %s and \\ backslash", f"Release {today}", "ünïcödé ✓"]
+    for name in names:
+        request, response = build_intake(answers, name)
+        for artifact_name in response.artifacts_required:
+            generator_func = templates[artifact_name]
+            cached = cache.render(artifact_name, template_version(artifact_name), generator_func, request, response)
+            assert cached == generator_func(request, response), (artifact_name, name)
+            assert name in cached and today in cached
+
+    artifacts = len(build_intake(answers, "Alpha")[1].artifacts_required)
+    assert cache.stats()["misses"] == artifacts
+    assert cache.stats()["hits"] == artifacts * (len(names) - 1)
+    print(f"✓ {len(names)} project names rendered from {artifacts} cached templates")
+
+    request, response = build_intake(answers, "Alpha")
+    response.classification.rationale = f"Reviewed on {today}"
+    generator_func = templates["Quality Plan"]
+    cached = cache.render("Quality Plan", template_version("Quality Plan"), generator_func, request, response)
+    assert cached == generator_func(request, response)
+    assert cache.stats()["bypassed"] == 1
+    print("✓ Rationale containing today's date rendered directly")
+
+
+def test_cache_keys_and_eviction():
+    """Test template version, classification and capacity all affect what is reused."""
+    print("\n" + "="*70)
+    print("TEST: Cache Keys and Eviction")
+    print("="*70)
+
+    cache = RenderCache(max_entries=2)
+    generator_func = _template_functions()["Quality Plan"]
+    request, response = build_intake(next(answer_combinations()), "Keyed Project")
+
+    cache.render("Quality Plan", "v1", generator_func, request, response)
+    cache.render("Quality Plan", "v1", generator_func, request, response)
+    cache.render("Quality Plan", "v2", generator_func, request, response)
+    assert (cache.hits, cache.misses) == (1, 2)
+    print("✓ New template version renders again")
+
+    response.classification.rationale = "Overridden by expert review"
+    assert "Overridden by expert review" in cache.render("Quality Plan", "v2", generator_func, request, response)
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 3, 1)
+    print("✓ Changed classification renders again; least recently used entry evicted")
+
+    assert render_artifact("Quality Plan", request, response) == render_artifact(
+        "Quality Plan", request, response, cached=False
+    )
+    print("✓ render_artifact() cached and uncached output identical")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_cached_output_matches_templates,
+        test_project_name_and_date_substitution,
+        test_cache_keys_and_eviction
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the structured Risk Register parser.
+Tests record forms, merging, per-risk missing fields, and reuse by validation and cross-references.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.dependency_manager import DependencyManager
+from artifacts.risk_records import parse_risk_register
+from artifacts.validator import ArtifactValidator
+
+
+MIXED_REGISTER = """# Risk Register
+## Demo Project
+
+## Risks
+
+### R-001: Outage
+**Description:** Primary region unavailable
+**Likelihood:** Medium
+**Impact (business):** High
+**Mitigation:**
+1. Multi-region failover
+2. Quarterly failover drills
+
+**Owner:** Platform team
+
+### Risk R-002 - Data loss
+**Description:** Backups not restorable
+**Risk Score:** 12 (Medium)
+
+## Watch List
+- R-003: Vendor lock-in
+  - Owner: CTO
+  - Likelihood: Low
+Unrelated paragraph with Owner: nobody
+
+## Summary
+
+| ID | Risk | Owner | Status |
+|----|------|-------|--------|
+| R-002 | Data loss | DBA team | Open |
+| R-004 | Key person dependency | | Open |
+"""
+
+
+def test_record_forms():
+    """Test heading, list item and table forms become one record per risk."""
+    print("\n" + "="*70)
+    print("TEST: Record Forms")
+    print("="*70)
+
+    records = {record.risk_id: record for record in parse_risk_register(MIXED_REGISTER)}
+    assert list(records) == ["R-001", "R-002", "R-003", "R-004"]
+
+    outage = records["R-001"]
+    assert outage.title == "Outage" and outage.line == 6
+    assert outage.impact == "High", "Parenthetical in a label is ignored"
+    assert outage.mitigation == "1. Multi-region failover\n2. Quarterly failover drills"
+    assert outage.owner == "Platform team"
+    print("✓ Heading record with multi-line mitigation")
+
+    data_loss = records["R-002"]
+    assert data_loss.title == "Data loss" and data_loss.score_value == 12.0
+    assert data_loss.owner == "DBA team" and data_loss.status == "Open", "Summary table fills empty fields"
+    print("✓ Later mentions merged into the first record")
+
+    lock_in = records["R-003"]
+    assert lock_in.owner == "CTO" and lock_in.likelihood == "Low", "List item body stops at unindented text"
+    assert records["R-004"].owner is None and records["R-004"].title == "Key person dependency"
+    print(f"✓ {len(records)} records from heading, list and table forms")
+
+
+def test_missing_fields_per_risk():
+    """Test validation reports which risk is missing which field."""
+    print("\n" + "="*70)
+    print("TEST: Missing Fields Per Risk")
+    print("="*70)
+
+    records = {record.risk_id: record for record in parse_risk_register(MIXED_REGISTER)}
+    required = ["id", "description", "likelihood", "impact", "mitigation", "owner"]
+    assert records["R-001"].missing_fields(required) == []
+    assert records["R-002"].missing_fields(required) == ["likelihood", "impact", "mitigation"]
+
+    validator = ArtifactValidator()
+    result = validator.validate_artifact("Risk Register", MIXED_REGISTER, "R2")
+    field_issues = [issue for issue in result.issues if issue.section == "Risk Fields"]
+    assert len(field_issues) == 1 and field_issues[0].severity == "warning"
+    message = field_issues[0].message
+    assert message.startswith("3 risk(s) missing fields:"), message
+    assert "R-002 (likelihood, impact, mitigation)" in message and "R-001" not in message
+    assert not any(issue.section == "Risks" for issue in result.issues), "4 risks meet the R2 minimum of 3"
+    print(f"✓ {message}")
+
+
+def test_cross_references_use_records():
+    """Test cross-references check against defined risks, not every ID mentioned."""
+    print("\n" + "="*70)
+    print("TEST: Cross-References Use Records")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifacts_dir = Path(tmp)
+        (artifacts_dir / "QMS-Risk-Register.md").write_text(
+            "# Risk Register\n### R-001: Outage\n**Owner:** Ops\nDepends on assumption A-001 and R-009\n"
+        )
+        (artifacts_dir / "QMS-Verification-Plan.md").write_text(
+            "# Verification Plan\n- Test TST-001 covers R-001\n- Test covers R-009\n"
+        )
+
+        issues = dep_manager.check_cross_references(artifacts_dir, "R2")
+        assert issues == {"Verification Plan": ["References R-009 not found in Risk Register"]}, issues
+        print(f"✓ Mentioned-only risk reported, non-risk IDs ignored: {issues}")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_record_forms,
+        test_missing_fields_per_risk,
+        test_cross_references_use_records
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the content-hash validation result cache.
+Tests hit/miss accounting, key components, LRU eviction, and the on-disk tier.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src/backend to path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "backend"))
+
+from artifacts.validator import ArtifactValidator
+from storage.validation_cache import ValidationCache
+
+
+RISK_REGISTER = (Path(__file__).parent / "QMS-Risk-Register.md").read_text()
+QUALITY_PLAN = (Path(__file__).parent / "QMS-Quality-Plan.md").read_text()
+
+
+class CountingValidator(ArtifactValidator):
+    """Validator that records how many times validation actually ran."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def validate_artifact(self, artifact_name, content, risk_level):
+        self.calls += 1
+        return super().validate_artifact(artifact_name, content, risk_level)
+
+
+def test_unchanged_content_validated_once():
+    """Test that identical content is only validated once."""
+    print("\n" + "="*70)
+    print("TEST: Unchanged Content Validated Once")
+    print("="*70)
+
+    validator = CountingValidator()
+    cache = ValidationCache()
+
+    first = cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+    second = cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+
+    assert validator.calls == 1, "Second lookup should not re-validate"
+    assert second is first
+    expected = validator.validate_artifact("Risk Register", RISK_REGISTER, "R2")
+    assert first.model_dump() == expected.model_dump(), "Cached result must match a fresh validation"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["bytes_saved"] == len(RISK_REGISTER.encode("utf-8"))
+    print(f"✓ Counters: {stats}")
+
+
+def test_key_components_miss():
+    """Test that content, artifact, risk level and criteria version are all part of the key."""
+    print("\n" + "="*70)
+    print("TEST: Key Components")
+    print("="*70)
+
+    validator = CountingValidator()
+    cache = ValidationCache()
+
+    cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+    cache.validate(validator, "Risk Register", RISK_REGISTER + "\nEdited.", "R2")
+    cache.validate(validator, "Risk Register", RISK_REGISTER, "R3")
+    cache.validate(validator, "Quality Plan", RISK_REGISTER, "R2")
+    assert validator.calls == 4, "Each variation should be a miss"
+
+    validator.config_version = "changed-criteria"
+    cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+    assert validator.calls == 5, "A new criteria version should miss"
+
+    validator.rules_version = "changed-code"
+    cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+    assert validator.calls == 6, "A new validator code version should miss"
+    print(f"✓ Every key component produces a distinct entry: {cache.stats()['entries']} entries")
+
+
+def test_lru_eviction():
+    """Test that the least recently used result is evicted at capacity."""
+    print("\n" + "="*70)
+    print("TEST: LRU Eviction")
+    print("="*70)
+
+    validator = CountingValidator()
+    cache = ValidationCache(max_entries=2)
+
+    cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+    cache.validate(validator, "Quality Plan", QUALITY_PLAN, "R2")
+    cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")  # Refresh Risk Register
+    cache.validate(validator, "Quality Plan", QUALITY_PLAN, "R3")    # Evicts Quality Plan R2
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    cache.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+    assert cache.stats()["hits"] == 2, "Risk Register should still be cached"
+    cache.validate(validator, "Quality Plan", QUALITY_PLAN, "R2")
+    assert cache.stats()["misses"] == 4, "Quality Plan R2 should have been evicted"
+    print(f"✓ Least recently used entry evicted: {cache.stats()}")
+
+
+def test_disk_tier_survives_restart():
+    """Test that results written to disk are reused by a new cache instance."""
+    print("\n" + "="*70)
+    print("TEST: Disk Tier Survives Restart")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        disk_dir = Path(tmp) / "validation-cache"
+        validator = CountingValidator()
+
+        first = ValidationCache(disk_dir=disk_dir).validate(validator, "Risk Register", RISK_REGISTER, "R2")
+        assert len(list(disk_dir.rglob("*.json"))) == 1
+        assert not list(disk_dir.rglob("*.tmp")), "No temp files should be left behind"
+
+        restarted = ValidationCache(disk_dir=disk_dir)
+        second = restarted.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+        assert validator.calls == 1, "Disk hit should not re-validate"
+        assert second.model_dump() == first.model_dump()
+        assert restarted.stats()["disk_hits"] == 1
+        print(f"✓ Disk hit after restart: {restarted.stats()}")
+
+        # Corrupt entry is ignored and replaced
+        for path in disk_dir.rglob("*.json"):
+            path.write_text("{not json")
+        third = ValidationCache(disk_dir=disk_dir).validate(validator, "Risk Register", RISK_REGISTER, "R2")
+        assert validator.calls == 2 and third.model_dump() == first.model_dump()
+        print("✓ Unreadable entry re-validated")
+
+        # Entries written by other validator code are not served
+        validator.rules_version = "older-validator-code"
+        upgraded = ValidationCache(disk_dir=disk_dir)
+        upgraded.validate(validator, "Risk Register", RISK_REGISTER, "R2")
+        assert validator.calls == 3, "A new validator code version should miss the disk tier"
+        assert upgraded.stats()["disk_hits"] == 0
+        assert len(list(disk_dir.rglob("*.json"))) == 2
+        print("✓ Changed validator code misses the disk tier")
+
+        # A failed write leaves no temp file behind
+        class UnserializableResult:
+            def model_dump_json(self):
+                raise ValueError("cannot serialize")
+
+        upgraded._write_disk(("sha", "Risk Register", "R2", "criteria", "code"), UnserializableResult())
+        assert not list(disk_dir.rglob("*.tmp")), "Failed write should remove its temp file"
+        print("✓ Failed disk write cleaned up")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    tests = [
+        test_unchanged_content_validated_once,
+        test_key_components_miss,
+        test_lru_eviction,
+        test_disk_tier_survives_restart
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ FAILED: {test.__name__}")
+            print(f"   {str(e)}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -4,10 +4,14 @@ Phase 8A WS-1.9.2: Comprehensive validation test coverage
 Tests all 11 artifacts across R0-R3 risk levels and all validation methods.
 """
 
+import json
 import sys
+import tempfile
+from pathlib import Path
 sys.path.insert(0, 'src/backend')
 
-from artifacts.validator import ArtifactValidator
+from artifacts.validator import ArtifactValidator, DEFAULT_CRITERIA_PATH
+from artifacts.rule_plan import UnknownRuleError
 
 
 # ============================================================================
@@ -516,6 +520,49 @@ def test_placeholder_detection_across_artifacts():
     return True
 
 
+def test_compiled_rule_plans():
+    """Test criteria compile into ordered rule plans and unknown keys are rejected."""
+    print("\nTesting compiled rule plans...")
+
+    validator = ArtifactValidator()
+
+    plan = validator.get_rule_plan("CTQ Tree", "R2")
+    rules = [step.rule for step in plan.steps]
+    if rules != ["placeholders", "required_sections", "min_items"]:
+        print(f"  ❌ FAIL: Unexpected CTQ Tree R2 plan: {rules}")
+        return False
+
+    if plan.describe()["steps"][2]["params"] != {"min": 3}:
+        print(f"  ❌ FAIL: min_items threshold not bound: {plan.describe()}")
+        return False
+
+    if validator.get_rule_plan("Control Plan", "R0") is not None:
+        print("  ❌ FAIL: Control Plan has no R0 criteria, expected no plan")
+        return False
+
+    print(f"  CTQ Tree R2 plan: {rules}")
+
+    # A misspelled rule key must fail at load time
+    criteria = json.loads(DEFAULT_CRITERIA_PATH.read_text())
+    criteria["artifacts"]["CTQ Tree"]["risk_levels"]["R2"]["rules"]["min_itmes"] = 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        criteria_path = Path(tmp) / "acceptance_criteria.json"
+        criteria_path.write_text(json.dumps(criteria))
+        try:
+            ArtifactValidator(criteria_path)
+            print("  ❌ FAIL: Unknown rule key was not rejected")
+            return False
+        except UnknownRuleError as e:
+            if not isinstance(e, ValueError) or "min_itmes" not in str(e):
+                print(f"  ❌ FAIL: Unexpected error: {e}")
+                return False
+            print(f"  Rejected: {e}")
+
+    print(f"  ✅ PASS: Rule plans compiled and validated at load time")
+    return True
+
+
 # ============================================================================
 # Main Test Suite
 # ============================================================================
@@ -555,6 +602,9 @@ if __name__ == "__main__":
 
         # Placeholder handling
         ("Placeholder Detection", test_placeholder_detection_across_artifacts),
+
+        # Criteria compilation
+        ("Compiled Rule Plans", test_compiled_rule_plans),
     ]
 
     results = []
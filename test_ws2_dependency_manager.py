@@ -5,7 +5,10 @@ Tests readiness assessment, dependency checking, and cross-reference validation.
 """
 
 import json
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
 
@@ -18,7 +21,11 @@ from artifacts.dependency_manager import (
     DependencyStatus,
     NextActionRecommendation
 )
+from artifacts.dependency_graph import DependencyCycleError, DependencyGraph
+from artifacts.readiness_engine import ReadinessEngine
 from artifacts.validator import ArtifactValidator, ValidationResult
+import artifacts.dependency_manager as dependency_manager_module
+import artifacts.validator as validator_module
 
 
 def create_test_artifact(content: str, risk_level: str = "R2"):
@@ -331,6 +338,292 @@ def test_no_prescriptive_language():
         print(f"✓ Reason uses descriptive language: '{readiness.reason}'")
 
 
+def test_snapshot_reads_and_validates_once():
+    """Test a shared snapshot reads and validates each artifact once per request."""
+    print("\n" + "="*70)
+    print("TEST: Snapshot Reads and Validates Each Artifact Once")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+    required = list(dep_manager.dependencies.keys())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifacts_dir = Path(tmp)
+        (artifacts_dir / "QMS-Risk-Register.md").write_text("# Risk Register\n## Risk Assessment\n- R-001: Outage\n")
+        (artifacts_dir / "QMS-Verification-Plan.md").write_text("# Verification Plan\n- Verifies R-001 and R-002\n")
+        (artifacts_dir / "QMS-Quality-Plan.md").write_text("# Quality Plan\n## Purpose\nTest purpose\n")
+
+        # Count WS-1 validations
+        calls = []
+        original = dep_manager.validator.validate_artifact
+        dep_manager.validator.validate_artifact = lambda name, *args: calls.append(name) or original(name, *args)
+
+        baseline_statuses = {
+            name: dep_manager.check_dependencies(name, artifacts_dir, "R2")
+            for name in required
+        }
+        baseline_calls = len(calls)
+        calls.clear()
+
+        snapshot = dep_manager.snapshot(artifacts_dir, "R2")
+        statuses = {
+            name: dep_manager.check_dependencies(name, artifacts_dir, "R2", snapshot)
+            for name in required
+        }
+        dep_manager.get_next_actions(artifacts_dir, "R2", required, snapshot=snapshot)
+        issues = dep_manager.check_cross_references(artifacts_dir, "R2", snapshot)
+
+        assert sorted(calls) == ["Quality Plan", "Risk Register", "Verification Plan"], calls
+        print(f"✓ {len(calls)} validations with snapshot (vs {baseline_calls} without)")
+
+        for name in required:
+            assert statuses[name] == baseline_statuses[name], f"{name} status differs with snapshot"
+        print("✓ Snapshot results match standalone calls")
+
+        assert issues == {"Verification Plan": ["References R-002 not found in Risk Register"]}
+        print(f"✓ Cross-references from snapshot: {issues}")
+
+        try:
+            dep_manager.check_dependencies("Risk Register", artifacts_dir, "R3", snapshot)
+            assert False, "Expected ValueError for risk level mismatch"
+        except ValueError:
+            print("✓ Snapshot for a different risk level rejected")
+
+
+def test_shared_manager_hot_reload():
+    """Test the shared manager is reused, and swapped when a config file changes."""
+    print("\n" + "="*70)
+    print("TEST: Shared Dependency Manager Hot Reload")
+    print("="*70)
+
+    config_names = {
+        "DEFAULT_DEPENDENCIES_PATH": "dependencies.json",
+        "DEFAULT_THRESHOLDS_PATH": "readiness_thresholds.json",
+        "DEFAULT_VOLATILITY_PATH": "artifact_volatility.json",
+    }
+    originals = {name: getattr(dependency_manager_module, name) for name in config_names}
+    original_criteria = validator_module.DEFAULT_CRITERIA_PATH
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        try:
+            # Point the singletons at copies of the shipped configuration
+            for name, filename in config_names.items():
+                shutil.copy(originals[name], tmp / filename)
+                setattr(dependency_manager_module, name, tmp / filename)
+            shutil.copy(original_criteria, tmp / "acceptance_criteria.json")
+            validator_module.DEFAULT_CRITERIA_PATH = tmp / "acceptance_criteria.json"
+            dependency_manager_module.DEFAULT_CRITERIA_PATH = tmp / "acceptance_criteria.json"
+            dependency_manager_module._manager = None
+            validator_module._validator = None
+
+            first = dependency_manager_module.get_dependency_manager()
+            assert dependency_manager_module.get_dependency_manager() is first
+            assert first.validator is validator_module.get_artifact_validator()
+            print(f"✓ Shared manager reused (config {first.config_version})")
+
+            readiness = first.assess_readiness("Quality Plan", "# Quality Plan\n", "R2")
+            assert readiness.config_version == first.config_version
+            assert first.validator.validate_artifact("Quality Plan", "", "R2").criteria_version == \
+                first.validator.config_version
+            print("✓ Results carry the config version stamp")
+
+            # Edit thresholds on disk
+            thresholds_path = tmp / "readiness_thresholds.json"
+            thresholds = json.loads(thresholds_path.read_text())
+            thresholds["risk_levels"]["R2"]["completion"] = 0.5
+            thresholds_path.write_text(json.dumps(thresholds))
+            stat = os.stat(thresholds_path)
+            os.utime(thresholds_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            second = dependency_manager_module.get_dependency_manager()
+            assert second is not first
+            assert second.config_version != first.config_version
+            assert second.thresholds["R2"]["completion"] == 0.5
+            assert first.thresholds["R2"]["completion"] != 0.5, "Old instance must not be mutated"
+            print(f"✓ Reloaded after edit ({first.config_version} -> {second.config_version})")
+
+            # A broken edit keeps the last good configuration in service
+            thresholds_path.write_text("{not json")
+            assert dependency_manager_module.get_dependency_manager() is second
+            print("✓ Invalid config keeps previous manager")
+        finally:
+            for name, path in originals.items():
+                setattr(dependency_manager_module, name, path)
+            validator_module.DEFAULT_CRITERIA_PATH = original_criteria
+            dependency_manager_module.DEFAULT_CRITERIA_PATH = original_criteria
+            dependency_manager_module._manager = None
+            validator_module._validator = None
+
+
+def test_compiled_dependency_graph():
+    """Test the dependency graph is compiled with reverse edges, order, closures and cycle checks."""
+    print("\n" + "="*70)
+    print("TEST: Compiled Dependency Graph")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+    graph = dep_manager.graph
+
+    assert graph.prerequisites["Control Plan"] == ("Risk Register", "Verification Plan")
+    assert graph.dependents["Risk Register"] == ("Verification Plan", "Control Plan", "Traceability Index", "CAPA Log")
+    order = graph.topological_order
+    for name, prerequisites in dep_manager.dependencies.items():
+        for prerequisite in prerequisites:
+            assert order.index(prerequisite) < order.index(name), f"{prerequisite} must precede {name}"
+    print(f"✓ Topological order: {', '.join(order)}")
+
+    assert graph.ancestors["Control Plan"] == {"Risk Register", "Verification Plan", "CTQ Tree"}
+    assert "Control Plan" in graph.descendants["CTQ Tree"]
+    print("✓ Transitive closures")
+
+    r0 = graph.subgraph(["Quality Plan", "CTQ Tree", "Assumptions Register", "Risk Register", "Traceability Index"])
+    assert r0.dependents["Risk Register"] == ("Traceability Index",), "Induced subgraph drops other artifacts"
+    assert graph.subgraph(list(r0.nodes)) is r0, "Subgraphs are compiled once"
+    print("✓ Induced subgraph per required-artifact list")
+
+    try:
+        DependencyGraph({"A": ["C"], "B": ["A"], "C": ["B"], "D": []})
+        assert False, "Expected DependencyCycleError"
+    except DependencyCycleError as e:
+        assert e.cycle == ["A", "C", "B", "A"], e.cycle
+        assert "A -> C -> B -> A" in str(e)
+        print(f"✓ Cycle reported: {e}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = json.loads(dependency_manager_module.DEFAULT_DEPENDENCIES_PATH.read_text())
+        config["dependencies"]["CTQ Tree"] = ["Traceability Index"]
+        cyclic_path = Path(tmp) / "dependencies.json"
+        cyclic_path.write_text(json.dumps(config))
+        try:
+            DependencyManager(dependencies_path=cyclic_path)
+            assert False, "Expected DependencyCycleError from DependencyManager"
+        except DependencyCycleError as e:
+            assert e.cycle[0] == e.cycle[-1] and "CTQ Tree" in e.cycle
+            print("✓ Cyclic dependencies.json rejected at load time")
+
+
+def test_critical_path():
+    """Test the critical path covers every not-ready artifact and follows the heaviest chain."""
+    print("\n" + "="*70)
+    print("TEST: Critical Path")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+    required = ["Quality Plan", "CTQ Tree", "Risk Register", "Verification Plan", "Control Plan"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifacts_dir = Path(tmp)
+        plan = dep_manager.get_critical_path(artifacts_dir, "R2", required)
+
+        assert not plan.overall_ready
+        assert [step.artifact_name for step in plan.steps] == required, "Nothing generated: every artifact, in dependency order"
+        assert all(step.completion == 0.0 and step.gap == step.target_completion for step in plan.steps)
+        assert plan.critical_path == ["CTQ Tree", "Risk Register", "Verification Plan", "Control Plan"]
+        assert plan.steps[-1].after == ["Risk Register", "Verification Plan"]
+        assert abs(plan.total_gap - sum(step.gap for step in plan.steps)) < 1e-9
+        print(f"✓ Empty project: {' -> '.join(plan.critical_path)} (gap {plan.critical_path_gap:.2f})")
+
+        def no_snapshot(*args):
+            raise AssertionError("Cache hit built a snapshot")
+
+        dep_manager.snapshot = no_snapshot
+        assert dep_manager.get_critical_path(artifacts_dir, "R2", required, cache={}) is plan, "Unchanged files hit the cache"
+        del dep_manager.snapshot
+
+        # A ready Risk Register leaves the plan; the chain reroutes around it
+        shutil.copy(Path(__file__).parent / "QMS-Risk-Register.md", artifacts_dir / "QMS-Risk-Register.md")
+        updated = dep_manager.get_critical_path(artifacts_dir, "R2", required)
+        assert updated is not plan, "Adding an artifact file invalidates the cache"
+        assert "Risk Register" not in [step.artifact_name for step in updated.steps]
+        assert updated.critical_path == ["CTQ Tree", "Verification Plan", "Control Plan"]
+        assert all(step.on_critical_path == (step.artifact_name in updated.critical_path) for step in updated.steps)
+        print(f"✓ After Risk Register is ready: {' -> '.join(updated.critical_path)}")
+
+
+def test_incremental_readiness():
+    """Test a changed artifact re-evaluates only itself and its dependents; unchanged polls are lookups."""
+    print("\n" + "="*70)
+    print("TEST: Incremental Readiness")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+    required = ["Quality Plan", "CTQ Tree", "Risk Register", "Verification Plan", "Control Plan"]
+    engine = ReadinessEngine(rescan_interval=3600)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifacts_dir = Path(tmp)
+        initial = engine.readiness(dep_manager, artifacts_dir, "R2", required)
+        assert initial.version == 1 and initial.reevaluated == required
+        assert engine.readiness(dep_manager, artifacts_dir, "R2", required) is initial, "Unchanged poll is a lookup"
+
+        # Within the rescan interval a file change is only seen once marked dirty
+        shutil.copy(Path(__file__).parent / "QMS-Risk-Register.md", artifacts_dir / "QMS-Risk-Register.md")
+        assert engine.readiness(dep_manager, artifacts_dir, "R2", required) is initial
+        engine.mark_dirty(artifacts_dir, "Risk Register")
+        updated = engine.readiness(dep_manager, artifacts_dir, "R2", required)
+        assert updated.version == 2
+        assert updated.reevaluated == ["Risk Register", "Verification Plan", "Control Plan"], updated.reevaluated
+        assert updated.statuses["Quality Plan"] is initial.statuses["Quality Plan"], "Unrelated status reused"
+        print(f"✓ Risk Register edit re-evaluated {updated.reevaluated}")
+
+        # Same result as recomputing every artifact from scratch
+        snapshot = dep_manager.snapshot(artifacts_dir, "R2")
+        for name in required:
+            assert updated.statuses[name] == dep_manager.check_dependencies(name, artifacts_dir, "R2", snapshot)
+        assert updated.cross_reference_issues == dep_manager.check_cross_references(artifacts_dir, "R2", snapshot)
+        print("✓ Incremental statuses match a full recompute")
+
+        # Without an interval, mtime/size detect the change; an identical rewrite changes nothing
+        engine.rescan_interval = 0
+        shutil.copy(Path(__file__).parent / "QMS-Risk-Register.md", artifacts_dir / "QMS-Risk-Register.md")
+        assert engine.readiness(dep_manager, artifacts_dir, "R2", required) is updated, "Same content hash"
+        (artifacts_dir / "QMS-Control-Plan.md").write_text("# Control Plan\n")
+        latest = engine.readiness(dep_manager, artifacts_dir, "R2", required)
+        assert latest.version == 3 and latest.reevaluated == ["Control Plan"]
+        assert engine.stats()["lookups"] == 2
+        print(f"✓ Detected file change re-evaluated {latest.reevaluated}")
+
+
+def test_id_index():
+    """Test the ID index locates definitions, references and orphaned references."""
+    print("\n" + "="*70)
+    print("TEST: Cross-Reference ID Index")
+    print("="*70)
+
+    dep_manager = DependencyManager()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifacts_dir = Path(tmp)
+        (artifacts_dir / "QMS-Risk-Register.md").write_text(
+            "# Risk Register\n## Risks\n### R-001: Outage\n**Owner:** Ops\n### R-002: Data loss\n"
+        )
+        (artifacts_dir / "QMS-CTQ-Tree.md").write_text("# CTQ Tree\n- CTQ-001: Latency\n")
+        (artifacts_dir / "QMS-Traceability-Index.md").write_text(
+            "# Traceability Index\n## Matrix\n| R-003 | CTQ-009 |\n| R-001 | CTQ-001 |\n## Notes\nR-003 again\n"
+        )
+
+        snapshot = dep_manager.snapshot(artifacts_dir, "R2")
+        index = snapshot.id_index(["Risk Register", "CTQ Tree", "Traceability Index"])
+
+        definition = index.definitions("r-001")
+        assert [(d.artifact_name, d.line, d.section) for d in definition] == [("Risk Register", 3, "R-001: Outage")]
+        references = index.references("R-003")
+        assert [(r.artifact_name, r.line, r.section) for r in references] == [
+            ("Traceability Index", 3, "Matrix"), ("Traceability Index", 6, "Notes")
+        ]
+        assert not index.is_defined("R-003") and index.is_defined("CTQ-001")
+        print(f"✓ R-003 referenced at lines {[r.line for r in references]}, never defined")
+
+        orphaned = dep_manager.orphaned_references(artifacts_dir, "R2", snapshot)
+        assert [(o.id, o.line) for o in orphaned["Traceability Index"]] == [("R-003", 3), ("CTQ-009", 3)]
+        assert dep_manager.check_cross_references(artifacts_dir, "R2", snapshot) == {"Traceability Index": [
+            "References R-003 not found in Risk Register",
+            "References CTQ-009 not found in CTQ Tree"
+        ]}
+        print(f"✓ Orphaned references located: {[(o.id, o.line) for o in orphaned['Traceability Index']]}")
+
+
 def run_all_tests():
     """Run all unit tests."""
     print("\n" + "="*70)
@@ -347,7 +640,13 @@ def run_all_tests():
         test_dependencies_are_directional,
         test_no_revalidation,
         test_override_budget_tracking,
-        test_no_prescriptive_language
+        test_no_prescriptive_language,
+        test_snapshot_reads_and_validates_once,
+        test_shared_manager_hot_reload,
+        test_compiled_dependency_graph,
+        test_critical_path,
+        test_incremental_readiness,
+        test_id_index
     ]
 
     passed = 0